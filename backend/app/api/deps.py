@@ -1,6 +1,7 @@
 from typing import Annotated
 from fastapi import Depends
 
+from ..services.batch_service import BatchService
 from ..services.langgraph_service import LangGraphService
 
 
@@ -9,5 +10,11 @@ def get_langgraph_service() -> LangGraphService:
     return LangGraphService
 
 
+def get_batch_service() -> BatchService:
+    """일괄 처리 서비스"""
+    return BatchService
+
+
 # 의존성 타입 어노테이션
 LangGraphDep = Annotated[LangGraphService, Depends(get_langgraph_service)]
+BatchDep = Annotated[BatchService, Depends(get_batch_service)]
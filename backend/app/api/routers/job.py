@@ -0,0 +1,103 @@
+import json
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+
+from ...config.settings import JOB_BATCH_MAX_ITEMS, JOB_QUEUE_ENABLED
+from ...schemas.job import (
+    FINISHED_JOB_STATUSES,
+    BatchJobRequest,
+    JobInfo,
+    JobResultResponse,
+    JobStatus,
+    ProcessJobRequest,
+)
+from ...services.job_service import JobService
+
+router = APIRouter()
+
+
+def _ensure_enabled() -> None:
+    if not JOB_QUEUE_ENABLED:
+        raise HTTPException(status_code=503, detail="작업 큐가 꺼져 있습니다.")
+
+
+async def _get_or_404(job_id: str) -> dict:
+    job = await JobService.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job
+
+
+@router.post("/process", response_model=JobInfo, status_code=202)
+async def submit_process_job(request: ProcessJobRequest):
+    """변수명 생성 작업 제출 (바로 job_id 반환)"""
+    _ensure_enabled()
+    if not request.input_text.strip():
+        raise HTTPException(status_code=400, detail="입력 텍스트가 비어있습니다.")
+    # use_enum_values는 기본값에는 적용되지 않으므로 JSON 모드로 직렬화해 enum을 값으로 저장
+    return await JobService.submit_process(
+        request.model_dump(mode="json", exclude={"priority"}), request.priority
+    )
+
+
+@router.post("/batch", response_model=JobInfo, status_code=202)
+async def submit_batch_job(request: BatchJobRequest):
+    """일괄 변수명 생성 작업 제출 (바로 job_id 반환)"""
+    _ensure_enabled()
+    if not request.inputs:
+        raise HTTPException(status_code=400, detail="입력 목록이 비어있습니다.")
+    if len(request.inputs) > JOB_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {JOB_BATCH_MAX_ITEMS}개까지 처리할 수 있습니다.",
+        )
+    return await JobService.submit_batch(
+        request.inputs, request.case_style, request.include_all_styles, request.priority
+    )
+
+
+@router.get("/{job_id}", response_model=JobInfo)
+async def get_job(job_id: str):
+    """작업 상태와 진행 상황 조회"""
+    return await _get_or_404(job_id)
+
+
+@router.get("/{job_id}/result", response_model=JobResultResponse)
+async def get_job_result(job_id: str):
+    """완료된 작업의 결과 조회 (아직 끝나지 않았으면 409)"""
+    job = await JobService.get_result(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    if job["status"] not in FINISHED_JOB_STATUSES:
+        raise HTTPException(
+            status_code=409, detail=f"작업이 아직 끝나지 않았습니다 ({job['status']})."
+        )
+    return JobResultResponse(
+        success=job["status"] == JobStatus.SUCCEEDED.value,
+        job_id=job_id,
+        status=job["status"],
+        result=job["result"] or {},
+        error=job["error"],
+    )
+
+
+@router.get("/{job_id}/events")
+async def stream_job_events(job_id: str):
+    """작업 진행 이벤트 스트리밍 (NDJSON, 마지막은 result 이벤트)"""
+    await _get_or_404(job_id)
+
+    async def event_stream():
+        async for event in JobService.stream_events(job_id):
+            yield json.dumps(event, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
+
+@router.post("/{job_id}/cancel", response_model=JobInfo)
+async def cancel_job(job_id: str):
+    """작업 취소 (대기 작업은 바로 취소, 실행 중인 작업은 곧 중단)"""
+    job = await JobService.cancel_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job
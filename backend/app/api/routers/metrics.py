@@ -0,0 +1,25 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from ...services.langgraph_service import request_coalescer
+from ...utils.concurrency import LLMConcurrencyLimiter
+from ...utils.tracing import metrics
+
+router = APIRouter()
+
+metrics.register_gauge(
+    "llm_in_flight", "진행 중인 LLM 호출 수", LLMConcurrencyLimiter.in_flight
+)
+metrics.register_counter(
+    "coalesced_requests_total",
+    "다른 요청의 실행 결과를 공유한 요청 수",
+    lambda: request_coalescer.stats()["coalesced"],
+)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Prometheus 텍스트 형식 지표"""
+    return PlainTextResponse(
+        metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
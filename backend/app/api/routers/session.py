@@ -0,0 +1,78 @@
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+
+from ...config.settings import HISTORY_PAGE_SIZE, SESSION_PAGE_SIZE
+from ...schemas.session import (
+    ChatSessionInfo,
+    SessionCreateRequest,
+    SessionListResponse,
+    SessionUpdateRequest,
+)
+from ...services.history_service import HistoryService
+from ...services.session_service import SessionService
+
+router = APIRouter()
+
+
+def _get_or_404(session_id: str) -> dict:
+    session = SessionService.get_session(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
+    return session
+
+
+@router.post("", response_model=ChatSessionInfo)
+async def create_session(request: SessionCreateRequest):
+    """채팅 세션 생성"""
+    return SessionService.create_session(request.owner_id, request.title)
+
+
+@router.get("", response_model=SessionListResponse)
+async def list_sessions(
+    owner_id: str = Query(..., min_length=1, max_length=128),
+    limit: int = Query(SESSION_PAGE_SIZE, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+):
+    """사용자의 채팅 세션 목록 조회 (최근 사용한 세션부터)"""
+    return {"success": True, **SessionService.list_sessions(owner_id, limit, offset)}
+
+
+@router.get("/{session_id}", response_model=ChatSessionInfo)
+async def get_session(session_id: str):
+    """채팅 세션 조회"""
+    return _get_or_404(session_id)
+
+
+@router.patch("/{session_id}", response_model=ChatSessionInfo)
+async def update_session(session_id: str, request: SessionUpdateRequest):
+    """채팅 세션 제목 변경"""
+    session = SessionService.rename_session(session_id, request.title)
+    if session is None:
+        raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
+    return session
+
+
+@router.delete("/{session_id}")
+async def delete_session(session_id: str):
+    """채팅 세션과 대화 히스토리 삭제"""
+    session = SessionService.delete_session(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
+    HistoryService.delete_history(session["thread_id"])
+    return {"success": True, "session_id": session_id}
+
+
+@router.get("/{session_id}/messages")
+async def get_session_messages(
+    session_id: str,
+    limit: int = Query(HISTORY_PAGE_SIZE, ge=1, le=200),
+    before: Optional[int] = Query(None, ge=1),
+):
+    """세션 메시지 조회 (최신 메시지부터, before로 이전 페이지 조회)"""
+    session = _get_or_404(session_id)
+    return {
+        "success": True,
+        "session_id": session_id,
+        "history": HistoryService.get_history(session["thread_id"], limit, before),
+    }
@@ -1,7 +1,34 @@
-from fastapi import APIRouter, HTTPException
+import asyncio
+import io
+import itertools
+import json
+import tempfile
+from typing import Optional
 
-from ...schemas.variable import ProcessRequest, ProcessResponse
-from ...api.deps import LangGraphDep
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from ...config.settings import BATCH_MAX_ITEMS, HISTORY_PAGE_SIZE
+from ...schemas.variable import (
+    ProcessRequest,
+    ProcessResponse,
+    BatchRequest,
+    BatchResponse,
+)
+from ...api.deps import LangGraphDep, BatchDep
+from ...services.bulk_service import (
+    BulkFormat,
+    BulkService,
+    RowReader,
+    RowWriter,
+    read_rows,
+)
+from ...services.history_service import HistoryService
+from ...services.job_service import JobService
+from ...services.langgraph_service import GraphRegistry
+from ...services.session_service import SessionService
+from ...services.text_processing_service import text_similarity_index
+from ...utils.cache import TieredCache
 
 router = APIRouter()
 
@@ -24,7 +51,7 @@ async def process_variable(request: ProcessRequest, langgraph_service: LangGraph
             )
         else:
             raise HTTPException(
-                status_code=500,
+                status_code=result.get("status_code", 500),
                 detail=result.get("error", "처리 중 오류가 발생했습니다."),
             )
 
@@ -36,13 +63,137 @@ async def process_variable(request: ProcessRequest, langgraph_service: LangGraph
         )
 
 
+@router.post("/process/stream")
+async def process_variable_stream(request: ProcessRequest, langgraph_service: LangGraphDep):
+    """변수명 생성 스트리밍 엔드포인트 (NDJSON, 텍스트 분석 결과를 개념 단위로 전송)"""
+    if not request.input_text.strip():
+        raise HTTPException(status_code=400, detail="입력 텍스트가 비어있습니다.")
+
+    async def event_stream():
+        async for event in langgraph_service.stream_request(request.dict()):
+            yield json.dumps(event, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
+
+@router.post("/batch", response_model=BatchResponse)
+async def process_variable_batch(request: BatchRequest, batch_service: BatchDep):
+    """일괄 변수명 생성 엔드포인트 (항목별 부분 실패 허용)"""
+    if not request.inputs:
+        raise HTTPException(status_code=400, detail="입력 목록이 비어있습니다.")
+    if len(request.inputs) > BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {BATCH_MAX_ITEMS}개까지 처리할 수 있습니다.",
+        )
+
+    try:
+        results = await batch_service.process_batch(
+            request.inputs, request.case_style, request.include_all_styles
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"처리 중 오류가 발생했습니다: {str(e)}"
+        )
+
+    succeeded = sum(1 for item in results if item["success"])
+    failed = len(results) - succeeded
+    return BatchResponse(
+        success=failed == 0,
+        results=results,
+        total=len(results),
+        succeeded=succeeded,
+        failed=failed,
+        message=(
+            "일괄 변수명 생성이 완료되었습니다."
+            if failed == 0
+            else f"{failed}개 항목 처리에 실패했습니다."
+        ),
+    )
+
+
+@router.post("/bulk")
+async def process_variable_bulk(
+    request: Request,
+    input_format: BulkFormat = Query(BulkFormat.CSV, alias="format"),
+    output_format: BulkFormat = Query(BulkFormat.JSONL, alias="output"),
+    column: Optional[str] = Query(None),
+    start_row: int = Query(0, ge=0),
+):
+    """CSV/JSONL 요청 본문을 행 단위로 처리해 모든 케이스 스타일 결과를 스트리밍
+
+    본문은 임시 파일에 받아 둔 뒤 청크 단위로 읽어 처리하므로 파일 크기와 관계없이 메모리 사용량이 일정하다.
+    중단된 경우 마지막으로 받은 행 번호를 start_row로 넘겨 같은 파일을 다시 보내면 이어서 처리한다.
+    """
+    # 스트리밍 응답 중에는 요청 본문을 읽을 수 없으므로 응답 전에 디스크로 받아 둠
+    spool = tempfile.TemporaryFile()
+    async for chunk in request.stream():
+        spool.write(chunk)
+    spool.seek(0)
+    source = io.TextIOWrapper(spool, encoding="utf-8-sig", newline="")
+
+    # 헤더 오류는 응답을 시작하기 전에 400으로 알리기 위해 첫 행을 미리 읽음
+    rows = read_rows(source, RowReader(input_format, column))
+    end = object()
+    try:
+        first = next(rows, end)
+    except (ValueError, UnicodeDecodeError) as e:
+        source.close()
+        raise HTTPException(status_code=400, detail=f"입력 파일을 읽을 수 없습니다: {e}")
+    if first is not end:
+        rows = itertools.chain([first], rows)
+
+    writer = RowWriter(output_format)
+
+    async def result_stream():
+        try:
+            if start_row == 0:
+                yield writer.header()
+            async for records in BulkService.aprocess_rows(rows, skip_rows=start_row):
+                yield "".join(writer.format(record) for record in records)
+        finally:
+            source.close()
+
+    media_type = (
+        "text/csv" if output_format == BulkFormat.CSV else "application/x-ndjson"
+    )
+    return StreamingResponse(result_stream(), media_type=media_type)
+
+
 @router.get("/history/{thread_id}")
-async def get_conversation_history(thread_id: str, langgraph_service: LangGraphDep):
-    """대화 히스토리 조회"""
+async def get_conversation_history(
+    thread_id: str,
+    langgraph_service: LangGraphDep,
+    limit: int = Query(HISTORY_PAGE_SIZE, ge=1, le=200),
+    before: Optional[int] = Query(None, ge=1),
+):
+    """대화 히스토리 조회 (최신 메시지부터, before로 이전 페이지 조회)"""
     try:
-        history = langgraph_service.get_conversation_history(thread_id)
+        history = langgraph_service.get_conversation_history(thread_id, limit, before)
         return {"success": True, "thread_id": thread_id, "history": history}
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"히스토리 조회 중 오류가 발생했습니다: {str(e)}"
         )
+
+
+@router.delete("/history/{thread_id}")
+async def delete_conversation_history(thread_id: str):
+    """대화 히스토리 삭제"""
+    HistoryService.delete_history(thread_id)
+    return {"success": True, "thread_id": thread_id}
+
+
+@router.get("/stats")
+async def get_stats(langgraph_service: LangGraphDep):
+    """캐시 히트/미스, 유사 입력 재사용, 요청 합치기, 히스토리 저장소 통계 조회"""
+    return {
+        "success": True,
+        "caches": TieredCache.all_stats(),
+        "similarity": text_similarity_index.stats(),
+        "coalescing": langgraph_service.get_coalescing_stats(),
+        "history": HistoryService.get_stats(),
+        "sessions": SessionService.get_stats(),
+        "jobs": await asyncio.to_thread(JobService.get_stats),
+        "checkpointer": GraphRegistry.get_checkpointer_stats(),
+    }
@@ -0,0 +1,87 @@
+"""Variable Maker 명령줄 도구
+
+사용 예 (backend 디렉터리에서):
+    python -m app.cli bulk terms.csv names.jsonl --column 용어
+    python -m app.cli bulk terms.jsonl names.csv --no-resume
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import Any, Dict, List, Optional
+
+from .config.settings import BULK_CHUNK_SIZE
+from .services.bulk_service import BulkFormat, BulkService
+
+
+def add_bulk_arguments(parser: argparse.ArgumentParser) -> None:
+    """bulk 명령 인자 등록"""
+    formats = [fmt.value for fmt in BulkFormat]
+    parser.add_argument("input", help="입력 파일 경로 (.csv, .jsonl)")
+    parser.add_argument("output", help="출력 파일 경로 (.csv, .jsonl)")
+    parser.add_argument(
+        "--column",
+        default=None,
+        help="입력 텍스트 열 이름 (기본: CSV는 첫 번째 열, JSONL은 input_text)",
+    )
+    parser.add_argument("--input-format", choices=formats, default=None)
+    parser.add_argument("--output-format", choices=formats, default=None)
+    parser.add_argument("--chunk-size", type=int, default=BULK_CHUNK_SIZE)
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="체크포인트를 무시하고 처음부터 다시 처리",
+    )
+
+
+def run_bulk(args: argparse.Namespace) -> int:
+    """bulk 명령 실행 (종료 코드 반환)"""
+
+    def report(summary: Dict[str, Any]) -> None:
+        print(
+            f"{summary['rows']}행 처리 "
+            f"(성공 {summary['succeeded']}, 실패 {summary['failed']})",
+            file=sys.stderr,
+        )
+
+    try:
+        summary = asyncio.run(
+            BulkService.aprocess_file(
+                args.input,
+                args.output,
+                column=args.column,
+                input_format=args.input_format and BulkFormat(args.input_format),
+                output_format=args.output_format and BulkFormat(args.output_format),
+                resume=not args.no_resume,
+                chunk_size=args.chunk_size,
+                on_progress=report,
+            )
+        )
+    except (OSError, ValueError) as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 1
+
+    if summary["resumed_from"]:
+        print(f"{summary['resumed_from']}행 이후부터 이어서 처리했습니다.", file=sys.stderr)
+    print(
+        f"완료: {summary['rows']}행 (성공 {summary['succeeded']}, 실패 {summary['failed']}), "
+        f"{summary['elapsed_seconds']}초 → {args.output}"
+    )
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Variable Maker 명령줄 도구")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    bulk_parser = subparsers.add_parser(
+        "bulk", help="CSV/JSONL 용어 목록의 모든 케이스 스타일 변수명 생성"
+    )
+    add_bulk_arguments(bulk_parser)
+
+    args = parser.parse_args(argv)
+    return run_bulk(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 프로세스당 동시에 진행 가능한 LLM 호출 수
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "256"))
+
+# LLM 모델
+LLM_MODEL = os.getenv("LLM_MODEL", "gemini-2.0-flash")
+
+# 번역/약어 캐시
+CACHE_ENABLED = os.getenv("CACHE_ENABLED", "true").lower() == "true"
+CACHE_DB_PATH = os.getenv("CACHE_DB_PATH", ".cache/variable_maker.sqlite3")
+CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", str(30 * 24 * 60 * 60)))
+CACHE_MEMORY_MAX_ENTRIES = int(os.getenv("CACHE_MEMORY_MAX_ENTRIES", "10000"))
+CACHE_DISK_MAX_ENTRIES = int(os.getenv("CACHE_DISK_MAX_ENTRIES", "500000"))
+
+# 텍스트 분석 유사 입력 캐시 (요청 문구 제거 후 문자 n-gram 자카드 유사도가 임계값 이상이면 재사용)
+SIMILARITY_CACHE_ENABLED = os.getenv("SIMILARITY_CACHE_ENABLED", "true").lower() == "true"
+SIMILARITY_CACHE_THRESHOLD = float(os.getenv("SIMILARITY_CACHE_THRESHOLD", "0.9"))
+SIMILARITY_CACHE_NGRAM = int(os.getenv("SIMILARITY_CACHE_NGRAM", "2"))
+SIMILARITY_CACHE_MAX_ENTRIES = int(os.getenv("SIMILARITY_CACHE_MAX_ENTRIES", "5000"))
+
+# 배치 처리
+BATCH_MAX_ITEMS = int(os.getenv("BATCH_MAX_ITEMS", "5000"))
+BATCH_CHUNK_SIZE = int(os.getenv("BATCH_CHUNK_SIZE", "50"))
+BATCH_MAX_PARALLEL_CHUNKS = int(os.getenv("BATCH_MAX_PARALLEL_CHUNKS", "4"))
+
+# 파일 일괄 처리 (청크 단위로 처리/기록하고 CLI는 청크마다 진행 상황을 체크포인트로 저장)
+BULK_CHUNK_SIZE = int(os.getenv("BULK_CHUNK_SIZE", "200"))
+
+# 로컬 사전 (dictionary_only, dictionary_then_llm, llm_only)
+LOOKUP_MODE = os.getenv("LOOKUP_MODE", "dictionary_then_llm")
+DICTIONARY_PATH = os.getenv("DICTIONARY_PATH")
+
+# 한국어 단어 처리 방식 (sequential, combined, speculative)
+WORD_PIPELINE_MODE = os.getenv("WORD_PIPELINE_MODE", "combined")
+
+# 동일 입력 동시 요청 합치기
+REQUEST_COALESCING_ENABLED = (
+    os.getenv("REQUEST_COALESCING_ENABLED", "true").lower() == "true"
+)
+
+# LLM 호출 타임아웃/재시도/속도 제한
+LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "30"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
+LLM_BACKOFF_BASE_SECONDS = float(os.getenv("LLM_BACKOFF_BASE_SECONDS", "0.5"))
+LLM_BACKOFF_MAX_SECONDS = float(os.getenv("LLM_BACKOFF_MAX_SECONDS", "8"))
+LLM_RATE_LIMIT_RPM = int(os.getenv("LLM_RATE_LIMIT_RPM", "2000"))
+LLM_RATE_LIMIT_BURST = int(os.getenv("LLM_RATE_LIMIT_BURST", "50"))
+
+# LLM 공급자 (gemini, fake)
+LLM_PROVIDER = os.getenv("LLM_PROVIDER", "gemini")
+
+# 가짜 공급자 지연 시간 분포 (fixed, uniform, exponential, lognormal) 및 오류율
+FAKE_LLM_LATENCY_MS = float(os.getenv("FAKE_LLM_LATENCY_MS", "200"))
+FAKE_LLM_LATENCY_DISTRIBUTION = os.getenv("FAKE_LLM_LATENCY_DISTRIBUTION", "lognormal")
+FAKE_LLM_LATENCY_SIGMA = float(os.getenv("FAKE_LLM_LATENCY_SIGMA", "0.5"))
+FAKE_LLM_ERROR_RATE = float(os.getenv("FAKE_LLM_ERROR_RATE", "0"))
+FAKE_LLM_SEED = int(os.getenv("FAKE_LLM_SEED", "0"))
+
+# 요청 추적 (노드/LLM 호출 구간 시간, /metrics, Server-Timing 헤더)
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "true").lower() == "true"
+SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "false").lower() == "true"
+# 이 시간(ms)보다 오래 걸린 요청은 구간별 시간을 출력 (0이면 끔)
+TRACE_SLOW_REQUEST_MS = float(os.getenv("TRACE_SLOW_REQUEST_MS", "0"))
+
+# 대화 히스토리 저장소 (sqlite, memory)
+HISTORY_ENABLED = os.getenv("HISTORY_ENABLED", "true").lower() == "true"
+HISTORY_BACKEND = os.getenv("HISTORY_BACKEND", "sqlite")
+HISTORY_DB_PATH = os.getenv("HISTORY_DB_PATH", ".cache/history.sqlite3")
+HISTORY_MAX_MESSAGES_PER_THREAD = int(os.getenv("HISTORY_MAX_MESSAGES_PER_THREAD", "200"))
+HISTORY_TTL_SECONDS = int(os.getenv("HISTORY_TTL_SECONDS", str(7 * 24 * 60 * 60)))
+HISTORY_MEMORY_MAX_THREADS = int(os.getenv("HISTORY_MEMORY_MAX_THREADS", "10000"))
+HISTORY_PAGE_SIZE = int(os.getenv("HISTORY_PAGE_SIZE", "50"))
+
+# 채팅 세션 목록 설정 (세션 메시지는 히스토리 저장소에 thread_id로 저장됨)
+SESSION_BACKEND = os.getenv("SESSION_BACKEND", HISTORY_BACKEND)
+SESSION_DB_PATH = os.getenv("SESSION_DB_PATH", HISTORY_DB_PATH)
+SESSION_MAX_PER_OWNER = int(os.getenv("SESSION_MAX_PER_OWNER", "200"))
+SESSION_MEMORY_MAX_OWNERS = int(os.getenv("SESSION_MEMORY_MAX_OWNERS", "10000"))
+SESSION_PAGE_SIZE = int(os.getenv("SESSION_PAGE_SIZE", "20"))
+
+# 비동기 작업 큐 (SQLite에 저장, 서버 프로세스마다 작업자 풀 실행)
+JOB_QUEUE_ENABLED = os.getenv("JOB_QUEUE_ENABLED", "true").lower() == "true"
+JOB_DB_PATH = os.getenv("JOB_DB_PATH", ".cache/jobs.sqlite3")
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "4"))
+# 대화형(interactive) 작업만 처리하는 작업자 수 (대용량 작업이 모든 작업자를 차지하지 못하게 함)
+JOB_INTERACTIVE_WORKERS = int(os.getenv("JOB_INTERACTIVE_WORKERS", "1"))
+JOB_POLL_INTERVAL_SECONDS = float(os.getenv("JOB_POLL_INTERVAL_SECONDS", "1"))
+JOB_TTL_SECONDS = int(os.getenv("JOB_TTL_SECONDS", str(24 * 60 * 60)))
+JOB_BATCH_MAX_ITEMS = int(os.getenv("JOB_BATCH_MAX_ITEMS", "50000"))
+
+# 그래프 체크포인터가 메모리에 보관하는 최대 스레드 수
+CHECKPOINT_MAX_THREADS = int(os.getenv("CHECKPOINT_MAX_THREADS", "1000"))
+
+# 운영 서버 (python main.py serve)
+SERVER_HOST = os.getenv("SERVER_HOST", "0.0.0.0")
+SERVER_PORT = int(os.getenv("SERVER_PORT", "8000"))
+SERVER_WORKERS = int(os.getenv("SERVER_WORKERS", str(os.cpu_count() or 1)))
+# 종료 시 진행 중인 요청/LLM 호출을 기다리는 최대 시간 (초)
+SERVER_GRACEFUL_SHUTDOWN_SECONDS = float(os.getenv("SERVER_GRACEFUL_SHUTDOWN_SECONDS", "30"))
+
+# 준비 상태 확인 시 LLM 공급자 연결 확인 결과를 재사용하는 시간 (초)
+READINESS_CHECK_TTL_SECONDS = float(os.getenv("READINESS_CHECK_TTL_SECONDS", "10"))
+READINESS_CHECK_TIMEOUT_SECONDS = float(os.getenv("READINESS_CHECK_TIMEOUT_SECONDS", "3"))
+
+# 시작 시 그래프 컴파일/LLM 공급자 생성 방식 (background: 서버 시작 후 백그라운드, blocking: 시작 전에 완료, lazy: 첫 요청 시)
+STARTUP_WARMUP = os.getenv("STARTUP_WARMUP", "background")
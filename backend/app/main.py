@@ -1,13 +1,54 @@
-from fastapi import FastAPI
+import asyncio
+import json
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+
+from .api.routers import job, metrics, session, variable
+from .config.settings import (
+    JOB_QUEUE_ENABLED,
+    SERVER_GRACEFUL_SHUTDOWN_SECONDS,
+    SERVER_TIMING_ENABLED,
+    TRACE_SLOW_REQUEST_MS,
+    TRACING_ENABLED,
+)
+from .services.health_service import HealthService, WarmupMode
+from .services.job_service import JobWorkerPool
+from .utils.tracing import end_trace, record_http_request, start_trace
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """시작 시 그래프/LLM 공급자 워밍업과 작업자 풀 시작, 종료 시 작업자 풀 정지 후 진행 중인 LLM 호출 대기
+
+    기본(background)은 워밍업을 백그라운드 스레드에서 진행해 서버가 곧바로 /health에 응답하고,
+    워밍업이 끝날 때까지 /ready는 starting(503)을 돌려준다.
+    """
+    warm_up_task = None
+    if HealthService.warmup_mode == WarmupMode.BLOCKING:
+        HealthService.warm_up()
+    elif HealthService.warmup_mode == WarmupMode.BACKGROUND:
+        warm_up_task = asyncio.create_task(asyncio.to_thread(HealthService.warm_up))
+    if JOB_QUEUE_ENABLED:
+        JobWorkerPool.start()
+    yield
+    if JOB_QUEUE_ENABLED:
+        await JobWorkerPool.stop()
+    if warm_up_task is not None and not warm_up_task.done():
+        await warm_up_task
+    HealthService.mark_stopping()
+    if not await HealthService.drain(SERVER_GRACEFUL_SHUTDOWN_SECONDS):
+        print("종료 대기 시간 안에 끝나지 않은 LLM 호출이 있습니다.")
 
-from .api.routers import variable
 
 app = FastAPI(
     title="Variable Maker API",
     description="",
     version="1.0.0",
     docs_url="/docs",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -18,7 +59,38 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def trace_requests(request: Request, call_next):
+    """요청별 구간 시간 추적 및 HTTP 지표 기록"""
+    if not TRACING_ENABLED:
+        return await call_next(request)
+
+    trace, token = start_trace()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        if SERVER_TIMING_ENABLED:
+            response.headers["Server-Timing"] = trace.server_timing()
+        return response
+    finally:
+        end_trace(token)
+        # 경로 템플릿을 레이블로 사용해 thread_id 등으로 시계열이 늘어나지 않게 함
+        route = request.scope.get("route")
+        path = getattr(route, "path", "unmatched")
+        record_http_request(request.method, path, status_code, trace.elapsed())
+        if TRACE_SLOW_REQUEST_MS and trace.elapsed() * 1000 >= TRACE_SLOW_REQUEST_MS:
+            print(
+                f"느린 요청 {request.method} {path}: "
+                f"{json.dumps(trace.summary(), ensure_ascii=False)}"
+            )
+
+
 app.include_router(variable.router, prefix="/variable", tags=["Variable"])
+app.include_router(session.router, prefix="/sessions", tags=["Session"])
+app.include_router(job.router, prefix="/jobs", tags=["Job"])
+app.include_router(metrics.router, tags=["Metrics"])
 
 
 @app.get("/", tags=["Root"])
@@ -28,5 +100,19 @@ async def root():
         "description": "",
         "version": "1.0.0",
         "docs": "/docs",
-        "status": "healthy",
+        "status": HealthService.status(),
     }
+
+
+@app.get("/health", tags=["Root"])
+async def health():
+    """생존 확인 (프로세스가 요청을 받을 수 있으면 항상 200)"""
+    return {"status": "ok"}
+
+
+@app.get("/ready", tags=["Root"])
+async def ready():
+    """준비 상태 확인 (그래프 컴파일, LLM 공급자 연결, 종료 여부)"""
+    readiness = await HealthService.check_ready()
+    status_code = 200 if readiness["status"] == "ready" else 503
+    return JSONResponse(readiness, status_code=status_code)
@@ -0,0 +1,67 @@
+from enum import Enum
+from typing import Optional
+from pydantic import BaseModel
+
+from .variable import BatchRequest, ProcessRequest
+
+
+class JobKind(Enum):
+    PROCESS = "process"
+    BATCH = "batch"
+
+
+class JobPriority(Enum):
+    INTERACTIVE = "interactive"
+    BULK = "bulk"
+
+
+class JobStatus(Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+# 더 이상 상태가 바뀌지 않는 작업 상태
+FINISHED_JOB_STATUSES = frozenset(
+    {JobStatus.SUCCEEDED.value, JobStatus.FAILED.value, JobStatus.CANCELLED.value}
+)
+
+
+class ProcessJobRequest(ProcessRequest):
+    """변수명 생성 작업 제출 요청 스키마"""
+    priority: JobPriority = JobPriority.INTERACTIVE
+
+
+class BatchJobRequest(BatchRequest):
+    """일괄 변수명 생성 작업 제출 요청 스키마"""
+    priority: JobPriority = JobPriority.BULK
+
+
+class JobProgress(BaseModel):
+    """작업 진행 상황 (처리한 항목 수 / 전체 항목 수)"""
+    done: int
+    total: int
+
+
+class JobInfo(BaseModel):
+    """작업 정보"""
+    job_id: str
+    kind: str
+    priority: str
+    status: str
+    progress: JobProgress
+    error: Optional[str] = None
+    created_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+
+class JobResultResponse(BaseModel):
+    """작업 결과 응답 스키마"""
+    success: bool
+    job_id: str
+    status: str
+    result: dict = {}
+    error: Optional[str] = None
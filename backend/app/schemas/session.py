@@ -0,0 +1,31 @@
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+class SessionCreateRequest(BaseModel):
+    """채팅 세션 생성 요청 스키마"""
+    owner_id: str = Field(min_length=1, max_length=128)
+    title: str = Field("새로운 채팅", max_length=200)
+
+
+class SessionUpdateRequest(BaseModel):
+    """채팅 세션 수정 요청 스키마"""
+    title: str = Field(max_length=200)
+
+
+class ChatSessionInfo(BaseModel):
+    """채팅 세션 정보"""
+    session_id: str
+    owner_id: str
+    title: str
+    thread_id: str
+    created_at: float
+    updated_at: float
+
+
+class SessionListResponse(BaseModel):
+    """채팅 세션 목록 응답 스키마"""
+    success: bool
+    sessions: List[ChatSessionInfo]
+    has_more: bool
+    next_offset: Optional[int] = None
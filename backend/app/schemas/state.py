@@ -0,0 +1,18 @@
+from typing import TypedDict, List, Annotated
+from langchain_core.messages import BaseMessage
+from langgraph.graph import add_messages
+
+from .variable import CaseStyle, Concept, InputType
+
+
+class State(TypedDict):
+    messages: Annotated[List[BaseMessage], add_messages]
+    input_type: InputType
+    current_input: str
+    is_korean: bool
+    translated_word: str
+    abbreviations: List[str]
+    camel_abbreviations: List[str]
+    concepts: List[Concept]
+    camel_concepts: List[Concept]
+    selected_case_style: CaseStyle
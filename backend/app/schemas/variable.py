@@ -1,13 +1,13 @@
+import re
 from enum import Enum
-from typing import TypedDict, List, Annotated, Optional
-from langchain_core.messages import BaseMessage
-from langgraph.graph import add_messages
+from typing import TypedDict, List, Optional
 from pydantic import BaseModel
 
 
 class InputType(Enum):
     WORD = "word"
     TEXT = "text"
+    IDENTIFIER = "identifier"
 
 
 class CaseStyle(Enum):
@@ -18,15 +18,11 @@ class CaseStyle(Enum):
     CONSTANT_CASE = "CONSTANT_CASE"
 
 
-class State(TypedDict):
-    messages: Annotated[List[BaseMessage], add_messages]
-    input_type: InputType
-    current_input: str
-    is_korean: bool
-    translated_word: str
+class Concept(TypedDict):
+    """텍스트 분석 결과의 개념 하나 (name과 abbreviations는 변수명)"""
+    concept: str
+    name: str
     abbreviations: List[str]
-    processed_text: str
-    selected_case_style: CaseStyle
 
 
 class ProcessRequest(BaseModel):
@@ -34,6 +30,7 @@ class ProcessRequest(BaseModel):
     input_text: str
     case_style: Optional[CaseStyle] = CaseStyle.CAMEL_CASE
     thread_id: Optional[str] = None
+    include_all_styles: bool = False
 
     class Config:
         use_enum_values = True
@@ -47,6 +44,35 @@ class ProcessResponse(BaseModel):
     thread_id: Optional[str] = None
 
 
+class BatchRequest(BaseModel):
+    """일괄 변수명 생성 요청 스키마"""
+    inputs: List[str]
+    case_style: Optional[CaseStyle] = CaseStyle.CAMEL_CASE
+    include_all_styles: bool = False
+
+    class Config:
+        use_enum_values = True
+
+
+class BatchItemResult(BaseModel):
+    """일괄 처리 항목별 결과"""
+    index: int
+    input_text: str
+    success: bool
+    result: dict = {}
+    error: Optional[str] = None
+
+
+class BatchResponse(BaseModel):
+    """일괄 변수명 생성 응답 스키마"""
+    success: bool
+    results: List[BatchItemResult]
+    total: int
+    succeeded: int
+    failed: int
+    message: str
+
+
 class CaseStyleOption(BaseModel):
     """케이스 스타일 옵션"""
     id: str
@@ -62,6 +88,30 @@ def is_korean(text: str) -> bool:
     return False
 
 
+# 영문 식별자 (구분자는 단어 사이에 하나씩만 허용)
+_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z][A-Za-z0-9]*(?:[_-][A-Za-z0-9]+)*$")
+# 두 단어 이상으로 이미 나뉘어 있는 표시 (userName, HTTPResponse, user_name, user-name)
+_WORD_BOUNDARY_PATTERN = re.compile(r"[_-]|[a-z0-9][A-Z]|[A-Z][A-Z][a-z]")
+
+
+def is_formatted_identifier(text: str) -> bool:
+    """camelCase, PascalCase, snake_case, kebab-case, CONSTANT_CASE로 이미 작성된 식별자인지 여부"""
+    return (
+        _IDENTIFIER_PATTERN.match(text) is not None
+        and _WORD_BOUNDARY_PATTERN.search(text) is not None
+    )
+
+
+def classify_input(text: str) -> InputType:
+    """입력 텍스트 타입 분류 (공백이 있으면 텍스트, 이미 식별자 형태면 식별자, 나머지는 단어)"""
+    text = text.strip()
+    if " " in text or len(text.split()) > 1:
+        return InputType.TEXT
+    if is_formatted_identifier(text):
+        return InputType.IDENTIFIER
+    return InputType.WORD
+
+
 def get_case_style_options() -> List[tuple]:
     """케이스 스타일 선택 옵션 반환"""
     return [
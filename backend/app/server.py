@@ -0,0 +1,125 @@
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Dict
+
+import uvicorn
+
+from .config.settings import (
+    SERVER_GRACEFUL_SHUTDOWN_SECONDS,
+    SERVER_HOST,
+    SERVER_PORT,
+    SERVER_WORKERS,
+)
+
+# 작업자가 시작 직후 반복해서 죽을 때 재시작 간격 (초)
+_RESPAWN_DELAY_SECONDS = 1.0
+
+
+def _preload() -> None:
+    """fork 전에 앱 임포트, 그래프 컴파일, LLM 공급자 생성을 마쳐 작업자들이 메모리를 공유하게 함"""
+    from .main import app  # noqa: F401
+    from .services.health_service import HealthService
+
+    HealthService.warm_up()
+
+
+def _run_worker(sock: socket.socket) -> None:
+    """fork된 작업자 프로세스에서 uvicorn 실행"""
+    from .main import app
+    from .services.health_service import HealthService
+    from .services.llm_client import LLMClient
+
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    LLMClient.reset_after_fork()
+    HealthService.reset_after_fork()
+
+    config = uvicorn.Config(
+        app,
+        lifespan="on",
+        timeout_graceful_shutdown=int(SERVER_GRACEFUL_SHUTDOWN_SECONDS),
+    )
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def serve(
+    host: str = SERVER_HOST,
+    port: int = SERVER_PORT,
+    workers: int = SERVER_WORKERS,
+) -> None:
+    """운영 모드 서버 실행
+
+    부모 프로세스가 앱을 미리 불러오고 소켓을 연 뒤 작업자를 fork한다. 작업자는 같은 소켓을 공유하며,
+    SIGTERM/SIGINT를 받으면 각 작업자가 새 연결을 받지 않고 진행 중인 요청과 LLM 호출을 마친 뒤 종료한다.
+    fork를 지원하지 않는 플랫폼에서는 uvicorn의 다중 프로세스 모드로 대신 실행한다.
+    """
+    if workers <= 1 or not hasattr(os, "fork"):
+        uvicorn.run(
+            "app.main:app",
+            host=host,
+            port=port,
+            workers=workers,
+            timeout_graceful_shutdown=int(SERVER_GRACEFUL_SHUTDOWN_SECONDS),
+        )
+        return
+
+    _preload()
+
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+
+    children: Dict[int, float] = {}
+    stopping = False
+
+    def spawn() -> None:
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                _run_worker(sock)
+            except BaseException as e:
+                print(f"작업자 오류: {e}", file=sys.stderr)
+                code = 1
+            finally:
+                os._exit(code)
+        children[pid] = time.monotonic()
+
+    def shutdown(signum, frame) -> None:
+        nonlocal stopping
+        stopping = True
+        # SIGINT를 두 번 받으면 uvicorn이 즉시 종료하므로 작업자에게는 항상 SIGTERM을 보냄
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+
+    for _ in range(workers):
+        spawn()
+    print(f"{host}:{port}에서 작업자 {workers}개로 실행 중 (부모 PID {os.getpid()})")
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        started_at = children.pop(pid, None)
+        if started_at is None or stopping:
+            continue
+        print(f"작업자 {pid}가 종료되어 다시 시작합니다 (status={status})")
+        if time.monotonic() - started_at < _RESPAWN_DELAY_SECONDS:
+            time.sleep(_RESPAWN_DELAY_SECONDS)
+        spawn()
+
+    sock.close()
@@ -0,0 +1,199 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from ..config.settings import BATCH_CHUNK_SIZE, BATCH_MAX_PARALLEL_CHUNKS
+from ..schemas.variable import CaseStyle, InputType, classify_input, is_korean
+from .dictionary_service import DictionaryService
+from .langgraph_service import CanonicalResultStore, LangGraphService
+from .llm_client import LLMCallError
+from .text_processing_service import AbbreviationService
+from .translation_service import TRANSLATION_ERROR, TranslationService
+
+
+class BatchService:
+    """일괄 변수명 생성 서비스
+
+    단어 입력은 청크 단위로 묶어 번역/약어 생성을 각각 한 번의 LLM 호출로 처리하고,
+    텍스트 입력은 기존 그래프 파이프라인으로, 이미 식별자 형태인 입력은 로컬 변환으로 처리한다.
+    청크는 제한된 병렬도로 동시에 실행된다.
+    """
+
+    @staticmethod
+    async def process_batch(
+        inputs: List[str],
+        case_style: CaseStyle = CaseStyle.CAMEL_CASE,
+        include_all_styles: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """입력 목록을 처리해 입력 순서대로 항목별 결과 반환"""
+        if isinstance(case_style, str):
+            case_style = CaseStyle(case_style)
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(inputs)
+        word_indices: Dict[str, List[int]] = {}
+        text_indices: List[int] = []
+
+        for index, raw_input in enumerate(inputs):
+            input_text = raw_input.strip()
+            if not input_text:
+                results[index] = BatchService._failure(
+                    index, raw_input, "입력 텍스트가 비어있습니다."
+                )
+                continue
+
+            input_type = classify_input(input_text)
+            if input_type == InputType.IDENTIFIER:
+                canonical = CanonicalResultStore.for_identifier(input_text)
+            else:
+                canonical = CanonicalResultStore.get(input_text)
+            if canonical is not None:
+                results[index] = BatchService._success(
+                    index, raw_input, canonical, case_style, include_all_styles
+                )
+            elif input_type == InputType.WORD:
+                word_indices.setdefault(input_text, []).append(index)
+            else:
+                text_indices.append(index)
+
+        semaphore = asyncio.Semaphore(BATCH_MAX_PARALLEL_CHUNKS)
+
+        async def run_word_chunk(words: List[str]) -> None:
+            error = "번역에 실패했습니다."
+            async with semaphore:
+                try:
+                    canonicals = await BatchService._process_word_chunk(words)
+                except LLMCallError as e:
+                    canonicals, error = {}, str(e)
+            for word in words:
+                canonical = canonicals.get(word)
+                for index in word_indices[word]:
+                    if canonical is None:
+                        results[index] = BatchService._failure(
+                            index, inputs[index], error
+                        )
+                    else:
+                        results[index] = BatchService._success(
+                            index, inputs[index], canonical, case_style, include_all_styles
+                        )
+
+        async def run_text_item(index: int) -> None:
+            async with semaphore:
+                outcome = await LangGraphService.process_request(
+                    {
+                        "input_text": inputs[index].strip(),
+                        "case_style": case_style,
+                        "include_all_styles": include_all_styles,
+                    }
+                )
+            if outcome.get("success", False):
+                results[index] = {
+                    "index": index,
+                    "input_text": inputs[index],
+                    "success": True,
+                    "result": outcome.get("result", {}),
+                }
+            else:
+                results[index] = BatchService._failure(
+                    index, inputs[index], outcome.get("error", "처리 중 오류가 발생했습니다.")
+                )
+
+        words = list(word_indices)
+        tasks = [
+            run_word_chunk(words[start : start + BATCH_CHUNK_SIZE])
+            for start in range(0, len(words), BATCH_CHUNK_SIZE)
+        ]
+        tasks.extend(run_text_item(index) for index in text_indices)
+        await asyncio.gather(*tasks)
+
+        return results
+
+    @staticmethod
+    async def _process_word_chunk(words: List[str]) -> Dict[str, Dict[str, Any]]:
+        """단어 청크의 정규(camelCase) 결과 생성 (번역 실패 단어는 제외)
+
+        사전에서 찾은 번역/약어는 그대로 쓰고, 나머지만 LLM 일괄 호출로 처리한다.
+        """
+        translated_words: Dict[str, str] = {}
+        korean_misses: List[str] = []
+        for word in words:
+            if not is_korean(word):
+                translated_words[word] = word
+                continue
+            translated = (
+                DictionaryService.lookup_translation(word)
+                if DictionaryService.use_dictionary()
+                else None
+            )
+            if translated is not None:
+                translated_words[word] = translated
+            elif DictionaryService.use_llm():
+                korean_misses.append(word)
+            else:
+                translated_words[word] = TRANSLATION_ERROR
+
+        if korean_misses:
+            translated_words.update(
+                await TranslationService.atranslate_batch(korean_misses)
+            )
+
+        valid_words = [
+            word for word in words if translated_words[word] != TRANSLATION_ERROR
+        ]
+        abbreviations: Dict[str, List[str]] = {}
+        abbreviation_misses: List[str] = []
+        for word in valid_words:
+            translated = translated_words[word]
+            found = (
+                DictionaryService.lookup_abbreviations(translated)
+                if DictionaryService.use_dictionary()
+                else None
+            )
+            if found is not None:
+                abbreviations[translated] = found
+            elif DictionaryService.use_llm():
+                abbreviation_misses.append(translated)
+            else:
+                abbreviations[translated] = []
+
+        if abbreviation_misses:
+            abbreviations.update(
+                await AbbreviationService.agenerate_abbreviations_batch(
+                    abbreviation_misses
+                )
+            )
+
+        canonicals = {}
+        for word in valid_words:
+            canonical = {
+                "input_type": InputType.WORD.value,
+                "is_korean": is_korean(word),
+                "translated_word": translated_words[word],
+                "camel_abbreviations": abbreviations.get(translated_words[word], []),
+            }
+            if DictionaryService.use_llm():
+                CanonicalResultStore.put(word, canonical)
+            canonicals[word] = canonical
+        return canonicals
+
+    @staticmethod
+    def _success(
+        index: int,
+        input_text: str,
+        canonical: Dict[str, Any],
+        case_style: CaseStyle,
+        include_all_styles: bool,
+    ) -> Dict[str, Any]:
+        state = CanonicalResultStore.to_state(input_text.strip(), canonical, case_style)
+        result = LangGraphService._format_result(state)
+        if include_all_styles:
+            result["all_styles"] = CanonicalResultStore.render_all_styles(state)
+        return {"index": index, "input_text": input_text, "success": True, "result": result}
+
+    @staticmethod
+    def _failure(index: int, input_text: str, error: str) -> Dict[str, Any]:
+        return {
+            "index": index,
+            "input_text": input_text,
+            "success": False,
+            "result": {},
+            "error": error,
+        }
@@ -0,0 +1,316 @@
+import csv
+import io
+import json
+import os
+import time
+from enum import Enum
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from ..config.settings import BULK_CHUNK_SIZE
+from ..schemas.variable import CaseStyle
+from .batch_service import BatchService
+
+
+class BulkFormat(Enum):
+    CSV = "csv"
+    JSONL = "jsonl"
+
+
+# JSONL 객체에서 입력 텍스트를 읽는 기본 키 (CSV는 기본으로 첫 번째 열)
+DEFAULT_JSONL_COLUMN = "input_text"
+
+_EXTENSIONS = {
+    ".csv": BulkFormat.CSV,
+    ".jsonl": BulkFormat.JSONL,
+    ".ndjson": BulkFormat.JSONL,
+}
+
+
+def detect_format(path: str) -> BulkFormat:
+    """파일 확장자로 형식 판별 (알 수 없으면 ValueError)"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in _EXTENSIONS:
+        raise ValueError(f"형식을 알 수 없는 파일입니다 (csv, jsonl 지원): {path}")
+    return _EXTENSIONS[extension]
+
+
+class RowReader:
+    """CSV/JSONL 줄 이터러블을 행별 입력 텍스트로 변환
+
+    CSV는 csv.reader로 필요한 만큼만 읽으므로 여러 줄에 걸친 따옴표 필드나 필드 중간의 따옴표도 표준대로 처리한다.
+    읽을 수 없는 행은 None으로 내보내 행 번호가 어긋나지 않게 한다.
+    """
+
+    def __init__(self, fmt: BulkFormat, column: Optional[str] = None) -> None:
+        self.fmt = fmt
+        self.column = column
+
+    def read(self, lines: Iterable[str]) -> Iterator[Optional[str]]:
+        """줄 이터러블(newline=""로 연 파일 등)을 읽어 행의 입력 텍스트를 차례로 내보냄"""
+        if self.fmt == BulkFormat.JSONL:
+            for line in lines:
+                if line.strip():
+                    yield self._parse_jsonl(line)
+            return
+
+        records = csv.reader(lines)
+        column_index = self._read_header(records)
+        while True:
+            try:
+                row = next(records)
+            except StopIteration:
+                return
+            except csv.Error:
+                yield None
+                continue
+            if not row or not any(field.strip() for field in row):
+                continue
+            yield row[column_index] if column_index < len(row) else ""
+
+    def _read_header(self, records: Iterator[List[str]]) -> int:
+        """첫 번째 비어 있지 않은 행을 헤더로 읽어 입력 열 위치 반환"""
+        try:
+            header = next((row for row in records if row), None)
+        except csv.Error as e:
+            raise ValueError(f"CSV 헤더를 읽을 수 없습니다: {e}")
+        if header is None or self.column is None:
+            return 0
+        if self.column not in header:
+            raise ValueError(f"CSV 헤더에 '{self.column}' 열이 없습니다: {header}")
+        return header.index(self.column)
+
+    def _parse_jsonl(self, line: str) -> Optional[str]:
+        try:
+            data = json.loads(line)
+        except ValueError:
+            return None
+        if isinstance(data, str):
+            return data
+        if isinstance(data, dict):
+            value = data.get(self.column or DEFAULT_JSONL_COLUMN)
+            return value if isinstance(value, str) else None
+        return None
+
+
+class RowWriter:
+    """처리 결과 레코드를 출력 형식의 한 줄로 변환"""
+
+    def __init__(self, fmt: BulkFormat) -> None:
+        self.fmt = fmt
+
+    def header(self) -> str:
+        """출력 첫 줄 (CSV 헤더, JSONL은 빈 문자열)"""
+        if self.fmt == BulkFormat.JSONL:
+            return ""
+        return self._csv_line(
+            ["row", "input_text", "input_type", "success"]
+            + [style.value for style in CaseStyle]
+            + ["error"]
+        )
+
+    def format(self, record: Dict[str, Any]) -> str:
+        """레코드 한 건을 출력 줄로 변환 (CSV의 스타일 열에는 변수명을 공백으로 구분해 기록)"""
+        if self.fmt == BulkFormat.JSONL:
+            return json.dumps(record, ensure_ascii=False) + "\n"
+
+        all_styles = record.get("all_styles") or {}
+        return self._csv_line(
+            [
+                record["row"],
+                record["input_text"],
+                record.get("input_type") or "",
+                record["success"],
+            ]
+            + [
+                " ".join(self._names(all_styles.get(style.value, [])))
+                for style in CaseStyle
+            ]
+            + [record.get("error") or ""]
+        )
+
+    @staticmethod
+    def _names(values: List[Any]) -> List[str]:
+        # 단어 결과는 약어 목록, 텍스트 결과는 개념 목록
+        return [value["name"] if isinstance(value, dict) else value for value in values]
+
+    @staticmethod
+    def _csv_line(fields: List[Any]) -> str:
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerow(fields)
+        return buffer.getvalue()
+
+
+def read_rows(lines: Iterable[str], reader: RowReader) -> Iterator[Optional[str]]:
+    """줄 이터러블(파일 등)을 행별 입력 텍스트로 변환"""
+    return reader.read(lines)
+
+
+class BulkService:
+    """용어 목록 파일 일괄 변수명 생성 서비스
+
+    행을 제너레이터로 읽어 청크 단위로 BatchService에 넘기고 결과를 입력 순서대로 바로 내보내므로,
+    메모리 사용량은 파일 크기와 관계없이 청크 크기로 제한된다. 결과에는 모든 케이스 스타일이 포함된다.
+    """
+
+    @staticmethod
+    async def aprocess_rows(
+        rows: Iterable[Optional[str]],
+        skip_rows: int = 0,
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """행별 입력 텍스트를 청크 단위로 처리해 결과 레코드 목록을 순서대로 스트리밍 (앞의 skip_rows행은 건너뜀)"""
+        row_number = 0
+        chunk: List[Tuple[int, Optional[str]]] = []
+        for text in rows:
+            row_number += 1
+            if row_number <= skip_rows:
+                continue
+            chunk.append((row_number, text))
+            if len(chunk) >= chunk_size:
+                yield await BulkService._process_chunk(chunk)
+                chunk = []
+        if chunk:
+            yield await BulkService._process_chunk(chunk)
+
+    @staticmethod
+    async def _process_chunk(
+        chunk: List[Tuple[int, Optional[str]]],
+    ) -> List[Dict[str, Any]]:
+        """청크 하나를 처리해 행 번호가 붙은 레코드 목록 반환"""
+        readable = [(row, text) for row, text in chunk if text is not None]
+        outcomes = await BatchService.process_batch(
+            [text for _, text in readable],
+            CaseStyle.CAMEL_CASE,
+            include_all_styles=True,
+        )
+        records = {
+            row: {
+                "row": row,
+                "input_text": text,
+                "success": outcome["success"],
+                "input_type": outcome["result"].get("input_type"),
+                "all_styles": outcome["result"].get("all_styles", {}),
+                "error": outcome.get("error"),
+            }
+            for (row, text), outcome in zip(readable, outcomes)
+        }
+        return [
+            records.get(row)
+            or {
+                "row": row,
+                "input_text": "",
+                "success": False,
+                "input_type": None,
+                "all_styles": {},
+                "error": "행을 읽을 수 없습니다.",
+            }
+            for row, _ in chunk
+        ]
+
+    @staticmethod
+    def _checkpoint_path(output_path: str) -> str:
+        return f"{output_path}.checkpoint.json"
+
+    @staticmethod
+    def _save_checkpoint(path: str, checkpoint: Dict[str, Any]) -> None:
+        """체크포인트를 임시 파일에 쓰고 교체 (중단되어도 이전 체크포인트는 온전히 남음)"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    async def aprocess_file(
+        input_path: str,
+        output_path: str,
+        column: Optional[str] = None,
+        input_format: Optional[BulkFormat] = None,
+        output_format: Optional[BulkFormat] = None,
+        resume: bool = True,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """입력 파일을 처리해 결과를 출력 파일에 청크마다 이어 쓰기
+
+        청크를 기록할 때마다 처리한 행 수와 출력 파일 크기를 체크포인트로 저장한다. 중단 후 다시 실행하면
+        체크포인트 이후에 쓰인 불완전한 출력을 잘라내고 그 다음 행부터 이어서 처리한다. 완료되면 체크포인트를 지운다.
+        """
+        input_format = input_format or detect_format(input_path)
+        output_format = output_format or detect_format(output_path)
+        checkpoint_path = BulkService._checkpoint_path(output_path)
+        source = os.path.abspath(input_path)
+
+        checkpoint = None
+        if resume and os.path.exists(checkpoint_path):
+            with open(checkpoint_path, encoding="utf-8") as f:
+                checkpoint = json.load(f)
+            if checkpoint.get("input_path") != source or not os.path.exists(
+                output_path
+            ):
+                raise ValueError(
+                    f"다른 입력의 체크포인트가 있습니다. 삭제 후 다시 실행하세요: {checkpoint_path}"
+                )
+
+        writer = RowWriter(output_format)
+        summary = {
+            "rows": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "resumed_from": checkpoint["rows_done"] if checkpoint else 0,
+        }
+        started = time.perf_counter()
+
+        with (
+            open(input_path, encoding="utf-8-sig", newline="") as source_file,
+            open(output_path, "r+b" if checkpoint else "wb") as output,
+        ):
+            if checkpoint:
+                output.truncate(checkpoint["output_bytes"])
+                output.seek(checkpoint["output_bytes"])
+                summary.update(
+                    rows=checkpoint["rows_done"],
+                    succeeded=checkpoint["succeeded"],
+                    failed=checkpoint["failed"],
+                )
+            else:
+                output.write(writer.header().encode("utf-8"))
+
+            rows = read_rows(source_file, RowReader(input_format, column))
+            async for records in BulkService.aprocess_rows(
+                rows, skip_rows=summary["rows"], chunk_size=chunk_size
+            ):
+                output.write("".join(writer.format(r) for r in records).encode("utf-8"))
+                output.flush()
+                os.fsync(output.fileno())
+
+                succeeded = sum(1 for r in records if r["success"])
+                summary["rows"] = records[-1]["row"]
+                summary["succeeded"] += succeeded
+                summary["failed"] += len(records) - succeeded
+                BulkService._save_checkpoint(
+                    checkpoint_path,
+                    {
+                        "input_path": source,
+                        "rows_done": summary["rows"],
+                        "output_bytes": output.tell(),
+                        "succeeded": summary["succeeded"],
+                        "failed": summary["failed"],
+                    },
+                )
+                if on_progress is not None:
+                    on_progress(summary)
+
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        summary["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+        return summary
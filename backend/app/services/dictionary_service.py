@@ -0,0 +1,112 @@
+import json
+import os
+import re
+import threading
+from enum import Enum
+from typing import Dict, List, Optional
+
+from ..config.settings import DICTIONARY_PATH, LOOKUP_MODE
+from ..utils.cache import normalize_cache_input
+
+_DEFAULT_DICTIONARY_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "data", "dictionary.json"
+)
+
+_ENGLISH_WORD_PATTERN = re.compile(r"^[a-z]+$")
+
+
+class LookupMode(Enum):
+    DICTIONARY_ONLY = "dictionary_only"
+    DICTIONARY_THEN_LLM = "dictionary_then_llm"
+    LLM_ONLY = "llm_only"
+
+
+class DictionaryService:
+    """로컬 약어/번역 사전 서비스
+
+    사전 파일은 최초 조회 시 한 번만 읽어 정규화된 키의 해시 인덱스로 보관한다.
+    """
+
+    mode = LookupMode(LOOKUP_MODE)
+
+    _abbreviations: Optional[Dict[str, List[str]]] = None
+    _translations: Optional[Dict[str, str]] = None
+    _max_translation_key = 0
+    _lock = threading.Lock()
+
+    @classmethod
+    def _load(cls) -> None:
+        if cls._abbreviations is not None:
+            return
+        with cls._lock:
+            if cls._abbreviations is not None:
+                return
+            with open(DICTIONARY_PATH or _DEFAULT_DICTIONARY_PATH, encoding="utf-8") as f:
+                data = json.load(f)
+            cls._translations = {
+                normalize_cache_input(korean): english
+                for korean, english in data.get("translations", {}).items()
+            }
+            cls._max_translation_key = max(map(len, cls._translations), default=0)
+            cls._abbreviations = {
+                normalize_cache_input(word): abbreviations
+                for word, abbreviations in data.get("abbreviations", {}).items()
+            }
+
+    @classmethod
+    def use_dictionary(cls) -> bool:
+        """사전 조회 여부"""
+        return cls.mode != LookupMode.LLM_ONLY
+
+    @classmethod
+    def use_llm(cls) -> bool:
+        """사전에 없을 때 LLM 호출 여부"""
+        return cls.mode != LookupMode.DICTIONARY_ONLY
+
+    @classmethod
+    def lookup_translation(cls, korean_word: str) -> Optional[str]:
+        """한국어 단어의 영어 번역 조회 (없으면 None)"""
+        cls._load()
+        return cls._translations.get(normalize_cache_input(korean_word))
+
+    @classmethod
+    def guess_translation(cls, korean_word: str) -> Optional[str]:
+        """사전 단어를 이어 붙여 복합어의 번역을 추측 (예: 사용자정보 → user information, 추측할 수 없으면 None)
+
+        단어 전체가 사전에 없을 때 추측 번역 후보로만 쓰며, 가장 긴 사전 단어부터 맞춰 나간다.
+        """
+        cls._load()
+        parts: List[str] = []
+        for token in normalize_cache_input(korean_word).split():
+            start = 0
+            while start < len(token):
+                for end in range(min(len(token), start + cls._max_translation_key), start, -1):
+                    english = cls._translations.get(token[start:end])
+                    if english is not None:
+                        parts.append(english)
+                        start = end
+                        break
+                else:
+                    return None
+        return " ".join(parts) if len(parts) > 1 else None
+
+    @classmethod
+    def lookup_abbreviations(cls, word: str) -> Optional[List[str]]:
+        """영어 단어/구의 camelCase 약어 조회 (없으면 None)
+
+        여러 단어로 된 구는 하나 이상의 단어가 사전에 있으면 단어별 첫 약어를 camelCase로 이어 붙인다.
+        """
+        cls._load()
+        normalized = normalize_cache_input(word)
+        abbreviations = cls._abbreviations.get(normalized)
+        if abbreviations is not None:
+            return list(abbreviations)
+
+        tokens = normalized.split()
+        if len(tokens) < 2 or not all(_ENGLISH_WORD_PATTERN.match(t) for t in tokens):
+            return None
+
+        parts = [cls._abbreviations.get(token, [token])[0] for token in tokens]
+        if parts == tokens:
+            return None
+        return [parts[0] + "".join(part.capitalize() for part in parts[1:])]
@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import time
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from ..config.settings import (
+    LLM_PROVIDER,
+    READINESS_CHECK_TIMEOUT_SECONDS,
+    READINESS_CHECK_TTL_SECONDS,
+    STARTUP_WARMUP,
+)
+from ..utils.concurrency import LLMConcurrencyLimiter
+from .langgraph_service import GraphRegistry
+from .llm_client import LLMClient
+
+logger = logging.getLogger(__name__)
+
+
+def _error_reason(exc: BaseException) -> str:
+    """외부에 공개해도 되는 오류 요약 (HTTP 상태 코드 또는 예외 클래스 이름, 메시지는 포함하지 않음)"""
+    response = getattr(exc, "response", None)
+    status_code = getattr(response, "status_code", None)
+    if isinstance(status_code, int):
+        return f"HTTP {status_code}"
+    return type(exc).__name__
+
+
+class WarmupMode(Enum):
+    BACKGROUND = "background"
+    BLOCKING = "blocking"
+    LAZY = "lazy"
+
+
+class HealthService:
+    """프로세스 생존/준비 상태 서비스
+
+    준비 상태는 그래프 컴파일 여부, 종료 진행 여부, LLM 공급자 연결 가능 여부로 판단한다.
+    공급자 연결 확인 결과는 READINESS_CHECK_TTL_SECONDS 동안 재사용해 헬스 체크가 외부 API를 과도하게 호출하지 않게 한다.
+    """
+
+    warmup_mode = WarmupMode(STARTUP_WARMUP)
+
+    _stopping = False
+    _warmup_seconds: Optional[float] = None
+    _provider_ok: Optional[bool] = None
+    _provider_error: Optional[str] = None
+    _checked_at = 0.0
+    _check_lock: Optional[asyncio.Lock] = None
+
+    @classmethod
+    def mark_stopping(cls) -> None:
+        """종료 시작 (이후 준비 상태 확인은 실패)"""
+        cls._stopping = True
+
+    @classmethod
+    def warm_up(cls) -> None:
+        """그래프 컴파일과 LLM 공급자 생성을 미리 수행 (langgraph 등 무거운 모듈 임포트 포함)"""
+        started = time.perf_counter()
+        GraphRegistry.warm_up()
+        try:
+            LLMClient.get_provider()
+        except Exception as e:
+            # 키 누락 등으로 실패해도 첫 호출 시 다시 시도
+            print(f"LLM 공급자 미리 생성 실패: {e}")
+        cls._warmup_seconds = time.perf_counter() - started
+
+    @classmethod
+    def reset_after_fork(cls) -> None:
+        """fork된 자식 프로세스에서 호출 (부모의 확인 결과와 이벤트 루프 객체를 버림)"""
+        cls._stopping = False
+        cls._provider_ok = None
+        cls._provider_error = None
+        cls._checked_at = 0.0
+        cls._check_lock = None
+
+    @classmethod
+    async def _check_provider(cls) -> None:
+        if time.monotonic() - cls._checked_at < READINESS_CHECK_TTL_SECONDS:
+            return
+        if cls._check_lock is None:
+            cls._check_lock = asyncio.Lock()
+        async with cls._check_lock:
+            if time.monotonic() - cls._checked_at < READINESS_CHECK_TTL_SECONDS:
+                return
+            try:
+                await asyncio.wait_for(
+                    LLMClient.get_provider().health_check(),
+                    timeout=READINESS_CHECK_TIMEOUT_SECONDS,
+                )
+                cls._provider_ok, cls._provider_error = True, None
+            except Exception as e:
+                # /ready는 인증 없이 공개되므로 응답에는 요약만 담고 자세한 내용은 서버 로그로 남김
+                logger.warning("LLM 공급자 연결 확인 실패: %r", e)
+                cls._provider_ok, cls._provider_error = False, _error_reason(e)
+            cls._checked_at = time.monotonic()
+
+    @classmethod
+    def status(cls) -> str:
+        """마지막 확인 결과 기준 상태 (starting, ready, degraded, stopping)"""
+        if cls._stopping:
+            return "stopping"
+        # lazy 모드에서는 그래프를 첫 요청 때 컴파일하므로 컴파일 여부를 준비 조건으로 보지 않음
+        compiled = GraphRegistry.is_compiled() or cls.warmup_mode == WarmupMode.LAZY
+        if not compiled or cls._provider_ok is None:
+            return "starting"
+        return "ready" if cls._provider_ok else "degraded"
+
+    @classmethod
+    async def check_ready(cls) -> Dict[str, Any]:
+        """준비 상태 확인 (필요하면 공급자 연결을 다시 확인)"""
+        if not cls._stopping:
+            await cls._check_provider()
+        return {
+            "status": cls.status(),
+            "graph_compiled": GraphRegistry.is_compiled(),
+            "warmup_mode": cls.warmup_mode.value,
+            "warmup_seconds": cls._warmup_seconds,
+            "llm_provider": LLM_PROVIDER,
+            "llm_reachable": cls._provider_ok,
+            "llm_error": cls._provider_error,
+            "llm_in_flight": LLMConcurrencyLimiter.in_flight(),
+        }
+
+    @classmethod
+    async def drain(cls, timeout: float) -> bool:
+        """진행 중인 LLM 호출이 끝날 때까지 대기 (timeout 안에 끝나면 True)"""
+        deadline = time.monotonic() + timeout
+        while LLMConcurrencyLimiter.in_flight() > 0:
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(0.1)
+        return True
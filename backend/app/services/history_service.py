@@ -0,0 +1,66 @@
+from typing import Any, Dict, Optional
+
+from ..config.settings import HISTORY_ENABLED
+from ..utils.history import create_history_store
+from .session_service import SessionService
+
+history_store = create_history_store()
+
+
+class HistoryService:
+    """대화 히스토리 서비스
+
+    thread_id를 지정한 요청의 입력과 응답을 저장소에 기록하고, 최신 메시지부터 페이지 단위로 조회한다.
+    """
+
+    @staticmethod
+    def record_exchange(thread_id: str, input_text: str, result: Dict[str, Any]) -> None:
+        """사용자 입력과 생성 결과를 한 쌍으로 기록"""
+        if not HISTORY_ENABLED:
+            return
+        history_store.append(
+            thread_id,
+            [
+                {
+                    "role": "user",
+                    "content": input_text,
+                    "metadata": {"case_style": result.get("case_style")},
+                },
+                {
+                    "role": "assistant",
+                    "content": result.get("formatted_response", ""),
+                    "metadata": {
+                        "input_type": result.get("input_type"),
+                        "result": {
+                            key: value
+                            for key, value in result.items()
+                            if key != "formatted_response"
+                        },
+                    },
+                },
+            ],
+        )
+        SessionService.touch_thread(thread_id)
+
+    @staticmethod
+    def get_history(
+        thread_id: str, limit: int, before: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """히스토리 한 페이지 조회 (next_before를 다음 요청의 before로 넘기면 이전 페이지)"""
+        messages, has_more = history_store.page(thread_id, limit, before)
+        return {
+            "thread_id": thread_id,
+            "messages": messages,
+            "has_more": has_more,
+            "next_before": messages[0]["id"] if has_more and messages else None,
+        }
+
+    @staticmethod
+    def delete_history(thread_id: str) -> None:
+        """스레드 히스토리 삭제"""
+        history_store.delete_thread(thread_id)
+
+    @staticmethod
+    def get_stats() -> Dict[str, Any]:
+        """저장소 통계"""
+        return history_store.stats()
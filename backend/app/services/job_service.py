@@ -0,0 +1,280 @@
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from ..config.settings import (
+    BULK_CHUNK_SIZE,
+    JOB_INTERACTIVE_WORKERS,
+    JOB_POLL_INTERVAL_SECONDS,
+    JOB_WORKERS,
+)
+from ..schemas.job import FINISHED_JOB_STATUSES, JobKind, JobPriority, JobStatus
+from ..schemas.variable import CaseStyle
+from ..utils.jobs import PRIORITY_LANES, SQLiteJobQueue
+from .batch_service import BatchService
+from .langgraph_service import LangGraphService
+
+job_queue = SQLiteJobQueue()
+
+logger = logging.getLogger(__name__)
+
+# 작업 이벤트 스트림의 상태 확인 간격과, 변화가 없어도 상태 이벤트를 다시 보내는 간격 (초)
+_EVENT_POLL_SECONDS = 0.5
+_EVENT_HEARTBEAT_SECONDS = 10.0
+
+
+class JobService:
+    """비동기 작업 서비스
+
+    제출한 요청은 작업 큐에 저장되고 바로 job_id를 돌려받는다. 실제 처리는 JobWorkerPool이 맡으며,
+    클라이언트는 상태/결과 조회나 이벤트 스트림으로 진행 상황을 확인한다.
+    작업 큐는 여러 프로세스가 같은 SQLite 파일을 쓰므로 잠금 대기가 이벤트 루프를 막지 않도록 스레드에서 호출한다.
+    """
+
+    @staticmethod
+    async def submit_process(
+        request: Dict[str, Any], priority: JobPriority = JobPriority.INTERACTIVE
+    ) -> Dict[str, Any]:
+        """변수명 생성 작업 제출"""
+        job = await asyncio.to_thread(
+            job_queue.submit,
+            JobKind.PROCESS.value,
+            JobPriority(priority).value,
+            request,
+            1,
+        )
+        JobWorkerPool.notify()
+        return job
+
+    @staticmethod
+    async def submit_batch(
+        inputs: List[str],
+        case_style: CaseStyle = CaseStyle.CAMEL_CASE,
+        include_all_styles: bool = False,
+        priority: JobPriority = JobPriority.BULK,
+    ) -> Dict[str, Any]:
+        """일괄 변수명 생성 작업 제출"""
+        payload = {
+            "inputs": inputs,
+            "case_style": getattr(case_style, "value", case_style),
+            "include_all_styles": include_all_styles,
+        }
+        job = await asyncio.to_thread(
+            job_queue.submit,
+            JobKind.BATCH.value,
+            JobPriority(priority).value,
+            payload,
+            len(inputs),
+        )
+        JobWorkerPool.notify()
+        return job
+
+    @staticmethod
+    async def get_job(job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 정보 조회 (없으면 None)"""
+        return await asyncio.to_thread(job_queue.get, job_id)
+
+    @staticmethod
+    async def get_result(job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 정보와 결과 조회 (없으면 None)"""
+        return await asyncio.to_thread(job_queue.get_result, job_id)
+
+    @staticmethod
+    async def cancel_job(job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 취소 (실행 중인 작업은 다음 상태 확인 때 중단)"""
+        return await asyncio.to_thread(job_queue.cancel, job_id)
+
+    @staticmethod
+    def get_stats() -> Dict[str, Any]:
+        """작업 큐 통계 (SQLite를 조회하므로 이벤트 루프에서는 스레드로 호출)"""
+        return {**job_queue.stats(), "workers": JobWorkerPool.stats()}
+
+    @staticmethod
+    async def stream_events(job_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """상태나 진행 상황이 바뀔 때마다 {"type": "status"} 이벤트를, 끝나면 {"type": "result"} 이벤트를 스트리밍
+
+        변화가 없어도 일정 간격으로 상태 이벤트를 다시 보내 클라이언트 읽기 타임아웃에 걸리지 않게 한다.
+        """
+        last = None
+        last_sent = 0.0
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await asyncio.to_thread(job_queue.get, job_id)
+            if job is None:
+                yield {"type": "error", "error": "작업을 찾을 수 없습니다."}
+                return
+
+            snapshot = (job["status"], job["progress"]["done"])
+            if snapshot != last or loop.time() - last_sent >= _EVENT_HEARTBEAT_SECONDS:
+                last = snapshot
+                last_sent = loop.time()
+                yield {"type": "status", "job": job}
+
+            if job["status"] in FINISHED_JOB_STATUSES:
+                finished = await asyncio.to_thread(job_queue.get_result, job_id)
+                yield {
+                    "type": "result",
+                    "success": finished["status"] == JobStatus.SUCCEEDED.value,
+                    "status": finished["status"],
+                    "result": finished["result"] or {},
+                    "error": finished["error"],
+                }
+                return
+            await asyncio.sleep(_EVENT_POLL_SECONDS)
+
+    @staticmethod
+    async def execute(
+        job: Dict[str, Any]
+    ) -> Tuple[JobStatus, Optional[Dict[str, Any]], Optional[str]]:
+        """작업 하나를 실행해 (상태, 결과, 오류) 반환"""
+        try:
+            if job["kind"] == JobKind.PROCESS.value:
+                return await JobService._execute_process(job["payload"])
+            return await JobService._execute_batch(job["job_id"], job["payload"])
+        except Exception as e:
+            logger.exception("작업 %s 처리 중 오류", job["job_id"])
+            return JobStatus.FAILED, None, str(e)
+
+    @staticmethod
+    async def _execute_process(
+        payload: Dict[str, Any]
+    ) -> Tuple[JobStatus, Optional[Dict[str, Any]], Optional[str]]:
+        response = await LangGraphService.process_request(payload)
+        if not response.get("success", False):
+            return JobStatus.FAILED, None, response.get("error", "처리 중 오류가 발생했습니다.")
+        return (
+            JobStatus.SUCCEEDED,
+            {"result": response["result"], "thread_id": response["thread_id"]},
+            None,
+        )
+
+    @staticmethod
+    async def _execute_batch(
+        job_id: str, payload: Dict[str, Any]
+    ) -> Tuple[JobStatus, Optional[Dict[str, Any]], Optional[str]]:
+        """BULK_CHUNK_SIZE개씩 처리하고 청크마다 진행 상황 기록"""
+        inputs = payload["inputs"]
+        results: List[Dict[str, Any]] = []
+        for start in range(0, len(inputs), BULK_CHUNK_SIZE):
+            chunk = await BatchService.process_batch(
+                inputs[start : start + BULK_CHUNK_SIZE],
+                payload["case_style"],
+                payload["include_all_styles"],
+            )
+            for item in chunk:
+                item["index"] += start
+            results.extend(chunk)
+            await asyncio.to_thread(job_queue.update_progress, job_id, len(results))
+
+        succeeded = sum(1 for item in results if item["success"])
+        return (
+            JobStatus.SUCCEEDED,
+            {
+                "results": results,
+                "total": len(results),
+                "succeeded": succeeded,
+                "failed": len(results) - succeeded,
+            },
+            None,
+        )
+
+
+class JobWorkerPool:
+    """서버 프로세스의 작업자 풀
+
+    작업자는 대기 작업을 우선순위 순서로 가져가 실행한다. 앞의 JOB_INTERACTIVE_WORKERS개 작업자는
+    대화형 작업만 맡으므로 대용량 작업이 쌓여 있어도 대화형 작업은 바로 실행된다.
+    실행 중에는 취소 요청을 주기적으로 확인하고, 서버가 종료되면 실행 중이던 작업을 대기 상태로 되돌린다.
+    """
+
+    _tasks: List["asyncio.Task"] = []
+    _wakeup: Optional[asyncio.Event] = None
+    _running: Dict[str, str] = {}
+    _stopping = False
+
+    @classmethod
+    def start(
+        cls, workers: int = JOB_WORKERS, interactive_workers: int = JOB_INTERACTIVE_WORKERS
+    ) -> None:
+        """작업자 시작 (이벤트 루프 안에서 호출, 종료된 프로세스가 남긴 작업은 다시 대기열로)"""
+        recovered = job_queue.recover()
+        if recovered:
+            logger.info("중단된 작업 %d개를 다시 대기열에 넣었습니다.", recovered)
+
+        cls._stopping = False
+        cls._wakeup = asyncio.Event()
+        interactive_only = [PRIORITY_LANES[JobPriority.INTERACTIVE.value]]
+        cls._tasks = [
+            asyncio.create_task(
+                cls._worker(interactive_only if index < interactive_workers else None)
+            )
+            for index in range(workers)
+        ]
+
+    @classmethod
+    async def stop(cls) -> None:
+        """작업자 종료 (실행 중이던 작업은 다음 시작 때 처음부터 다시 실행)"""
+        cls._stopping = True
+        for task in cls._tasks:
+            task.cancel()
+        await asyncio.gather(*cls._tasks, return_exceptions=True)
+        cls._tasks = []
+        cls._wakeup = None
+
+    @classmethod
+    def notify(cls) -> None:
+        """새 작업이 들어왔음을 대기 중인 작업자에게 알림 (다른 프로세스는 주기적으로 확인)"""
+        if cls._wakeup is not None:
+            cls._wakeup.set()
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """이 프로세스의 작업자 현황"""
+        return {"workers": len(cls._tasks), "running": dict(cls._running)}
+
+    @classmethod
+    async def _worker(cls, lanes: Optional[List[int]]) -> None:
+        while True:
+            try:
+                job = await asyncio.to_thread(job_queue.claim, lanes)
+            except Exception:
+                logger.exception("작업 가져오기 오류")
+                job = None
+
+            if job is None:
+                try:
+                    await asyncio.wait_for(cls._wakeup.wait(), JOB_POLL_INTERVAL_SECONDS)
+                    cls._wakeup.clear()
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            cls._running[job["job_id"]] = job["kind"]
+            try:
+                await cls._run(job)
+            finally:
+                cls._running.pop(job["job_id"], None)
+
+    @classmethod
+    async def _run(cls, job: Dict[str, Any]) -> None:
+        job_id = job["job_id"]
+        task = asyncio.create_task(JobService.execute(job))
+        try:
+            while not task.done():
+                await asyncio.wait({task}, timeout=JOB_POLL_INTERVAL_SECONDS)
+                if not task.done() and await asyncio.to_thread(
+                    job_queue.is_cancel_requested, job_id
+                ):
+                    task.cancel()
+        except asyncio.CancelledError:
+            task.cancel()
+            if cls._stopping:
+                # 이미 취소된 태스크 안이므로 다시 기다리지 않고 바로 기록 (종료 시 한 번뿐인 짧은 쓰기)
+                job_queue.requeue(job_id)
+            raise
+
+        if task.cancelled():
+            await asyncio.to_thread(job_queue.finish, job_id, JobStatus.CANCELLED)
+        else:
+            status, result, error = task.result()
+            await asyncio.to_thread(job_queue.finish, job_id, status, result, error)
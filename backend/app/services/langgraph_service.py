@@ -1,39 +1,250 @@
-from typing import Dict, Any
-from langgraph.constants import START, END
-from langgraph.graph import StateGraph
-from langgraph.checkpoint.memory import MemorySaver
-from langchain_core.messages import HumanMessage
+import logging
+import threading
+import uuid
+from typing import TYPE_CHECKING, Dict, Any, Optional, AsyncIterator
+from langchain_core.messages import HumanMessage, AIMessage
 
-from ..schemas.variable import State, CaseStyle, InputType
-from ..utils.nodes import chatbot_node, word_node, text_node
+from ..config.settings import HISTORY_PAGE_SIZE, LLM_MODEL, REQUEST_COALESCING_ENABLED
+from ..schemas.variable import CaseStyle, InputType, classify_input
+from ..utils.cache import TieredCache, normalize_cache_input
+from ..utils.casing import convert_all_styles, convert_case, split_words
+from ..utils.concurrency import SingleFlight
+from ..utils.formatting import (
+    MessageFormatter,
+    convert_abbreviations,
+    convert_concepts,
+)
+from .dictionary_service import DictionaryService
+from .history_service import HistoryService
+from .translation_service import TRANSLATION_ERROR
+from .llm_client import LLMCallError
+
+# langgraph는 임포트 비용이 커서 그래프를 처음 만들 때 불러옴 (앱 시작과 헬스 체크 응답을 빠르게 유지)
+if TYPE_CHECKING:
+    from langgraph.checkpoint.memory import MemorySaver
+    from ..schemas.state import State
+    from ..utils.checkpointer import BoundedMemorySaver
+
+canonical_result_cache = TieredCache("canonical_result")
+
+request_coalescer = SingleFlight(enabled=REQUEST_COALESCING_ENABLED)
+
+logger = logging.getLogger(__name__)
 
 
 class LangGraphFactory:
     """LangGraph 팩토리"""
 
+    # 그래프로 처리하는 입력 타입 (식별자 입력은 그래프 없이 로컬 변환)
+    GRAPH_INPUT_TYPES = (InputType.WORD, InputType.TEXT)
+
     @staticmethod
-    def create_graph() -> StateGraph:
-        """새로운 LangGraph 인스턴스 생성"""
+    def create_graph(
+        input_type: InputType, checkpointer: Optional["MemorySaver"] = None
+    ):
+        """입력 타입 전용 LangGraph 인스턴스 생성 (분류는 그래프 밖에서 끝난 상태로 실행)"""
+        from langgraph.checkpoint.memory import MemorySaver
+        from langgraph.constants import START, END
+        from langgraph.graph import StateGraph
+
+        from ..schemas.state import State
+        from ..utils.nodes import text_node, word_node
+
+        nodes = {InputType.WORD: word_node, InputType.TEXT: text_node}
+        if input_type not in nodes:
+            raise ValueError(f"그래프로 처리하지 않는 입력 타입입니다: {input_type.value}")
+
         graph = StateGraph(State)
+        graph.add_node(input_type.value, nodes[input_type])
+        graph.add_edge(START, input_type.value)
+        graph.add_edge(input_type.value, END)
+
+        if checkpointer is None:
+            checkpointer = MemorySaver()
+        return graph.compile(checkpointer=checkpointer)
+
+
+class GraphRegistry:
+    """프로세스 단위 컴파일된 그래프 레지스트리
+
+    입력 타입별 그래프는 프로세스당 한 번만 컴파일되고 공유 체크포인터와 함께 재사용된다.
+    컴파일된 그래프는 상태를 갖지 않으므로 thread_id가 다른 동시 요청에서 안전하게 사용할 수 있다.
+    대화 히스토리는 HistoryService에 따로 저장하므로 체크포인트는 실행이 끝나면 삭제한다.
+    """
+
+    _graphs: Dict[InputType, Any] = {}
+    _checkpointer: Optional["BoundedMemorySaver"] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_graph(cls, input_type: InputType):
+        """입력 타입의 컴파일된 그래프 반환 (최초 호출 시 컴파일)"""
+        graph = cls._graphs.get(input_type)
+        if graph is None:
+            with cls._lock:
+                if cls._checkpointer is None:
+                    from ..utils.checkpointer import BoundedMemorySaver
 
-        graph.add_node("chatbot", chatbot_node)
-        graph.add_node("word", word_node)
-        graph.add_node("text", text_node)
+                    cls._checkpointer = BoundedMemorySaver()
+                graph = cls._graphs.get(input_type)
+                if graph is None:
+                    graph = LangGraphFactory.create_graph(input_type, cls._checkpointer)
+                    cls._graphs = {**cls._graphs, input_type: graph}
+        return graph
 
-        graph.add_edge(START, "chatbot")
+    @classmethod
+    def is_compiled(cls) -> bool:
+        """모든 입력 타입의 그래프 컴파일 완료 여부"""
+        return all(t in cls._graphs for t in LangGraphFactory.GRAPH_INPUT_TYPES)
 
-        graph.add_conditional_edges(
-            "chatbot",
-            lambda state: state["input_type"].value,
-            {"word": "word", "text": "text"},
+    @classmethod
+    def warm_up(cls) -> None:
+        """첫 요청 전에 입력 타입별 그래프를 미리 컴파일"""
+        for input_type in LangGraphFactory.GRAPH_INPUT_TYPES:
+            cls.get_graph(input_type)
+
+    @classmethod
+    def release_thread(cls, thread_id: str) -> None:
+        """실행이 끝난 스레드의 체크포인트 삭제"""
+        if cls._checkpointer is not None:
+            cls._checkpointer.delete_thread(thread_id)
+
+    @classmethod
+    def get_checkpointer_stats(cls) -> Dict[str, Any]:
+        """체크포인터 보관 현황"""
+        return cls._checkpointer.stats() if cls._checkpointer is not None else {}
+
+    @classmethod
+    def reset(cls) -> None:
+        """레지스트리 초기화"""
+        with cls._lock:
+            cls._graphs = {}
+            cls._checkpointer = None
+
+
+class CanonicalResultStore:
+    """입력별 camelCase 정규 결과 저장소
+
+    LLM은 항상 camelCase로 결과를 만들기 때문에, 정규 결과만 저장해 두면
+    다른 케이스 스타일은 LLM 호출 없이 로컬 변환으로 만들 수 있다.
+    """
+
+    # 저장 형식 변경 시 올려서 기존 항목을 무효화
+    VERSION = "v2"
+
+    @staticmethod
+    def _cache_key(input_text: str) -> str:
+        return TieredCache.make_key(
+            LLM_MODEL, CanonicalResultStore.VERSION, normalize_cache_input(input_text)
         )
 
-        graph.add_edge("word", END)
-        graph.add_edge("text", END)
+    @staticmethod
+    def get(input_text: str) -> Optional[Dict[str, Any]]:
+        """정규 결과 조회"""
+        return canonical_result_cache.get(CanonicalResultStore._cache_key(input_text))
 
-        # 각 요청마다 새로운 메모리 체크포인터
-        memory = MemorySaver()
-        return graph.compile(checkpointer=memory)
+    @staticmethod
+    def save(input_text: str, state: "State") -> None:
+        """그래프 실행 결과에서 정규 결과를 추출해 저장 (오류 결과는 저장하지 않음)"""
+        # 사전 전용 모드의 결과는 LLM 결과보다 불완전할 수 있으므로 저장하지 않음
+        if not DictionaryService.use_llm():
+            return
+
+        input_type = state.get("input_type", InputType.WORD)
+        if input_type == InputType.WORD:
+            if state.get("translated_word") == TRANSLATION_ERROR:
+                return
+            canonical = {
+                "input_type": input_type.value,
+                "is_korean": state.get("is_korean", False),
+                "translated_word": state.get("translated_word", ""),
+                "camel_abbreviations": state.get("camel_abbreviations", []),
+            }
+        else:
+            # 유효한 개념이 하나도 없으면 (응답 줄이 모두 검증에 실패한 경우 등) 다음 요청에서 다시 분석
+            if not state.get("camel_concepts"):
+                return
+            canonical = {
+                "input_type": input_type.value,
+                "is_korean": state.get("is_korean", False),
+                "camel_concepts": state["camel_concepts"],
+            }
+        CanonicalResultStore.put(input_text, canonical)
+
+    @staticmethod
+    def for_identifier(identifier: str) -> Dict[str, Any]:
+        """이미 식별자 형태인 입력의 정규 결과 (LLM 없이 camelCase로 변환, 저장하지 않음)"""
+        return {
+            "input_type": InputType.IDENTIFIER.value,
+            "is_korean": False,
+            "translated_word": " ".join(split_words(identifier)).lower(),
+            "camel_abbreviations": [convert_case(identifier, CaseStyle.CAMEL_CASE)],
+        }
+
+    @staticmethod
+    def put(input_text: str, canonical: Dict[str, Any]) -> None:
+        """정규 결과 저장"""
+        canonical_result_cache.set(CanonicalResultStore._cache_key(input_text), canonical)
+
+    @staticmethod
+    def to_state(
+        input_text: str, canonical: Dict[str, Any], case_style: CaseStyle
+    ) -> Dict[str, Any]:
+        """정규 결과를 지정한 케이스 스타일의 상태로 변환"""
+        input_type = InputType(canonical["input_type"])
+        state = {
+            "input_type": input_type,
+            "current_input": input_text,
+            "is_korean": canonical.get("is_korean", False),
+            "selected_case_style": case_style,
+        }
+
+        if input_type == InputType.TEXT:
+            concepts = convert_concepts(canonical["camel_concepts"], case_style)
+            state.update(
+                {
+                    "camel_concepts": canonical["camel_concepts"],
+                    "concepts": concepts,
+                }
+            )
+            result_msg = MessageFormatter.format_text_result(input_text, concepts)
+        else:
+            abbreviations = convert_abbreviations(
+                canonical["camel_abbreviations"], case_style
+            )
+            state.update(
+                {
+                    "translated_word": canonical["translated_word"],
+                    "camel_abbreviations": canonical["camel_abbreviations"],
+                    "abbreviations": abbreviations,
+                }
+            )
+            if input_type == InputType.IDENTIFIER:
+                result_msg = MessageFormatter.format_identifier_result(
+                    input_text, abbreviations[0], case_style
+                )
+            else:
+                result_msg = MessageFormatter.format_word_result(
+                    input_text,
+                    canonical["translated_word"],
+                    abbreviations,
+                    state["is_korean"],
+                    case_style,
+                )
+
+        state["messages"] = [AIMessage(content=result_msg)]
+        return state
+
+    @staticmethod
+    def render_all_styles(state: "State") -> Dict[str, Any]:
+        """모든 케이스 스타일의 결과를 한 번에 생성"""
+        if state.get("input_type") == InputType.TEXT:
+            camel_concepts = state.get("camel_concepts", [])
+            return {
+                style.value: convert_concepts(camel_concepts, style)
+                for style in CaseStyle
+            }
+        return convert_all_styles(state.get("camel_abbreviations", []))
 
 
 class LangGraphService:
@@ -41,12 +252,37 @@ class LangGraphService:
 
     @staticmethod
     async def process_request(input_data: Dict[str, Any]) -> Dict[str, Any]:
-        """요청 처리"""
-        thread_id = input_data.get("thread_id", f"thread_{id(input_data)}")
+        """요청 처리 (동일 입력의 동시 요청은 하나의 실행으로 합침)"""
+        thread_id = input_data.get("thread_id") or f"thread_{uuid.uuid4().hex}"
+
+        case_style = input_data.get("case_style", CaseStyle.CAMEL_CASE.value)
+        # 대소문자만 다른 입력도 분류와 결과(current_input)가 다를 수 있으므로 원문 그대로 비교
+        coalescing_key = (
+            input_data.get("input_text", "").strip(),
+            getattr(case_style, "value", case_style),
+            bool(input_data.get("include_all_styles")),
+        )
+        shared = await request_coalescer.do(
+            coalescing_key,
+            lambda: LangGraphService._run_request(input_data, thread_id),
+        )
 
-        # 새로운 그래프 인스턴스 생성
-        graph = LangGraphFactory.create_graph()
+        # 합쳐진 요청도 각자의 thread_id를 돌려받도록 복사
+        response = {**shared, "result": dict(shared["result"]), "thread_id": thread_id}
+        if response["success"] and input_data.get("thread_id"):
+            HistoryService.record_exchange(
+                thread_id, input_data.get("input_text", ""), response["result"]
+            )
+        return response
 
+    @staticmethod
+    def get_coalescing_stats() -> Dict[str, Any]:
+        """요청 합치기 통계"""
+        return request_coalescer.stats()
+
+    @staticmethod
+    async def _run_request(input_data: Dict[str, Any], thread_id: str) -> Dict[str, Any]:
+        """그래프 실행 또는 정규 결과 변환으로 요청 처리"""
         try:
             input_text = input_data.get("input_text", "")
             case_style = input_data.get("case_style", CaseStyle.CAMEL_CASE.value)
@@ -54,20 +290,27 @@ class LangGraphService:
             if isinstance(case_style, str):
                 case_style = CaseStyle(case_style)
 
-            initial_state = {
-                "messages": [HumanMessage(content=input_text)],
-                "input_type": InputType.WORD,
-                "current_input": "",
-                "is_korean": False,
-                "translated_word": "",
-                "abbreviations": [],
-                "processed_text": "",
-                "selected_case_style": case_style,
-            }
+            # 그래프에 들어가기 전에 분류하고, 로컬 변환으로 끝나면 그래프를 실행하지 않음
+            input_type = classify_input(input_text)
+            final_state = LangGraphService._local_state(input_text, input_type, case_style)
+            if final_state is None:
+                graph = GraphRegistry.get_graph(input_type)
+                initial_state = LangGraphService._build_initial_state(
+                    input_text, input_type, case_style
+                )
+
+                config = {"configurable": {"thread_id": thread_id}}
+                try:
+                    final_state = await graph.ainvoke(initial_state, config=config)
+                finally:
+                    GraphRegistry.release_thread(thread_id)
+                CanonicalResultStore.save(input_text, final_state)
 
-            config = {"configurable": {"thread_id": thread_id}}
-            final_state = await graph.ainvoke(initial_state, config=config)
             result = LangGraphService._format_result(final_state)
+            if input_data.get("include_all_styles"):
+                result["all_styles"] = CanonicalResultStore.render_all_styles(
+                    final_state
+                )
 
             return {
                 "success": True,
@@ -76,20 +319,129 @@ class LangGraphService:
                 "input_type": final_state.get("input_type", InputType.WORD).value,
             }
 
+        except LLMCallError as e:
+            logger.warning("LangGraph 처리 중 LLM 호출 오류: %s", e)
+            return {
+                "success": False,
+                "result": {},
+                "error": str(e),
+                "status_code": 503,
+                "thread_id": thread_id,
+            }
         except Exception as e:
-            print(f"LangGraph 처리 중 오류: {str(e)}")
+            logger.exception("LangGraph 처리 중 오류: %s", e)
             return {
                 "success": False,
                 "result": {},
                 "error": str(e),
                 "thread_id": thread_id,
             }
-        finally:
-            # 그래프 인스턴스 정리
-            graph = None
 
     @staticmethod
-    def _format_result(state: State) -> Dict[str, Any]:
+    async def stream_request(input_data: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """요청 처리 결과를 이벤트 단위로 스트리밍
+
+        텍스트 입력은 개념 하나가 검증될 때마다 {"type": "concept"} 이벤트를 내보내고,
+        마지막에 {"type": "result"} 또는 {"type": "error"} 이벤트로 끝난다.
+        """
+        thread_id = input_data.get("thread_id") or f"thread_{uuid.uuid4().hex}"
+
+        try:
+            input_text = input_data.get("input_text", "")
+            case_style = input_data.get("case_style", CaseStyle.CAMEL_CASE.value)
+
+            if isinstance(case_style, str):
+                case_style = CaseStyle(case_style)
+
+            input_type = classify_input(input_text)
+            final_state = LangGraphService._local_state(input_text, input_type, case_style)
+            if final_state is not None:
+                if final_state["input_type"] == InputType.TEXT:
+                    for concept in final_state["concepts"]:
+                        yield LangGraphService._concept_event(concept)
+            else:
+                graph = GraphRegistry.get_graph(input_type)
+                initial_state = LangGraphService._build_initial_state(
+                    input_text, input_type, case_style
+                )
+
+                config = {"configurable": {"thread_id": thread_id}}
+                final_state = None
+                try:
+                    async for mode, chunk in graph.astream(
+                        initial_state, config=config, stream_mode=["custom", "values"]
+                    ):
+                        if mode == "custom":
+                            yield LangGraphService._concept_event(chunk["concept"])
+                        else:
+                            final_state = chunk
+                finally:
+                    GraphRegistry.release_thread(thread_id)
+                CanonicalResultStore.save(input_text, final_state)
+
+            result = LangGraphService._format_result(final_state)
+            if input_data.get("include_all_styles"):
+                result["all_styles"] = CanonicalResultStore.render_all_styles(
+                    final_state
+                )
+
+            if input_data.get("thread_id"):
+                HistoryService.record_exchange(thread_id, input_text, result)
+
+            yield {
+                "type": "result",
+                "success": True,
+                "result": result,
+                "thread_id": thread_id,
+            }
+
+        except Exception as e:
+            logger.exception("LangGraph 스트리밍 처리 중 오류: %s", e)
+            yield {"type": "error", "error": str(e), "thread_id": thread_id}
+
+    @staticmethod
+    def _concept_event(concept: Dict[str, Any]) -> Dict[str, Any]:
+        """개념 스트림 이벤트 (표시용 한 줄 포함)"""
+        return {
+            "type": "concept",
+            "concept": concept,
+            "line": MessageFormatter.format_concept(concept),
+        }
+
+    @staticmethod
+    def _local_state(
+        input_text: str, input_type: InputType, case_style: CaseStyle
+    ) -> Optional[Dict[str, Any]]:
+        """그래프 없이 만들 수 있는 결과 상태 (이미 식별자 형태인 입력 또는 정규 결과가 있는 입력, 없으면 None)"""
+        if input_type == InputType.IDENTIFIER:
+            canonical = CanonicalResultStore.for_identifier(input_text.strip())
+        else:
+            # 정규(camelCase) 결과가 있으면 로컬 변환만 수행
+            canonical = CanonicalResultStore.get(input_text)
+            if canonical is None:
+                return None
+        return CanonicalResultStore.to_state(input_text.strip(), canonical, case_style)
+
+    @staticmethod
+    def _build_initial_state(
+        input_text: str, input_type: InputType, case_style: CaseStyle
+    ) -> Dict[str, Any]:
+        """입력 타입 그래프의 초기 상태 생성"""
+        return {
+            "messages": [HumanMessage(content=input_text)],
+            "input_type": input_type,
+            "current_input": input_text.strip(),
+            "is_korean": False,
+            "translated_word": "",
+            "abbreviations": [],
+            "camel_abbreviations": [],
+            "concepts": [],
+            "camel_concepts": [],
+            "selected_case_style": case_style,
+        }
+
+    @staticmethod
+    def _format_result(state: "State") -> Dict[str, Any]:
         """결과 포맷팅"""
         result = {
             "input_type": state.get("input_type", InputType.WORD).value,
@@ -98,17 +450,21 @@ class LangGraphService:
             "case_style": state.get("selected_case_style", CaseStyle.CAMEL_CASE).value,
         }
 
-        if state.get("input_type") == InputType.WORD:
+        if state.get("input_type") == InputType.TEXT:
+            concepts = state.get("concepts", [])
             result.update(
                 {
-                    "translated_word": state.get("translated_word", ""),
-                    "abbreviations": state.get("abbreviations", []),
+                    "concepts": concepts,
+                    "processed_text": "\n".join(
+                        MessageFormatter.format_concept(c) for c in concepts
+                    ),
                 }
             )
         else:
             result.update(
                 {
-                    "processed_text": state.get("processed_text", ""),
+                    "translated_word": state.get("translated_word", ""),
+                    "abbreviations": state.get("abbreviations", []),
                 }
             )
 
@@ -127,11 +483,8 @@ class LangGraphService:
         return result
 
     @staticmethod
-    def get_conversation_history(thread_id: str) -> Dict[str, Any]:
-        # TODO: 추후에 DB로 변경하기
-        """대화 히스토리 조회"""
-        return {
-            "thread_id": thread_id,
-            "messages": [],
-            "note": "현재는 요청별로 독립된 인스턴스를 사용하므로 히스토리가 유지되지 않습니다.",
-        }
+    def get_conversation_history(
+        thread_id: str, limit: int = HISTORY_PAGE_SIZE, before: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """대화 히스토리 조회 (최신 메시지부터 페이지 단위)"""
+        return HistoryService.get_history(thread_id, limit, before)
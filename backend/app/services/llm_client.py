@@ -0,0 +1,268 @@
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, List, Optional
+
+from langchain_core.messages import BaseMessage
+
+from ..config.settings import (
+    LLM_BACKOFF_BASE_SECONDS,
+    LLM_BACKOFF_MAX_SECONDS,
+    LLM_MAX_CONCURRENCY,
+    LLM_MAX_RETRIES,
+    LLM_RATE_LIMIT_BURST,
+    LLM_RATE_LIMIT_RPM,
+    LLM_TIMEOUT_SECONDS,
+)
+from ..utils.concurrency import LLMConcurrencyLimiter
+from ..utils.tracing import record_llm_call, record_llm_retry, record_llm_usage, span
+from .llm_providers import LLMProvider, create_provider
+
+_RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+# 일시적인 gRPC 상태 (google.api_core 예외의 grpc_status_code, grpc.RpcError.code())
+_RETRYABLE_GRPC_STATUSES = {"RESOURCE_EXHAUSTED", "UNAVAILABLE", "DEADLINE_EXCEEDED"}
+# HTTP 클라이언트 라이브러리의 타임아웃/연결 오류 클래스 이름 (httpx, requests를 import하지 않고 판별)
+_RETRYABLE_TRANSPORT_ERRORS = {"TimeoutException", "NetworkError", "Timeout", "ConnectionError"}
+
+
+class LLMCallError(Exception):
+    """재시도 후에도 실패한 LLM 호출"""
+
+    def __init__(self, task: str, cause: BaseException, attempts: int) -> None:
+        super().__init__(f"LLM 호출 실패 ({task}, {attempts}회 시도): {cause}")
+        self.task = task
+        self.cause = cause
+        self.attempts = attempts
+
+
+class TokenBucket:
+    """클라이언트 측 토큰 버킷 속도 제한기
+
+    토큰이 부족하면 실패하지 않고 다음 토큰이 채워질 때까지 대기한다.
+    """
+
+    def __init__(self, rate_per_second: float, capacity: int) -> None:
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """토큰 하나를 예약하고 대기해야 할 시간(초)을 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated_at) * self.rate_per_second,
+            )
+            self._updated_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate_per_second
+
+    async def acquire(self) -> None:
+        """토큰 획득 (비동기 대기)"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def acquire_sync(self) -> None:
+        """토큰 획득 (동기 대기)"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """예외 타입과 상태 코드로 429/5xx, 일시적인 gRPC 오류, 타임아웃, 연결 오류 여부 판별
+
+    오류 메시지는 보지 않으며, 판별할 수 없으면 원인 예외(__cause__)를 확인한다.
+    """
+    if isinstance(exc, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+        return True
+    if any(cls.__name__ in _RETRYABLE_TRANSPORT_ERRORS for cls in type(exc).__mro__):
+        return True
+
+    # HTTP 상태 코드 (google.api_core 예외의 code, httpx/requests 응답의 status_code)
+    for source in (exc, getattr(exc, "response", None)):
+        code = getattr(source, "status_code", None)
+        if code is None:
+            code = getattr(source, "code", None)
+        if isinstance(code, int):
+            return code in _RETRYABLE_STATUS_CODES
+
+    grpc_status = getattr(exc, "grpc_status_code", None)
+    if grpc_status is None and callable(getattr(exc, "code", None)):
+        try:
+            grpc_status = exc.code()
+        except Exception:
+            grpc_status = None
+    if grpc_status is not None:
+        return getattr(grpc_status, "name", None) in _RETRYABLE_GRPC_STATUSES
+
+    cause = exc.__cause__
+    return cause is not None and cause is not exc and is_retryable_error(cause)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """지수 백오프 + full jitter 대기 시간"""
+    ceiling = min(LLM_BACKOFF_MAX_SECONDS, LLM_BACKOFF_BASE_SECONDS * (2**attempt))
+    return random.uniform(0, ceiling)
+
+
+class LLMClient:
+    """프로세스 공유 LLM 클라이언트
+
+    설정(LLM_PROVIDER)으로 고른 공급자 인스턴스를 하나만 만들어 연결을 재사용하고, 호출마다 속도 제한,
+    동시성 제한, 타임아웃, 429/5xx 지수 백오프 재시도를 적용한다.
+    """
+
+    _provider: Optional[LLMProvider] = None
+    _provider_lock = threading.Lock()
+    # 동기 호출에 타임아웃을 걸기 위한 실행기 (동시 실행 수는 LLMConcurrencyLimiter가 제한)
+    _sync_executor: Optional[ThreadPoolExecutor] = None
+    _rate_limiter: Optional[TokenBucket] = (
+        TokenBucket(LLM_RATE_LIMIT_RPM / 60, LLM_RATE_LIMIT_BURST)
+        if LLM_RATE_LIMIT_RPM > 0
+        else None
+    )
+
+    @classmethod
+    def get_provider(cls) -> LLMProvider:
+        """공유 공급자 인스턴스 반환 (최초 호출 시 생성)"""
+        if cls._provider is None:
+            with cls._provider_lock:
+                if cls._provider is None:
+                    cls._provider = create_provider()
+        return cls._provider
+
+    @classmethod
+    def set_provider(cls, provider: Optional[LLMProvider]) -> None:
+        """공급자 교체 (None이면 다음 호출 시 설정값으로 다시 생성)"""
+        with cls._provider_lock:
+            cls._provider = provider
+
+    @classmethod
+    def reset_after_fork(cls) -> None:
+        """fork된 자식 프로세스에서 호출 (fork에 안전하지 않은 공급자는 다음 호출 시 새로 생성)"""
+        if cls._provider is not None and not cls._provider.fork_safe:
+            cls._provider = None
+        cls._provider_lock = threading.Lock()
+        cls._sync_executor = None
+
+    @classmethod
+    def _get_sync_executor(cls) -> ThreadPoolExecutor:
+        if cls._sync_executor is None:
+            with cls._provider_lock:
+                if cls._sync_executor is None:
+                    cls._sync_executor = ThreadPoolExecutor(
+                        max_workers=LLM_MAX_CONCURRENCY, thread_name_prefix="llm-sync"
+                    )
+        return cls._sync_executor
+
+    @classmethod
+    async def ainvoke(cls, messages: List[BaseMessage], task: str) -> Any:
+        """LLM 호출 (비동기)"""
+        provider = cls.get_provider()
+        attempt = 0
+        with span(f"llm.{task}"):
+            while True:
+                try:
+                    if cls._rate_limiter is not None:
+                        await cls._rate_limiter.acquire()
+                    async with LLMConcurrencyLimiter.limit():
+                        response = await asyncio.wait_for(
+                            provider.ainvoke(messages, task), timeout=LLM_TIMEOUT_SECONDS
+                        )
+                    record_llm_call(task, "success")
+                    record_llm_usage(task, getattr(response, "usage_metadata", None))
+                    return response
+                except Exception as e:
+                    if attempt >= LLM_MAX_RETRIES or not is_retryable_error(e):
+                        record_llm_call(task, "error")
+                        raise LLMCallError(task, e, attempt + 1) from e
+                    record_llm_retry(task)
+                    await asyncio.sleep(_backoff_delay(attempt))
+                    attempt += 1
+
+    @classmethod
+    def invoke(cls, messages: List[BaseMessage], task: str) -> Any:
+        """LLM 호출 (동기, 비동기 호출과 같은 속도/동시성 제한과 타임아웃 적용)
+
+        실행 중인 스레드는 중단할 수 없으므로, 타임아웃된 호출은 실제로 끝날 때까지 슬롯을 점유하고 재시도하지 않는다.
+        """
+        provider = cls.get_provider()
+        attempt = 0
+        with span(f"llm.{task}"):
+            while True:
+                try:
+                    if cls._rate_limiter is not None:
+                        cls._rate_limiter.acquire_sync()
+                    LLMConcurrencyLimiter.acquire_sync()
+                    try:
+                        future = cls._get_sync_executor().submit(
+                            provider.invoke, messages, task
+                        )
+                    except BaseException:
+                        LLMConcurrencyLimiter.release_sync()
+                        raise
+                    future.add_done_callback(
+                        lambda _: LLMConcurrencyLimiter.release_sync()
+                    )
+                    try:
+                        response = future.result(timeout=LLM_TIMEOUT_SECONDS)
+                    except TimeoutError as e:
+                        record_llm_call(task, "error")
+                        raise LLMCallError(task, e, attempt + 1) from e
+                    record_llm_call(task, "success")
+                    record_llm_usage(task, getattr(response, "usage_metadata", None))
+                    return response
+                except LLMCallError:
+                    raise
+                except Exception as e:
+                    if attempt >= LLM_MAX_RETRIES or not is_retryable_error(e):
+                        record_llm_call(task, "error")
+                        raise LLMCallError(task, e, attempt + 1) from e
+                    record_llm_retry(task)
+                    time.sleep(_backoff_delay(attempt))
+                    attempt += 1
+
+    @classmethod
+    async def astream(cls, messages: List[BaseMessage], task: str) -> AsyncIterator[Any]:
+        """LLM 스트리밍 호출 (첫 청크를 받기 전까지만 재시도)"""
+        provider = cls.get_provider()
+        attempt = 0
+        with span(f"llm.{task}"):
+            while True:
+                received = False
+                try:
+                    if cls._rate_limiter is not None:
+                        await cls._rate_limiter.acquire()
+                    async with LLMConcurrencyLimiter.limit():
+                        stream = provider.astream(messages, task).__aiter__()
+                        while True:
+                            try:
+                                chunk = await asyncio.wait_for(
+                                    stream.__anext__(), timeout=LLM_TIMEOUT_SECONDS
+                                )
+                            except StopAsyncIteration:
+                                record_llm_call(task, "success")
+                                return
+                            received = True
+                            record_llm_usage(task, getattr(chunk, "usage_metadata", None))
+                            yield chunk
+                except Exception as e:
+                    if (
+                        received
+                        or attempt >= LLM_MAX_RETRIES
+                        or not is_retryable_error(e)
+                    ):
+                        record_llm_call(task, "error")
+                        raise LLMCallError(task, e, attempt + 1) from e
+                    record_llm_retry(task)
+                    await asyncio.sleep(_backoff_delay(attempt))
+                    attempt += 1
@@ -0,0 +1,292 @@
+import asyncio
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+from typing import AsyncIterator, Dict, List, Tuple
+
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+
+from ..config.settings import (
+    FAKE_LLM_ERROR_RATE,
+    FAKE_LLM_LATENCY_DISTRIBUTION,
+    FAKE_LLM_LATENCY_MS,
+    FAKE_LLM_LATENCY_SIGMA,
+    FAKE_LLM_SEED,
+    LLM_MODEL,
+    LLM_PROVIDER,
+    LLM_TIMEOUT_SECONDS,
+    READINESS_CHECK_TIMEOUT_SECONDS,
+)
+
+
+class LLMProvider:
+    """LLM 공급자 인터페이스
+
+    task는 호출 목적(translation, abbreviation 등)으로, 공급자가 계측이나 응답 생성에 활용할 수 있다.
+    """
+
+    name = "base"
+    # fork 이후 자식 프로세스에서 그대로 써도 되는지 여부 (gRPC 채널 등은 fork에 안전하지 않음)
+    fork_safe = False
+
+    async def health_check(self) -> None:
+        """공급자 연결 확인 (실패 시 예외 발생)"""
+
+    def invoke(self, messages: List[BaseMessage], task: str) -> AIMessage:
+        raise NotImplementedError
+
+    async def ainvoke(self, messages: List[BaseMessage], task: str) -> AIMessage:
+        raise NotImplementedError
+
+    def astream(self, messages: List[BaseMessage], task: str) -> AsyncIterator[AIMessageChunk]:
+        raise NotImplementedError
+
+
+class GeminiProvider(LLMProvider):
+    """Google Gemini 공급자
+
+    모델 인스턴스 하나를 공유해 gRPC 채널(연결)을 재사용한다.
+    """
+
+    name = "gemini"
+
+    _MODELS_URL = "https://generativelanguage.googleapis.com/v1beta/models"
+
+    def __init__(self) -> None:
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
+        # 재시도는 LLMClient에서 처리하므로 내부 재시도는 끔
+        self.model = ChatGoogleGenerativeAI(
+            model=LLM_MODEL,
+            timeout=LLM_TIMEOUT_SECONDS,
+            max_retries=1,
+        )
+
+    async def health_check(self) -> None:
+        """모델 목록 API로 키와 네트워크 연결 확인 (토큰을 소모하지 않음)"""
+        import httpx
+
+        api_key = os.getenv("GOOGLE_API_KEY")
+        if not api_key:
+            raise RuntimeError("GOOGLE_API_KEY가 설정되지 않았습니다.")
+        # 키를 쿼리 문자열에 넣으면 오류 메시지의 URL에 그대로 드러나므로 헤더로 보냄
+        async with httpx.AsyncClient(timeout=READINESS_CHECK_TIMEOUT_SECONDS) as client:
+            response = await client.get(
+                self._MODELS_URL,
+                params={"pageSize": 1},
+                headers={"x-goog-api-key": api_key},
+            )
+        response.raise_for_status()
+
+    def invoke(self, messages: List[BaseMessage], task: str) -> AIMessage:
+        return self.model.invoke(messages)
+
+    async def ainvoke(self, messages: List[BaseMessage], task: str) -> AIMessage:
+        return await self.model.ainvoke(messages)
+
+    def astream(self, messages: List[BaseMessage], task: str) -> AsyncIterator[AIMessageChunk]:
+        return self.model.astream(messages)
+
+
+class FakeLLMError(Exception):
+    """가짜 공급자가 주입하는 오류 (503으로 취급되어 재시도 대상)"""
+
+    code = 503
+
+
+# 가짜 번역에 사용하는 영어 단어 목록
+_FAKE_VOCABULARY = [
+    "account", "amount", "balance", "business", "customer", "data", "employee",
+    "income", "item", "order", "payment", "price", "rate", "record", "reduction",
+    "report", "salary", "service", "small", "status", "tax", "total", "user", "value",
+]
+
+# 텍스트 분석 시 무시하는 요청 문구
+_FAKE_FILLER_WORDS = {"변수", "변수로", "만들어주세요", "만들어줘", "해주세요", "해줘"}
+
+_QUOTED_PATTERN = re.compile(r"'([^']*)'")
+_TERMS_PATTERN = re.compile(r"Terms: (\[.*\])\s*$", re.S)
+_TEXT_PATTERN = re.compile(r"Text: '(.*?)'\n", re.S)
+
+
+class FakeLLMProvider(LLMProvider):
+    """부하 테스트용 오프라인 가짜 공급자
+
+    같은 프롬프트에는 항상 같은 응답을 돌려주고, 지연 시간 분포와 오류율은 설정으로 조절한다.
+    지연/오류는 시드가 고정된 난수로 뽑으므로 같은 호출 순서에서는 재현된다.
+    """
+
+    name = "fake"
+    fork_safe = True
+
+    def __init__(
+        self,
+        latency_ms: float = FAKE_LLM_LATENCY_MS,
+        distribution: str = FAKE_LLM_LATENCY_DISTRIBUTION,
+        sigma: float = FAKE_LLM_LATENCY_SIGMA,
+        error_rate: float = FAKE_LLM_ERROR_RATE,
+        seed: int = FAKE_LLM_SEED,
+    ) -> None:
+        self.latency_ms = latency_ms
+        self.distribution = distribution
+        self.sigma = sigma
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _sample(self) -> Tuple[float, bool]:
+        """(지연 시간 초, 오류 여부) 추출"""
+        with self._lock:
+            if self.distribution == "uniform":
+                latency = self._random.uniform(0, 2 * self.latency_ms)
+            elif self.distribution == "exponential":
+                latency = self._random.expovariate(1 / self.latency_ms) if self.latency_ms else 0
+            elif self.distribution == "lognormal":
+                latency = self._random.lognormvariate(
+                    math.log(max(self.latency_ms, 1e-3)), self.sigma
+                )
+            else:
+                latency = self.latency_ms
+            failed = self._random.random() < self.error_rate
+        return latency / 1000, failed
+
+    @staticmethod
+    def _digest(text: str) -> int:
+        return int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "big")
+
+    @staticmethod
+    def _translate(term: str) -> str:
+        digest = FakeLLMProvider._digest(term)
+        first = _FAKE_VOCABULARY[digest % len(_FAKE_VOCABULARY)]
+        second = _FAKE_VOCABULARY[(digest // len(_FAKE_VOCABULARY)) % len(_FAKE_VOCABULARY)]
+        return first if first == second else f"{first} {second}"
+
+    @staticmethod
+    def _abbreviate(term: str) -> List[str]:
+        words = re.findall(r"[A-Za-z]+", term)
+        if not words:
+            return []
+        camel = words[0].lower() + "".join(w.capitalize() for w in words[1:])
+        short = words[0][:3].lower() + "".join(w[:3].capitalize() for w in words[1:])
+        return list(dict.fromkeys([short, camel])) if len(words) > 1 else [words[0][:4].lower()]
+
+    @staticmethod
+    def _respond(prompt: str, task: str) -> str:
+        """작업 종류별 결정적 응답 생성"""
+        quoted = _QUOTED_PATTERN.search(prompt)
+        term = quoted.group(1) if quoted else prompt
+
+        if task in ("translation_batch", "abbreviation_batch"):
+            match = _TERMS_PATTERN.search(prompt)
+            terms: List[str] = json.loads(match.group(1)) if match else []
+            if task == "translation_batch":
+                mapping: Dict[str, object] = {t: FakeLLMProvider._translate(t) for t in terms}
+            else:
+                mapping = {t: FakeLLMProvider._abbreviate(t) for t in terms}
+            return json.dumps(mapping, ensure_ascii=False)
+        if task == "translation":
+            return FakeLLMProvider._translate(term)
+        if task == "abbreviation":
+            return " ".join(FakeLLMProvider._abbreviate(term)) or "empty"
+        if task == "word_analysis":
+            translation = FakeLLMProvider._translate(term)
+            return json.dumps(
+                {
+                    "translation": translation,
+                    "abbreviations": FakeLLMProvider._abbreviate(translation),
+                }
+            )
+        if task == "text_processing":
+            match = _TEXT_PATTERN.search(prompt)
+            text = match.group(1) if match else term
+            lines = []
+            for token in text.split():
+                if token in _FAKE_FILLER_WORDS:
+                    continue
+                words = FakeLLMProvider._translate(token).split()
+                camel = words[0] + "".join(w.capitalize() for w in words[1:])
+                abbreviations = [
+                    abbr
+                    for abbr in dict.fromkeys(FakeLLMProvider._abbreviate(" ".join(words)))
+                    if abbr != camel
+                ]
+                lines.append(
+                    json.dumps(
+                        {"concept": token, "name": camel, "abbreviations": abbreviations},
+                        ensure_ascii=False,
+                    )
+                )
+            return "\n".join(lines)
+        return term
+
+    @staticmethod
+    def _usage(prompt: str, content: str) -> Dict[str, int]:
+        input_tokens = max(1, len(prompt) // 4)
+        output_tokens = max(1, len(content) // 4)
+        return {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        }
+
+    def _message(self, messages: List[BaseMessage], task: str) -> AIMessage:
+        prompt = messages[-1].content
+        content = self._respond(prompt, task)
+        return AIMessage(content=content, usage_metadata=self._usage(prompt, content))
+
+    async def health_check(self) -> None:
+        # 오류율 1이면 공급자 장애 상황을 흉내 냄
+        if self.error_rate >= 1:
+            raise FakeLLMError("503 UNAVAILABLE (fake provider)")
+
+    def invoke(self, messages: List[BaseMessage], task: str) -> AIMessage:
+        latency, failed = self._sample()
+        time.sleep(latency)
+        if failed:
+            raise FakeLLMError(f"503 UNAVAILABLE (fake provider, task={task})")
+        return self._message(messages, task)
+
+    async def ainvoke(self, messages: List[BaseMessage], task: str) -> AIMessage:
+        latency, failed = self._sample()
+        await asyncio.sleep(latency)
+        if failed:
+            raise FakeLLMError(f"503 UNAVAILABLE (fake provider, task={task})")
+        return self._message(messages, task)
+
+    async def astream(
+        self, messages: List[BaseMessage], task: str
+    ) -> AsyncIterator[AIMessageChunk]:
+        latency, failed = self._sample()
+        if failed:
+            await asyncio.sleep(latency)
+            raise FakeLLMError(f"503 UNAVAILABLE (fake provider, task={task})")
+
+        message = self._message(messages, task)
+        chunks = [message.content[i : i + 16] for i in range(0, len(message.content), 16)]
+        for index, chunk in enumerate(chunks or [""]):
+            await asyncio.sleep(latency / max(len(chunks), 1))
+            yield AIMessageChunk(
+                content=chunk,
+                usage_metadata=message.usage_metadata if index == 0 else None,
+            )
+
+
+_PROVIDERS = {
+    GeminiProvider.name: GeminiProvider,
+    FakeLLMProvider.name: FakeLLMProvider,
+}
+
+
+def create_provider(name: str = LLM_PROVIDER) -> LLMProvider:
+    """설정된 이름의 LLM 공급자 생성"""
+    try:
+        return _PROVIDERS[name]()
+    except KeyError:
+        raise ValueError(
+            f"알 수 없는 LLM_PROVIDER: {name} (사용 가능: {', '.join(_PROVIDERS)})"
+        )
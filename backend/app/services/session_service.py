@@ -0,0 +1,52 @@
+from typing import Any, Dict, Optional
+
+from ..utils.sessions import create_session_store
+
+session_store = create_session_store()
+
+
+class SessionService:
+    """채팅 세션 서비스
+
+    프론트엔드가 세션 목록을 자체 메모리에 쌓지 않도록 세션의 제목과 thread_id를 서버에 저장한다.
+    """
+
+    @staticmethod
+    def create_session(owner_id: str, title: str) -> Dict[str, Any]:
+        """세션 생성"""
+        return session_store.create(owner_id, title)
+
+    @staticmethod
+    def get_session(session_id: str) -> Optional[Dict[str, Any]]:
+        """세션 조회 (없거나 만료되면 None)"""
+        return session_store.get(session_id)
+
+    @staticmethod
+    def list_sessions(owner_id: str, limit: int, offset: int = 0) -> Dict[str, Any]:
+        """최근 사용한 세션부터 한 페이지 조회"""
+        sessions, has_more = session_store.list(owner_id, limit, offset)
+        return {
+            "sessions": sessions,
+            "has_more": has_more,
+            "next_offset": offset + len(sessions) if has_more else None,
+        }
+
+    @staticmethod
+    def rename_session(session_id: str, title: str) -> Optional[Dict[str, Any]]:
+        """세션 제목 변경"""
+        return session_store.update_title(session_id, title)
+
+    @staticmethod
+    def touch_thread(thread_id: str) -> None:
+        """thread_id에 해당하는 세션의 마지막 사용 시각 갱신"""
+        session_store.touch(thread_id)
+
+    @staticmethod
+    def delete_session(session_id: str) -> Optional[Dict[str, Any]]:
+        """세션 삭제 (삭제한 세션, 없으면 None)"""
+        return session_store.delete(session_id)
+
+    @staticmethod
+    def get_stats() -> Dict[str, Any]:
+        """저장소 통계"""
+        return session_store.stats()
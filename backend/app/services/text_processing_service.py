@@ -1,74 +1,263 @@
-from typing import List
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional
 from langchain_core.messages import HumanMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
-from dotenv import load_dotenv
 
-load_dotenv()
+from ..config.settings import LLM_MODEL
+from ..utils.cache import TieredCache, normalize_cache_input
+from ..utils.llm_output import is_identifier, parse_json_response
+from ..utils.similarity import SimilarTextIndex
+from .llm_client import LLMClient
 
-llm = ChatGoogleGenerativeAI(model="gemini-2.0-flash")
+abbreviation_cache = TieredCache("abbreviation")
+text_similarity_index = SimilarTextIndex("text_similarity")
 
 
 class AbbreviationService:
     """약어 생성 서비스"""
 
+    # 프롬프트 변경 시 올려서 기존 캐시를 무효화
+    PROMPT_VERSION = "v1"
+
+    @staticmethod
+    def _build_prompt(word: str) -> HumanMessage:
+        """약어 생성 프롬프트"""
+        return HumanMessage(
+            content=(
+                f"Generate programming variable abbreviations for: '{word}'\n\n"
+                f"Rules:\n"
+                f"1. For single words: provide common abbreviations (e.g., 'international' → 'intl', 'int')\n"
+                f"2. For phrases: create meaningful acronyms and shortened forms\n"
+                f"3. Use camelCase for multi-word concepts\n"
+                f"4. If no good abbreviations exist, return empty\n\n"
+                f"Examples:\n"
+                f"- 'database' → 'db'\n"
+                f"- 'Christmas tree' → 'xmasTree', 'christmasTree'\n"
+                f"- 'Tax reduction for employees' → 'taxReduction', 'empTaxReduction', 'taxRed'\n"
+                f"- 'BTS' → 'bts' (already abbreviated)\n\n"
+                f"Return only space-separated camelCase abbreviations, or empty if none suitable:"
+            )
+        )
+
+    @staticmethod
+    def _parse_abbreviations(content: str) -> List[str]:
+        """LLM 응답에서 약어 목록 추출"""
+        content = content.strip()
+        if not content or content.lower() in ["empty", "none", "no abbreviations"]:
+            return []
+
+        abbreviations = content.split()
+        return [abbr for abbr in abbreviations if abbr != "." and len(abbr) > 0]
+
+    @staticmethod
+    def _cache_key(word: str) -> str:
+        """약어 캐시 키"""
+        return TieredCache.make_key(
+            LLM_MODEL, AbbreviationService.PROMPT_VERSION, normalize_cache_input(word)
+        )
+
     @staticmethod
     def generate_abbreviations(word: str) -> List[str]:
         """영어 단어에 대한 약어 생성 (camelCase로 고정 반환)"""
-        try:
-            prompt = HumanMessage(
-                content=(
-                    f"Generate programming variable abbreviations for: '{word}'\n\n"
-                    f"Rules:\n"
-                    f"1. For single words: provide common abbreviations (e.g., 'international' → 'intl', 'int')\n"
-                    f"2. For phrases: create meaningful acronyms and shortened forms\n"
-                    f"3. Use camelCase for multi-word concepts\n"
-                    f"4. If no good abbreviations exist, return empty\n\n"
-                    f"Examples:\n"
-                    f"- 'database' → 'db'\n"
-                    f"- 'Christmas tree' → 'xmasTree', 'christmasTree'\n"
-                    f"- 'Tax reduction for employees' → 'taxReduction', 'empTaxReduction', 'taxRed'\n"
-                    f"- 'BTS' → 'bts' (already abbreviated)\n\n"
-                    f"Return only space-separated camelCase abbreviations, or empty if none suitable:"
-                )
+        cache_key = AbbreviationService._cache_key(word)
+        cached = abbreviation_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        prompt = AbbreviationService._build_prompt(word)
+        response = LLMClient.invoke([prompt], task="abbreviation")
+        abbreviations = AbbreviationService._parse_abbreviations(response.content)
+
+        abbreviation_cache.set(cache_key, abbreviations)
+        return abbreviations
+
+    @staticmethod
+    async def agenerate_abbreviations(word: str) -> List[str]:
+        """영어 단어에 대한 약어 생성 (비동기, camelCase로 고정 반환)"""
+        cache_key = AbbreviationService._cache_key(word)
+        cached = abbreviation_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        prompt = AbbreviationService._build_prompt(word)
+        response = await LLMClient.ainvoke([prompt], task="abbreviation")
+        abbreviations = AbbreviationService._parse_abbreviations(response.content)
+
+        abbreviation_cache.set(cache_key, abbreviations)
+        return abbreviations
+
+    @staticmethod
+    def _build_batch_prompt(words: List[str]) -> HumanMessage:
+        """여러 단어의 약어를 한 번에 생성하는 프롬프트"""
+        return HumanMessage(
+            content=(
+                "Generate programming variable abbreviations for each of the following terms.\n\n"
+                "Rules:\n"
+                "1. For single words: provide common abbreviations (e.g., 'international' → 'intl', 'int')\n"
+                "2. For phrases: create meaningful acronyms and shortened forms\n"
+                "3. Use camelCase for multi-word concepts\n"
+                "4. If no good abbreviations exist, use an empty list\n\n"
+                "Examples:\n"
+                "- 'database' → ['db']\n"
+                "- 'Christmas tree' → ['xmasTree', 'christmasTree']\n"
+                "- 'BTS' → ['bts'] (already abbreviated)\n\n"
+                "Return only a JSON object that maps every input term, exactly as given, "
+                "to a list of camelCase abbreviations.\n\n"
+                f"Terms: {json.dumps(words, ensure_ascii=False)}"
             )
-            response = llm.invoke([prompt])
-            content = response.content.strip()
-
-            if not content or content.lower() in ["empty", "none", "no abbreviations"]:
-                return []
-
-            abbreviations = content.split()
-            filtered_abbreviations = [
-                abbr for abbr in abbreviations if abbr != "." and len(abbr) > 0
-            ]
-            return filtered_abbreviations
-        except Exception:
-            return []
+        )
+
+    @staticmethod
+    async def agenerate_abbreviations_batch(words: List[str]) -> Dict[str, List[str]]:
+        """여러 단어의 약어를 한 번의 LLM 호출로 생성 (비동기, camelCase로 고정 반환)
+
+        캐시에 없는 단어만 프롬프트에 포함하고, 응답에서 빠진 단어는 단건 생성으로 대체한다.
+        """
+        results: Dict[str, List[str]] = {}
+        missing: List[str] = []
+        for word in dict.fromkeys(words):
+            cached = abbreviation_cache.get(AbbreviationService._cache_key(word))
+            if cached is not None:
+                results[word] = cached
+            else:
+                missing.append(word)
+
+        if missing:
+            prompt = AbbreviationService._build_batch_prompt(missing)
+            response = await LLMClient.ainvoke([prompt], task="abbreviation_batch")
+            try:
+                parsed = parse_json_response(response.content)
+            except ValueError:
+                parsed = {}
+            if not isinstance(parsed, dict):
+                parsed = {}
+
+            for word in missing:
+                abbreviations = parsed.get(word)
+                if isinstance(abbreviations, list) and all(
+                    isinstance(abbr, str) for abbr in abbreviations
+                ):
+                    abbreviations = [abbr.strip() for abbr in abbreviations if abbr.strip()]
+                    abbreviation_cache.set(
+                        AbbreviationService._cache_key(word), abbreviations
+                    )
+                else:
+                    abbreviations = await AbbreviationService.agenerate_abbreviations(word)
+                results[word] = abbreviations
+
+        return results
 
 
 class TextProcessingService:
-    """텍스트 처리 서비스"""
+    """텍스트 처리 서비스
+
+    LLM에는 개념마다 JSON 객체 한 줄(JSON Lines)로 답하도록 요청하고, 줄마다 스키마를 엄격히 검증한다.
+    형식이 맞지 않는 줄은 버리므로 잡담, 글머리표, 코드 펜스가 섞여도 나머지 결과는 그대로 쓸 수 있다.
+    요청 문구만 다른 비슷한 문장은 유사 입력 인덱스에 남은 이전 분석 결과를 재사용한다.
+    """
 
     @staticmethod
-    def process_text(text: str) -> str:
-        """텍스트에서 변수명 후보 추출 및 처리 (camelCase로 고정 반환)"""
+    def _build_prompt(text: str) -> HumanMessage:
+        """텍스트 분석 프롬프트"""
+        return HumanMessage(
+            content=(
+                f"Analyze this Korean/English text and identify the main business/domain concepts that should become variable names. "
+                f"Ignore common words like '변수', '만들어주세요', '해주세요', etc.\n"
+                f"Text: '{text}'\n\n"
+                f"Focus on:\n"
+                f"- Business terms\n"
+                f"- Domain-specific concepts\n"
+                f"- Key nouns that represent data or entities\n\n"
+                f"For each concept, output exactly one JSON object on its own line with these keys:\n"
+                f'- "concept": the concept as written in the text\n'
+                f'- "name": a camelCase variable name\n'
+                f'- "abbreviations": a list of abbreviated camelCase variable names\n\n'
+                f"Example line:\n"
+                f'{{"concept": "소상공인 직원 세금", "name": "smallBusinessEmployeeTax", "abbreviations": ["smbEmpTax", "sbeTax"]}}\n\n'
+                f"Output only the JSON lines, without code fences or any other text:"
+            )
+        )
+
+    @staticmethod
+    def parse_concept(line: str) -> Optional[Dict[str, Any]]:
+        """JSON Lines 응답 한 줄을 개념 객체로 검증 (형식이 맞지 않으면 None)"""
+        line = line.strip()
+        if not line.startswith("{"):
+            return None
         try:
-            prompt = HumanMessage(
-                content=(
-                    f"Analyze this Korean/English text and identify the main business/domain concepts that should become variable names. "
-                    f"Ignore common words like '변수', '만들어주세요', '해주세요', etc.\n"
-                    f"Text: '{text}'\n\n"
-                    f"Focus on:\n"
-                    f"- Business terms\n"
-                    f"- Domain-specific concepts\n"
-                    f"- Key nouns that represent data or entities\n\n"
-                    f"For each concept, provide camelCase style variable names and abbreviated versions:\n"
-                    f"Format: concept_name: camelCaseVersion, abbr1, abbr2\n"
-                    f"Example style (camelCase): smallBusinessEmployeeTax, smbEmpTax, sbeTax\n\n"
-                    f"Output only the results:"
+            data = json.loads(line)
+        except ValueError:
+            return None
+
+        if not isinstance(data, dict):
+            return None
+        concept = data.get("concept")
+        name = data.get("name")
+        abbreviations = data.get("abbreviations", [])
+        if not isinstance(concept, str) or not concept.strip() or "\n" in concept:
+            return None
+        if not is_identifier(name) or not isinstance(abbreviations, list):
+            return None
+
+        return {
+            "concept": concept.strip(),
+            "name": name,
+            "abbreviations": list(
+                dict.fromkeys(
+                    abbr for abbr in abbreviations if is_identifier(abbr) and abbr != name
                 )
-            )
-            response = llm.invoke([prompt])
-            return response.content.strip()
-        except Exception:
-            return "Error processing text."
+            ),
+        }
+
+    @staticmethod
+    def _parse_concepts(content: str) -> List[Dict[str, Any]]:
+        """응답 전체에서 유효한 개념 목록 추출 (같은 개념은 처음 것만 유지)"""
+        concepts: Dict[str, Dict[str, Any]] = {}
+        for line in content.splitlines():
+            concept = TextProcessingService.parse_concept(line)
+            if concept is not None:
+                concepts.setdefault(concept["concept"], concept)
+        return list(concepts.values())
+
+    @staticmethod
+    def process_text(text: str) -> List[Dict[str, Any]]:
+        """텍스트에서 개념별 변수명 후보 추출 (camelCase로 고정 반환)"""
+        cached = text_similarity_index.lookup(text)
+        if cached is not None:
+            return cached
+
+        prompt = TextProcessingService._build_prompt(text)
+        response = LLMClient.invoke([prompt], task="text_processing")
+        concepts = TextProcessingService._parse_concepts(response.content)
+        if concepts:
+            text_similarity_index.add(text, concepts)
+        return concepts
+
+    @staticmethod
+    async def astream_concepts(text: str) -> AsyncIterator[Dict[str, Any]]:
+        """개념이 한 줄 완성될 때마다 검증된 개념 객체를 스트리밍 (비동기, camelCase로 고정 반환)"""
+        cached = text_similarity_index.lookup(text)
+        if cached is not None:
+            for concept in cached:
+                yield concept
+            return
+
+        buffer = ""
+        concepts: Dict[str, Dict[str, Any]] = {}
+        prompt = TextProcessingService._build_prompt(text)
+        async for chunk in LLMClient.astream([prompt], task="text_processing"):
+            buffer += chunk.content
+            lines = buffer.split("\n")
+            buffer = lines.pop()
+            for line in lines:
+                concept = TextProcessingService.parse_concept(line)
+                if concept is not None and concept["concept"] not in concepts:
+                    concepts[concept["concept"]] = concept
+                    yield concept
+
+        concept = TextProcessingService.parse_concept(buffer)
+        if concept is not None and concept["concept"] not in concepts:
+            concepts[concept["concept"]] = concept
+            yield concept
+
+        if concepts:
+            text_similarity_index.add(text, list(concepts.values()))
@@ -1,27 +1,118 @@
+import json
+from typing import Dict, List
+
 from langchain_core.messages import HumanMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
-from dotenv import load_dotenv
 
-load_dotenv()
+from ..config.settings import LLM_MODEL
+from ..utils.cache import TieredCache, normalize_cache_input
+from ..utils.llm_output import parse_json_response
+from .llm_client import LLMClient
+
+translation_cache = TieredCache("translation")
 
-llm = ChatGoogleGenerativeAI(model="gemini-2.0-flash")
+# 번역할 수 없는 경우(사전 전용 모드의 사전 미등록 단어)의 표시 값
+TRANSLATION_ERROR = "translation_error"
 
 
 class TranslationService:
     """번역 서비스"""
 
+    # 프롬프트 변경 시 올려서 기존 캐시를 무효화
+    PROMPT_VERSION = "v1"
+
+    @staticmethod
+    def _build_prompt(korean_word: str) -> HumanMessage:
+        """번역 프롬프트 생성"""
+        return HumanMessage(
+            content=(
+                f"Translate '{korean_word}' to English."
+                "Return only the translated word in English, without any additional text, explanation, or punctuation. "
+                "For example, for '고양이', return 'cat'."
+            )
+        )
+
+    @staticmethod
+    def _cache_key(korean_word: str) -> str:
+        """번역 캐시 키"""
+        return TieredCache.make_key(
+            LLM_MODEL, TranslationService.PROMPT_VERSION, normalize_cache_input(korean_word)
+        )
+
     @staticmethod
     def translate_to_english(korean_word: str) -> str:
         """한국어 단어를 영어로 번역"""
-        try:
-            prompt = HumanMessage(
-                content=(
-                    f"Translate '{korean_word}' to English."
-                    "Return only the translated word in English, without any additional text, explanation, or punctuation. "
-                    "For example, for '고양이', return 'cat'."
-                )
+        cache_key = TranslationService._cache_key(korean_word)
+        cached = translation_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        prompt = TranslationService._build_prompt(korean_word)
+        response = LLMClient.invoke([prompt], task="translation")
+        translated = response.content.strip()
+
+        translation_cache.set(cache_key, translated)
+        return translated
+
+    @staticmethod
+    async def atranslate_to_english(korean_word: str) -> str:
+        """한국어 단어를 영어로 번역 (비동기)"""
+        cache_key = TranslationService._cache_key(korean_word)
+        cached = translation_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        prompt = TranslationService._build_prompt(korean_word)
+        response = await LLMClient.ainvoke([prompt], task="translation")
+        translated = response.content.strip()
+
+        translation_cache.set(cache_key, translated)
+        return translated
+
+    @staticmethod
+    def _build_batch_prompt(korean_words: List[str]) -> HumanMessage:
+        """여러 단어를 한 번에 번역하는 프롬프트 생성"""
+        return HumanMessage(
+            content=(
+                "Translate each of the following Korean terms to English.\n"
+                "Return only a JSON object that maps every input term, exactly as given, "
+                "to its English translation, without any additional text or explanation. "
+                "For example, for [\"고양이\"], return {\"고양이\": \"cat\"}.\n\n"
+                f"Terms: {json.dumps(korean_words, ensure_ascii=False)}"
             )
-            response = llm.invoke([prompt])
-            return response.content.strip()
-        except Exception:
-            return "translation_error"
+        )
+
+    @staticmethod
+    async def atranslate_batch(korean_words: List[str]) -> Dict[str, str]:
+        """여러 한국어 단어를 한 번의 LLM 호출로 번역 (비동기)
+
+        캐시에 없는 단어만 프롬프트에 포함하고, 응답에서 빠진 단어는 단건 번역으로 대체한다.
+        """
+        translations: Dict[str, str] = {}
+        missing: List[str] = []
+        for word in dict.fromkeys(korean_words):
+            cached = translation_cache.get(TranslationService._cache_key(word))
+            if cached is not None:
+                translations[word] = cached
+            else:
+                missing.append(word)
+
+        if missing:
+            prompt = TranslationService._build_batch_prompt(missing)
+            response = await LLMClient.ainvoke([prompt], task="translation_batch")
+            try:
+                parsed = parse_json_response(response.content)
+            except ValueError:
+                parsed = {}
+            if not isinstance(parsed, dict):
+                parsed = {}
+
+            for word in missing:
+                translated = parsed.get(word)
+                if isinstance(translated, str) and translated.strip():
+                    translated = translated.strip()
+                    translation_cache.set(TranslationService._cache_key(word), translated)
+                else:
+                    translated = await TranslationService.atranslate_to_english(word)
+                translations[word] = translated
+
+        return translations
@@ -0,0 +1,133 @@
+import asyncio
+from enum import Enum
+from typing import List, Optional, Tuple
+
+from langchain_core.messages import HumanMessage
+
+from ..config.settings import WORD_PIPELINE_MODE
+from ..utils.cache import normalize_cache_input
+from ..utils.llm_output import is_identifier, parse_json_response
+from .dictionary_service import DictionaryService
+from .llm_client import LLMClient
+from .text_processing_service import AbbreviationService, abbreviation_cache
+from .translation_service import TranslationService, translation_cache
+
+# 번역 결과로 허용하는 최대 길이 (설명문이 섞인 응답 차단)
+_MAX_TRANSLATION_LENGTH = 80
+
+
+class WordPipelineMode(Enum):
+    SEQUENTIAL = "sequential"
+    COMBINED = "combined"
+    SPECULATIVE = "speculative"
+
+
+class WordAnalysisService:
+    """한국어 단어의 번역과 약어 생성을 한 번의 왕복으로 처리하는 서비스"""
+
+    mode = WordPipelineMode(WORD_PIPELINE_MODE)
+
+    @staticmethod
+    def _build_prompt(korean_word: str) -> HumanMessage:
+        """번역 + 약어 통합 프롬프트"""
+        return HumanMessage(
+            content=(
+                f"Translate the Korean term '{korean_word}' to English and generate programming "
+                "variable abbreviations for the English translation.\n\n"
+                "Rules:\n"
+                "1. The translation must be only the English word or phrase, without explanation or punctuation\n"
+                "2. For single words: provide common abbreviations (e.g., 'international' → 'intl', 'int')\n"
+                "3. For phrases: create meaningful acronyms and shortened forms in camelCase\n"
+                "4. If no good abbreviations exist, use an empty list\n\n"
+                "Return only a JSON object in this exact format:\n"
+                '{"translation": "database", "abbreviations": ["db"]}'
+            )
+        )
+
+    @staticmethod
+    def _parse(content: str) -> Optional[Tuple[str, List[str]]]:
+        """통합 응답 검증 (형식이 맞지 않으면 None)"""
+        try:
+            parsed = parse_json_response(content)
+        except ValueError:
+            return None
+
+        if not isinstance(parsed, dict):
+            return None
+        translation = parsed.get("translation")
+        abbreviations = parsed.get("abbreviations")
+        if (
+            not isinstance(translation, str)
+            or not translation.strip()
+            or "\n" in translation
+            or len(translation) > _MAX_TRANSLATION_LENGTH
+        ):
+            return None
+        if not isinstance(abbreviations, list) or not all(
+            is_identifier(abbr) for abbr in abbreviations
+        ):
+            return None
+        return translation.strip(), abbreviations
+
+    @staticmethod
+    async def _acombined(korean_word: str) -> Optional[Tuple[str, List[str]]]:
+        """단일 프롬프트로 번역과 약어를 함께 생성 (응답이 잘못되면 None)"""
+        translation = translation_cache.get(TranslationService._cache_key(korean_word))
+        if translation is not None:
+            abbreviations = abbreviation_cache.get(
+                AbbreviationService._cache_key(translation)
+            )
+            return (translation, abbreviations) if abbreviations is not None else None
+
+        prompt = WordAnalysisService._build_prompt(korean_word)
+        response = await LLMClient.ainvoke([prompt], task="word_analysis")
+        result = WordAnalysisService._parse(response.content)
+        if result is not None:
+            translation, abbreviations = result
+            translation_cache.set(TranslationService._cache_key(korean_word), translation)
+            abbreviation_cache.set(AbbreviationService._cache_key(translation), abbreviations)
+        return result
+
+    @staticmethod
+    async def _aspeculative(
+        korean_word: str, candidate: str
+    ) -> Tuple[str, List[str]]:
+        """후보 번역으로 약어 생성을 번역과 병렬로 실행하고, 번역이 다르면 다시 생성"""
+        translation_task = asyncio.create_task(
+            TranslationService.atranslate_to_english(korean_word)
+        )
+        abbreviation_task = asyncio.create_task(
+            AbbreviationService.agenerate_abbreviations(candidate)
+        )
+
+        try:
+            translation = await translation_task
+        except BaseException:
+            abbreviation_task.cancel()
+            raise
+        if normalize_cache_input(translation) == normalize_cache_input(candidate):
+            return translation, await abbreviation_task
+
+        abbreviation_task.cancel()
+        return translation, await AbbreviationService.agenerate_abbreviations(translation)
+
+    @staticmethod
+    async def aanalyze_korean_word(korean_word: str) -> Tuple[str, Optional[List[str]]]:
+        """모드에 따라 번역과 약어 생성
+
+        약어가 None이면 통합 처리가 실패한 것이므로 호출 측에서 순차적으로 약어를 생성한다.
+        단어 전체는 word_node에서 이미 사전을 조회했으므로, 추측 모드의 후보는 사전 단어를 이어 붙인 복합어 번역이다.
+        """
+        mode = WordAnalysisService.mode
+        if mode == WordPipelineMode.SPECULATIVE:
+            candidate = DictionaryService.guess_translation(korean_word)
+            if candidate is not None:
+                return await WordAnalysisService._aspeculative(korean_word, candidate)
+            mode = WordPipelineMode.COMBINED
+
+        if mode == WordPipelineMode.COMBINED:
+            result = await WordAnalysisService._acombined(korean_word)
+            if result is not None:
+                return result
+
+        return await TranslationService.atranslate_to_english(korean_word), None
@@ -0,0 +1,223 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config.settings import (
+    CACHE_DB_PATH,
+    CACHE_DISK_MAX_ENTRIES,
+    CACHE_ENABLED,
+    CACHE_MEMORY_MAX_ENTRIES,
+    CACHE_TTL_SECONDS,
+)
+from .tracing import record_cache_lookup
+
+# 디스크 정리(만료/용량 초과 삭제)를 수행하는 쓰기 주기
+_PRUNE_INTERVAL = 256
+
+
+def normalize_cache_input(text: str) -> str:
+    """캐시 키용 입력 정규화 (유니코드 NFC, 공백 정리, 대소문자 무시)"""
+    normalized = unicodedata.normalize("NFC", text)
+    return " ".join(normalized.split()).casefold()
+
+
+class TieredCache:
+    """메모리 LRU 앞단 + SQLite 디스크 뒷단으로 구성된 TTL 캐시
+
+    값은 JSON 직렬화 가능한 객체여야 한다. 같은 DB 파일을 여러 네임스페이스가 공유한다.
+    """
+
+    _instances: List["TieredCache"] = []
+
+    def __init__(
+        self,
+        namespace: str,
+        db_path: Optional[str] = CACHE_DB_PATH,
+        ttl_seconds: int = CACHE_TTL_SECONDS,
+        memory_max_entries: int = CACHE_MEMORY_MAX_ENTRIES,
+        disk_max_entries: int = CACHE_DISK_MAX_ENTRIES,
+        enabled: bool = CACHE_ENABLED,
+    ) -> None:
+        self.namespace = namespace
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.memory_max_entries = memory_max_entries
+        self.disk_max_entries = disk_max_entries
+        self.enabled = enabled
+
+        self._memory: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        self._writes_since_prune = 0
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "evictions": 0,
+        }
+        TieredCache._instances.append(self)
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """키 구성 요소들로 고정 길이 캐시 키 생성"""
+        raw = "\x1f".join(parts)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _get_conn(self) -> Optional[sqlite3.Connection]:
+        if not self.db_path:
+            return None
+        # fork로 물려받은 연결은 부모와 공유하면 안 되므로 프로세스마다 새로 연다
+        if self._conn is not None and self._conn_pid != os.getpid():
+            self._conn = None
+        if self._conn is None:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cache_entries_accessed "
+                "ON cache_entries (namespace, accessed_at)"
+            )
+            conn.commit()
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def _remember(self, key: str, value: Any, expires_at: float) -> None:
+        self._memory[key] = (value, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_max_entries:
+            self._memory.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (없거나 만료되었으면 None)"""
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    record_cache_lookup(self.namespace, True)
+                    return value
+                del self._memory[key]
+
+            conn = self._get_conn()
+            if conn is not None:
+                row = conn.execute(
+                    "SELECT value, expires_at FROM cache_entries "
+                    "WHERE namespace = ? AND key = ?",
+                    (self.namespace, key),
+                ).fetchone()
+                if row is not None and row[1] > now:
+                    conn.execute(
+                        "UPDATE cache_entries SET accessed_at = ? "
+                        "WHERE namespace = ? AND key = ?",
+                        (now, self.namespace, key),
+                    )
+                    conn.commit()
+                    value = json.loads(row[0])
+                    self._remember(key, value, row[1])
+                    self._stats["disk_hits"] += 1
+                    record_cache_lookup(self.namespace, True)
+                    return value
+
+            self._stats["misses"] += 1
+            record_cache_lookup(self.namespace, False)
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """캐시 저장"""
+        if not self.enabled:
+            return
+
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+        with self._lock:
+            self._remember(key, value, expires_at)
+            self._stats["sets"] += 1
+
+            conn = self._get_conn()
+            if conn is None:
+                return
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries "
+                "(namespace, key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (self.namespace, key, json.dumps(value, ensure_ascii=False), expires_at, now),
+            )
+            conn.commit()
+
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= _PRUNE_INTERVAL:
+                self._writes_since_prune = 0
+                self._prune(conn, now)
+
+    def _prune(self, conn: sqlite3.Connection, now: float) -> None:
+        """만료 항목과 최대 크기를 넘는 오래된 항목 삭제"""
+        deleted = conn.execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND expires_at <= ?",
+            (self.namespace, now),
+        ).rowcount
+        (count,) = conn.execute(
+            "SELECT COUNT(*) FROM cache_entries WHERE namespace = ?",
+            (self.namespace,),
+        ).fetchone()
+        excess = count - self.disk_max_entries
+        if excess > 0:
+            deleted += conn.execute(
+                "DELETE FROM cache_entries WHERE rowid IN ("
+                "SELECT rowid FROM cache_entries WHERE namespace = ? "
+                "ORDER BY accessed_at LIMIT ?)",
+                (self.namespace, excess),
+            ).rowcount
+        conn.commit()
+        self._stats["evictions"] += deleted
+
+    def clear(self) -> None:
+        """네임스페이스의 모든 항목 삭제"""
+        with self._lock:
+            self._memory.clear()
+            conn = self._get_conn()
+            if conn is not None:
+                conn.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ?", (self.namespace,)
+                )
+                conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """히트/미스 카운터 및 크기"""
+        with self._lock:
+            hits = self._stats["memory_hits"] + self._stats["disk_hits"]
+            lookups = hits + self._stats["misses"]
+            return {
+                "namespace": self.namespace,
+                **self._stats,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "memory_entries": len(self._memory),
+            }
+
+    @classmethod
+    def all_stats(cls) -> List[Dict[str, Any]]:
+        """생성된 모든 캐시의 통계"""
+        return [cache.stats() for cache in cls._instances]
@@ -0,0 +1,86 @@
+import re
+from enum import Enum
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Tuple, Union
+
+# 대소문자 경계를 인식하는 문자 범위 (ASCII + Latin-1)
+_UPPER = "A-ZÀ-ÖØ-Þ"
+_LOWER = "a-zß-öø-ÿ"
+
+# 단어 분리 패턴
+# - 연속 대문자 약어 뒤에 대문자로 시작하는 단어가 오면 약어만 분리 (HTTPResponse -> HTTP, Response)
+# - 숫자는 앞 단어에 붙이고, 소문자 사이의 숫자는 한 단어로 봄 (utf8Encoder -> utf8, Encoder / i18n, k8s)
+# - 소문자 한 글자 뒤의 대문자 약어는 한 단어로 봄 (iOS, iOSVersion -> iOS, Version)
+# - 대소문자가 없는 문자(한글 등)는 연속된 구간을 한 단어로 봄 (사용자ID -> 사용자, ID)
+_WORD_PATTERN = re.compile(
+    rf"[{_UPPER}]+(?=[{_UPPER}][{_LOWER}])"
+    rf"|(?<![{_UPPER}{_LOWER}\d])[{_LOWER}][{_UPPER}]+"
+    rf"(?=[{_UPPER}][{_LOWER}]|[^{_UPPER}{_LOWER}\d]|$)"
+    rf"|[{_UPPER}]?[{_LOWER}]+(?:\d+[{_LOWER}]+)*\d*"
+    rf"|[{_UPPER}]+\d*"
+    rf"|\d+[{_LOWER}]*"
+    rf"|[^\W\d_{_UPPER}{_LOWER}]+\d*"
+)
+
+# 이미 camelCase인 식별자 (구분자 없이 소문자로 시작)
+_CAMEL_PATTERN = re.compile(rf"^[{_LOWER}][{_UPPER}{_LOWER}\d]*$")
+
+StyleLike = Union[str, Enum]
+
+
+@lru_cache(maxsize=8192)
+def split_words(text: str) -> Tuple[str, ...]:
+    """식별자를 단어 단위로 분리 (camelCase, snake_case, kebab-case, 공백 구분 모두 지원)"""
+    return tuple(_WORD_PATTERN.findall(text))
+
+
+def _camel(text: str, words: Tuple[str, ...]) -> str:
+    # LLM이 만든 camelCase(userID 등)는 표기를 그대로 유지
+    if _CAMEL_PATTERN.match(text):
+        return text
+    return words[0].lower() + "".join(word.capitalize() for word in words[1:])
+
+
+_CONVERTERS: Dict[str, Callable[[str, Tuple[str, ...]], str]] = {
+    "camelCase": _camel,
+    "snake_case": lambda text, words: "_".join(word.lower() for word in words),
+    "PascalCase": lambda text, words: "".join(word.capitalize() for word in words),
+    "kebab-case": lambda text, words: "-".join(word.lower() for word in words),
+    "CONSTANT_CASE": lambda text, words: "_".join(word.upper() for word in words),
+}
+
+STYLES: Tuple[str, ...] = tuple(_CONVERTERS)
+
+
+def _style_value(style: StyleLike) -> str:
+    return getattr(style, "value", style)
+
+
+def convert_case(text: str, style: StyleLike) -> str:
+    """식별자 하나를 지정한 케이스 스타일로 변환 (알 수 없는 스타일이나 단어가 없으면 원문 반환)"""
+    converter = _CONVERTERS.get(_style_value(style))
+    words = split_words(text)
+    if converter is None or not words:
+        return text
+    return converter(text, words)
+
+
+def convert_many(texts: Iterable[str], style: StyleLike) -> List[str]:
+    """식별자 목록을 한 번에 같은 케이스 스타일로 변환"""
+    converter = _CONVERTERS.get(_style_value(style))
+    if converter is None:
+        return list(texts)
+    results = []
+    for text in texts:
+        words = split_words(text)
+        results.append(converter(text, words) if words else text)
+    return results
+
+
+def convert_all_styles(texts: Iterable[str]) -> Dict[str, List[str]]:
+    """식별자 목록을 모든 케이스 스타일로 변환 ({스타일 값: 변환 결과 목록})"""
+    split = [(text, split_words(text)) for text in texts]
+    return {
+        style: [converter(text, words) if words else text for text, words in split]
+        for style, converter in _CONVERTERS.items()
+    }
@@ -0,0 +1,85 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Sequence, Set, Tuple
+
+from langgraph.checkpoint.memory import MemorySaver
+
+from ..config.settings import CHECKPOINT_MAX_THREADS
+
+
+class BoundedMemorySaver(MemorySaver):
+    """스레드 수가 제한된 메모리 체크포인터
+
+    최근에 기록된 max_threads개 스레드만 보관하고 넘치면 가장 오래된 스레드부터 삭제한다.
+    스레드별로 기록한 키를 따로 추적해, 삭제 비용이 전체 저장소 크기가 아니라 해당 스레드 크기에 비례한다.
+    """
+
+    def __init__(self, max_threads: int = CHECKPOINT_MAX_THREADS) -> None:
+        super().__init__()
+        self.max_threads = max_threads
+        self._threads: "OrderedDict[str, Tuple[Set[Any], Set[Any]]]" = OrderedDict()
+        self._bound_lock = threading.Lock()
+
+    def _track(self, thread_id: str, blob_keys: Sequence[Any] = (), write_key: Any = None) -> None:
+        with self._bound_lock:
+            blobs, writes = self._threads.pop(thread_id, None) or (set(), set())
+            blobs.update(blob_keys)
+            if write_key is not None:
+                writes.add(write_key)
+            self._threads[thread_id] = (blobs, writes)
+
+            while len(self._threads) > self.max_threads:
+                evicted, (evicted_blobs, evicted_writes) = self._threads.popitem(last=False)
+                self._drop(evicted, evicted_blobs, evicted_writes)
+
+    def _drop(self, thread_id: str, blob_keys: Set[Any], write_keys: Set[Any]) -> None:
+        self.storage.pop(thread_id, None)
+        for key in blob_keys:
+            self.blobs.pop(key, None)
+        for key in write_keys:
+            self.writes.pop(key, None)
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        result = super().put(config, checkpoint, metadata, new_versions)
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        self._track(
+            thread_id,
+            blob_keys=[
+                (thread_id, checkpoint_ns, channel, version)
+                for channel, version in new_versions.items()
+            ],
+        )
+        return result
+
+    def put_writes(self, config, writes: Sequence[Tuple[str, Any]], task_id: str, task_path: str = "") -> None:
+        super().put_writes(config, writes, task_id, task_path)
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        self._track(
+            thread_id,
+            write_key=(
+                thread_id,
+                configurable.get("checkpoint_ns", ""),
+                configurable["checkpoint_id"],
+            ),
+        )
+
+    def delete_thread(self, thread_id: str) -> None:
+        """스레드의 체크포인트와 쓰기 삭제"""
+        with self._bound_lock:
+            tracked = self._threads.pop(thread_id, None)
+            if tracked is None:
+                super().delete_thread(thread_id)
+            else:
+                self._drop(thread_id, *tracked)
+
+    def stats(self) -> Dict[str, Any]:
+        """보관 중인 스레드/체크포인트 값 수"""
+        with self._bound_lock:
+            return {
+                "threads": len(self._threads),
+                "max_threads": self.max_threads,
+                "blobs": len(self.blobs),
+                "writes": len(self.writes),
+            }
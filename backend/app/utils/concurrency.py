@@ -0,0 +1,98 @@
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+from ..config.settings import LLM_MAX_CONCURRENCY
+
+T = TypeVar("T")
+
+
+class LLMConcurrencyLimiter:
+    """프로세스 단위 LLM 동시 호출 제한기
+
+    비동기 호출은 이벤트 루프의 세마포어로, 동기 호출은 스레드 세마포어로 각각 LLM_MAX_CONCURRENCY개까지 허용한다.
+    """
+
+    _semaphore: Optional[asyncio.Semaphore] = None
+    _sync_semaphore = threading.BoundedSemaphore(LLM_MAX_CONCURRENCY)
+    _in_flight: int = 0
+    _in_flight_lock = threading.Lock()
+
+    @classmethod
+    def _get_semaphore(cls) -> asyncio.Semaphore:
+        if cls._semaphore is None:
+            cls._semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+        return cls._semaphore
+
+    @classmethod
+    @asynccontextmanager
+    async def limit(cls) -> AsyncIterator[None]:
+        """LLM 호출 슬롯을 점유하는 컨텍스트"""
+        async with cls._get_semaphore():
+            with cls._in_flight_lock:
+                cls._in_flight += 1
+            try:
+                yield
+            finally:
+                with cls._in_flight_lock:
+                    cls._in_flight -= 1
+
+    @classmethod
+    def acquire_sync(cls) -> None:
+        """LLM 호출 슬롯 점유 (동기 호출용, 호출이 실제로 끝난 뒤 release_sync로 반환)"""
+        cls._sync_semaphore.acquire()
+        with cls._in_flight_lock:
+            cls._in_flight += 1
+
+    @classmethod
+    def release_sync(cls) -> None:
+        """acquire_sync로 점유한 슬롯 반환"""
+        with cls._in_flight_lock:
+            cls._in_flight -= 1
+        cls._sync_semaphore.release()
+
+    @classmethod
+    def in_flight(cls) -> int:
+        """현재 진행 중인 LLM 호출 수"""
+        return cls._in_flight
+
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 호출을 하나의 실행으로 합치는 유틸리티
+
+    실행은 별도 태스크로 돌기 때문에 먼저 들어온 호출자가 취소되어도 나머지 호출자는 결과를 받는다.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self._stats = {"calls": 0, "executions": 0, "coalesced": 0}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """키에 대해 진행 중인 실행이 있으면 그 결과를 공유하고, 없으면 새로 실행"""
+        self._stats["calls"] += 1
+        if not self.enabled:
+            self._stats["executions"] += 1
+            return await fn()
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self._stats["coalesced"] += 1
+        else:
+            self._stats["executions"] += 1
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # 모든 호출자가 취소된 경우에도 예외가 회수되지 않았다는 경고가 나지 않도록 확인
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """합쳐진 호출 수 등 통계"""
+        return {**self._stats, "in_flight": len(self._in_flight)}
@@ -0,0 +1,69 @@
+from typing import List
+
+from ..schemas.variable import CaseStyle, Concept
+from .casing import convert_many
+
+
+class MessageFormatter:
+    """메시지 포맷팅 유틸리티"""
+
+    @staticmethod
+    def format_word_result(
+        original_word: str,
+        translated_word: str,
+        abbreviations: List[str],
+        is_korean: bool,
+        case_style: CaseStyle,
+    ) -> str:
+        """단어 결과 메시지 포맷팅"""
+        abbrev_text = ", ".join(abbreviations) if abbreviations else "없음"
+        case_style_text = f" ({case_style.value})"
+
+        if is_korean:
+            return f"'{original_word}' → '{translated_word}' 약어{case_style_text}: {abbrev_text}"
+        else:
+            return f"'{original_word}' 약어{case_style_text}: {abbrev_text}"
+
+    @staticmethod
+    def format_identifier_result(
+        original_identifier: str, converted: str, case_style: CaseStyle
+    ) -> str:
+        """식별자 변환 결과 메시지 포맷팅"""
+        return f"'{original_identifier}' → {converted} ({case_style.value})"
+
+    @staticmethod
+    def format_concept(concept: Concept) -> str:
+        """개념 한 줄 포맷팅 (개념: 변수명, 약어1, 약어2)"""
+        return f"{concept['concept']}: {', '.join([concept['name'], *concept['abbreviations']])}"
+
+    @staticmethod
+    def format_text_result(original_text: str, concepts: List[Concept]) -> str:
+        """텍스트 결과 메시지 포맷팅"""
+        lines = "\n".join(MessageFormatter.format_concept(c) for c in concepts)
+        return f"텍스트 분석 결과:\n{lines}"
+
+
+def convert_abbreviations(
+    camel_abbreviations: List[str], case_style: CaseStyle
+) -> List[str]:
+    """camelCase 약어 목록을 지정한 케이스 스타일로 변환"""
+    return convert_many(camel_abbreviations, case_style)
+
+
+def convert_concept(camel_concept: Concept, case_style: CaseStyle) -> Concept:
+    """camelCase 개념 결과의 변수명과 약어를 지정한 케이스 스타일로 변환"""
+    name, *abbreviations = convert_many(
+        [camel_concept["name"], *camel_concept["abbreviations"]], case_style
+    )
+    return {
+        "concept": camel_concept["concept"],
+        "name": name,
+        "abbreviations": abbreviations,
+    }
+
+
+def convert_concepts(
+    camel_concepts: List[Concept], case_style: CaseStyle
+) -> List[Concept]:
+    """camelCase 개념 목록을 지정한 케이스 스타일로 변환"""
+    return [convert_concept(concept, case_style) for concept in camel_concepts]
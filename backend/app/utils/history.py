@@ -0,0 +1,310 @@
+import bisect
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config.settings import (
+    HISTORY_BACKEND,
+    HISTORY_DB_PATH,
+    HISTORY_MAX_MESSAGES_PER_THREAD,
+    HISTORY_MEMORY_MAX_THREADS,
+    HISTORY_TTL_SECONDS,
+)
+
+# 만료 스레드 정리를 수행하는 쓰기 주기와 한 번에 정리하는 최대 스레드 수
+_PRUNE_INTERVAL = 256
+_PRUNE_BATCH = 1000
+
+
+class HistoryStore:
+    """스레드별 대화 히스토리 저장소 인터페이스
+
+    메시지는 {"role", "content", "metadata"} 형태이며, 저장 시 단조 증가하는 id와 created_at이 붙는다.
+    page는 before보다 작은 id의 메시지를 최신순으로 최대 limit개 찾아 시간순으로 돌려준다.
+    """
+
+    name = "base"
+
+    def append(self, thread_id: str, messages: List[Dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+    def page(
+        self, thread_id: str, limit: int, before: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """(메시지 목록, 더 오래된 메시지가 있는지 여부)"""
+        raise NotImplementedError
+
+    def delete_thread(self, thread_id: str) -> None:
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+
+class SQLiteHistoryStore(HistoryStore):
+    """SQLite 히스토리 저장소
+
+    (thread_id, id) 인덱스로 키셋 페이지 조회를 하므로 조회 비용은 스레드 길이가 아니라 페이지 크기에 비례한다.
+    스레드당 메시지 수를 제한하고, 일정 쓰기마다 TTL이 지난 스레드를 삭제한다.
+    """
+
+    name = "sqlite"
+
+    def __init__(
+        self,
+        db_path: str = HISTORY_DB_PATH,
+        max_messages_per_thread: int = HISTORY_MAX_MESSAGES_PER_THREAD,
+        ttl_seconds: int = HISTORY_TTL_SECONDS,
+    ) -> None:
+        self.db_path = db_path
+        self.max_messages_per_thread = max_messages_per_thread
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        self._writes_since_prune = 0
+
+    def _get_conn(self) -> sqlite3.Connection:
+        # fork로 물려받은 연결은 부모와 공유하면 안 되므로 프로세스마다 새로 연다
+        if self._conn is not None and self._conn_pid != os.getpid():
+            self._conn = None
+        if self._conn is None:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS history_threads ("
+                "thread_id TEXT PRIMARY KEY, updated_at REAL NOT NULL, "
+                "message_count INTEGER NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_history_threads_updated "
+                "ON history_threads (updated_at)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS history_messages ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, thread_id TEXT NOT NULL, "
+                "role TEXT NOT NULL, content TEXT NOT NULL, metadata TEXT, "
+                "created_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_history_messages_thread "
+                "ON history_messages (thread_id, id)"
+            )
+            conn.commit()
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def append(self, thread_id: str, messages: List[Dict[str, Any]]) -> None:
+        """메시지 추가 (스레드 메시지 수 제한을 넘으면 오래된 메시지부터 삭제)"""
+        if not messages:
+            return
+
+        now = time.time()
+        with self._lock:
+            conn = self._get_conn()
+            conn.executemany(
+                "INSERT INTO history_messages "
+                "(thread_id, role, content, metadata, created_at) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        thread_id,
+                        message["role"],
+                        message["content"],
+                        json.dumps(message.get("metadata") or {}, ensure_ascii=False),
+                        now,
+                    )
+                    for message in messages
+                ],
+            )
+            conn.execute(
+                "INSERT INTO history_threads (thread_id, updated_at, message_count) "
+                "VALUES (?, ?, ?) ON CONFLICT (thread_id) DO UPDATE SET "
+                "updated_at = excluded.updated_at, "
+                "message_count = message_count + excluded.message_count",
+                (thread_id, now, len(messages)),
+            )
+            (count,) = conn.execute(
+                "SELECT message_count FROM history_threads WHERE thread_id = ?",
+                (thread_id,),
+            ).fetchone()
+            excess = count - self.max_messages_per_thread
+            if excess > 0:
+                conn.execute(
+                    "DELETE FROM history_messages WHERE id IN ("
+                    "SELECT id FROM history_messages WHERE thread_id = ? "
+                    "ORDER BY id LIMIT ?)",
+                    (thread_id, excess),
+                )
+                conn.execute(
+                    "UPDATE history_threads SET message_count = ? WHERE thread_id = ?",
+                    (self.max_messages_per_thread, thread_id),
+                )
+            conn.commit()
+
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= _PRUNE_INTERVAL:
+                self._writes_since_prune = 0
+                self._prune(conn, now)
+
+    def _prune(self, conn: sqlite3.Connection, now: float) -> None:
+        """TTL이 지난 스레드 삭제"""
+        expired = [
+            row[0]
+            for row in conn.execute(
+                "SELECT thread_id FROM history_threads WHERE updated_at <= ? LIMIT ?",
+                (now - self.ttl_seconds, _PRUNE_BATCH),
+            )
+        ]
+        for thread_id in expired:
+            self._delete(conn, thread_id)
+        conn.commit()
+
+    @staticmethod
+    def _delete(conn: sqlite3.Connection, thread_id: str) -> None:
+        conn.execute("DELETE FROM history_messages WHERE thread_id = ?", (thread_id,))
+        conn.execute("DELETE FROM history_threads WHERE thread_id = ?", (thread_id,))
+
+    def page(
+        self, thread_id: str, limit: int, before: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        with self._lock:
+            conn = self._get_conn()
+            thread = conn.execute(
+                "SELECT updated_at FROM history_threads WHERE thread_id = ?",
+                (thread_id,),
+            ).fetchone()
+            if thread is None or thread[0] <= time.time() - self.ttl_seconds:
+                return [], False
+
+            query = (
+                "SELECT id, role, content, metadata, created_at FROM history_messages "
+                "WHERE thread_id = ?"
+            )
+            params: List[Any] = [thread_id]
+            if before is not None:
+                query += " AND id < ?"
+                params.append(before)
+            query += " ORDER BY id DESC LIMIT ?"
+            params.append(limit + 1)
+            rows = conn.execute(query, params).fetchall()
+
+        has_more = len(rows) > limit
+        messages = [
+            {
+                "id": row[0],
+                "role": row[1],
+                "content": row[2],
+                "metadata": json.loads(row[3]) if row[3] else {},
+                "created_at": row[4],
+            }
+            for row in reversed(rows[:limit])
+        ]
+        return messages, has_more
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            conn = self._get_conn()
+            self._delete(conn, thread_id)
+            conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            conn = self._get_conn()
+            threads, messages = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(message_count), 0) FROM history_threads"
+            ).fetchone()
+        return {"backend": self.name, "threads": threads, "messages": messages}
+
+
+class MemoryHistoryStore(HistoryStore):
+    """프로세스 메모리 히스토리 저장소 (개발/테스트용)
+
+    스레드 수와 스레드당 메시지 수를 모두 제한하며, 스레드 수를 넘으면 가장 오래 갱신되지 않은 스레드를 버린다.
+    """
+
+    name = "memory"
+
+    def __init__(
+        self,
+        max_messages_per_thread: int = HISTORY_MAX_MESSAGES_PER_THREAD,
+        ttl_seconds: int = HISTORY_TTL_SECONDS,
+        max_threads: int = HISTORY_MEMORY_MAX_THREADS,
+    ) -> None:
+        self.max_messages_per_thread = max_messages_per_thread
+        self.ttl_seconds = ttl_seconds
+        self.max_threads = max_threads
+        self._threads: "OrderedDict[str, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    def append(self, thread_id: str, messages: List[Dict[str, Any]]) -> None:
+        now = time.time()
+        with self._lock:
+            _, stored = self._threads.pop(thread_id, (now, []))
+            for message in messages:
+                stored.append(
+                    {
+                        "id": self._next_id,
+                        "role": message["role"],
+                        "content": message["content"],
+                        "metadata": message.get("metadata") or {},
+                        "created_at": now,
+                    }
+                )
+                self._next_id += 1
+            del stored[: max(0, len(stored) - self.max_messages_per_thread)]
+            self._threads[thread_id] = (now, stored)
+            while len(self._threads) > self.max_threads:
+                self._threads.popitem(last=False)
+
+    def page(
+        self, thread_id: str, limit: int, before: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        with self._lock:
+            entry = self._threads.get(thread_id)
+            if entry is None:
+                return [], False
+            updated_at, stored = entry
+            if updated_at <= time.time() - self.ttl_seconds:
+                del self._threads[thread_id]
+                return [], False
+
+            end = len(stored)
+            if before is not None:
+                end = bisect.bisect_left([message["id"] for message in stored], before)
+            start = max(0, end - limit)
+            return [dict(message) for message in stored[start:end]], start > 0
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            self._threads.pop(thread_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            messages = sum(len(stored) for _, stored in self._threads.values())
+            return {"backend": self.name, "threads": len(self._threads), "messages": messages}
+
+
+_BACKENDS = {
+    SQLiteHistoryStore.name: SQLiteHistoryStore,
+    MemoryHistoryStore.name: MemoryHistoryStore,
+}
+
+
+def create_history_store(name: str = HISTORY_BACKEND) -> HistoryStore:
+    """설정된 이름의 히스토리 저장소 생성"""
+    try:
+        return _BACKENDS[name]()
+    except KeyError:
+        raise ValueError(
+            f"알 수 없는 HISTORY_BACKEND: {name} (사용 가능: {', '.join(_BACKENDS)})"
+        )
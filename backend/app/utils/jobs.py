@@ -0,0 +1,348 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config.settings import JOB_DB_PATH, JOB_TTL_SECONDS
+from ..schemas.job import FINISHED_JOB_STATUSES, JobPriority, JobStatus
+
+# 완료 작업 정리를 수행하는 제출 주기와 한 번에 정리하는 최대 작업 수
+_PRUNE_INTERVAL = 256
+_PRUNE_BATCH = 1000
+
+# 우선순위별 처리 순서 (작을수록 먼저)
+PRIORITY_LANES = {JobPriority.INTERACTIVE.value: 0, JobPriority.BULK.value: 1}
+
+_COLUMNS = (
+    "job_id",
+    "kind",
+    "priority",
+    "status",
+    "progress_done",
+    "progress_total",
+    "error",
+    "created_at",
+    "started_at",
+    "finished_at",
+)
+
+
+# /proc가 없는 환경에서 이 프로세스를 구분하는 값 (pid, 식별자)
+_local_identity: Tuple[int, str] = (0, "")
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    if pid is None:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _process_identity(pid: int) -> Optional[str]:
+    """pid를 재사용한 다른 프로세스와 구분하는 값 (프로세스 시작 시각, 알 수 없으면 None)
+
+    컨테이너가 재시작되면 새 프로세스가 같은 pid(흔히 1)를 받으므로 pid만으로는 이전 작업자와 구분할 수 없다.
+    """
+    global _local_identity
+    try:
+        with open(f"/proc/{pid}/stat", encoding="utf-8") as f:
+            stat = f.read()
+        # 두 번째 필드(comm)에 공백이 있을 수 있으므로 마지막 ')' 뒤부터 나눔 (22번째 필드가 시작 시각)
+        return "start:" + stat[stat.rindex(")") + 2 :].split()[19]
+    except (OSError, ValueError, IndexError):
+        pass
+    if pid != os.getpid():
+        return None
+    if _local_identity[0] != pid:
+        _local_identity = (pid, "uuid:" + uuid.uuid4().hex)
+    return _local_identity[1]
+
+
+def _worker_alive(pid: Optional[int], identity: Optional[str]) -> bool:
+    """작업을 가져간 작업자 프로세스가 아직 살아 있는지 (pid가 같아도 다른 프로세스면 False)"""
+    if not _pid_alive(pid):
+        return False
+    current = _process_identity(pid)
+    if current is None or identity is None:
+        return True
+    return current == identity
+
+
+class SQLiteJobQueue:
+    """SQLite 작업 큐
+
+    외부 브로커 없이 작업을 파일에 저장하므로 서버가 재시작되어도 대기 중인 작업이 남는다.
+    claim은 BEGIN IMMEDIATE 트랜잭션 안에서 (lane, created_at) 순서로 가장 앞의 대기 작업을 가져가므로,
+    같은 파일을 쓰는 여러 작업자 프로세스가 동시에 호출해도 한 작업은 한 작업자만 실행한다.
+    """
+
+    def __init__(
+        self, db_path: str = JOB_DB_PATH, ttl_seconds: int = JOB_TTL_SECONDS
+    ) -> None:
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        self._submits_since_prune = 0
+
+    def _get_conn(self) -> sqlite3.Connection:
+        # fork로 물려받은 연결은 부모와 공유하면 안 되므로 프로세스마다 새로 연다
+        if self._conn is not None and self._conn_pid != os.getpid():
+            self._conn = None
+        if self._conn is None:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # 트랜잭션은 claim에서만 명시적으로 연다 (나머지 문장은 자동 커밋)
+            conn = sqlite3.connect(
+                self.db_path, check_same_thread=False, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "job_id TEXT PRIMARY KEY, kind TEXT NOT NULL, priority TEXT NOT NULL, "
+                "lane INTEGER NOT NULL, status TEXT NOT NULL, payload TEXT NOT NULL, "
+                "result TEXT, error TEXT, progress_done INTEGER NOT NULL DEFAULT 0, "
+                "progress_total INTEGER NOT NULL, cancel_requested INTEGER NOT NULL DEFAULT 0, "
+                "worker_pid INTEGER, worker_identity TEXT, created_at REAL NOT NULL, "
+                "started_at REAL, finished_at REAL)"
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+            if "worker_identity" not in columns:
+                conn.execute("ALTER TABLE jobs ADD COLUMN worker_identity TEXT")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_jobs_queue "
+                "ON jobs (status, lane, created_at)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_jobs_finished ON jobs (finished_at)"
+            )
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    @staticmethod
+    def _info(row: Optional[tuple]) -> Optional[Dict[str, Any]]:
+        if row is None:
+            return None
+        job = dict(zip(_COLUMNS, row))
+        job["progress"] = {
+            "done": job.pop("progress_done"),
+            "total": job.pop("progress_total"),
+        }
+        return job
+
+    def _fetch(self, conn: sqlite3.Connection, job_id: str) -> Optional[Dict[str, Any]]:
+        return self._info(
+            conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        )
+
+    def submit(
+        self, kind: str, priority: str, payload: Dict[str, Any], total: int
+    ) -> Dict[str, Any]:
+        """작업 추가 (일정 제출마다 보관 기간이 지난 완료 작업 삭제)"""
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            conn = self._get_conn()
+            conn.execute(
+                "INSERT INTO jobs (job_id, kind, priority, lane, status, payload, "
+                "progress_total, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job_id,
+                    kind,
+                    priority,
+                    PRIORITY_LANES[priority],
+                    JobStatus.QUEUED.value,
+                    json.dumps(payload, ensure_ascii=False),
+                    total,
+                    time.time(),
+                ),
+            )
+            self._submits_since_prune += 1
+            if self._submits_since_prune >= _PRUNE_INTERVAL:
+                self._submits_since_prune = 0
+                self._prune(conn)
+            return self._fetch(conn, job_id)
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        conn.execute(
+            "DELETE FROM jobs WHERE job_id IN (SELECT job_id FROM jobs "
+            "WHERE finished_at < ? LIMIT ?)",
+            (time.time() - self.ttl_seconds, _PRUNE_BATCH),
+        )
+
+    def claim(self, lanes: Optional[List[int]] = None) -> Optional[Dict[str, Any]]:
+        """우선순위가 가장 높은 대기 작업을 실행 중으로 바꾸고 payload와 함께 반환 (없으면 None)"""
+        lane_filter = ""
+        params: List[Any] = [JobStatus.QUEUED.value]
+        if lanes is not None:
+            lane_filter = f" AND lane IN ({', '.join('?' for _ in lanes)})"
+            params.extend(lanes)
+
+        with self._lock:
+            conn = self._get_conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    f"SELECT job_id, payload FROM jobs WHERE status = ?{lane_filter} "
+                    "ORDER BY lane, created_at LIMIT 1",
+                    params,
+                ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+                conn.execute(
+                    "UPDATE jobs SET status = ?, worker_pid = ?, worker_identity = ?, "
+                    "started_at = ? WHERE job_id = ?",
+                    (
+                        JobStatus.RUNNING.value,
+                        os.getpid(),
+                        _process_identity(os.getpid()),
+                        time.time(),
+                        row[0],
+                    ),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            job = self._fetch(conn, row[0])
+        job["payload"] = json.loads(row[1])
+        return job
+
+    def update_progress(self, job_id: str, done: int) -> None:
+        with self._lock:
+            self._get_conn().execute(
+                "UPDATE jobs SET progress_done = ? WHERE job_id = ?", (done, job_id)
+            )
+
+    def finish(
+        self,
+        job_id: str,
+        status: JobStatus,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """실행 중인 작업을 완료 상태로 변경 (성공하면 진행 상황을 전체 항목 수로 맞춤)"""
+        with self._lock:
+            self._get_conn().execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?, "
+                "progress_done = CASE WHEN ? THEN progress_total ELSE progress_done END "
+                "WHERE job_id = ? AND status = ?",
+                (
+                    status.value,
+                    json.dumps(result, ensure_ascii=False) if result is not None else None,
+                    error,
+                    time.time(),
+                    status == JobStatus.SUCCEEDED,
+                    job_id,
+                    JobStatus.RUNNING.value,
+                ),
+            )
+
+    def requeue(self, job_id: str) -> None:
+        """실행 중인 작업을 처음부터 다시 실행하도록 대기 상태로 되돌림"""
+        with self._lock:
+            self._get_conn().execute(
+                "UPDATE jobs SET status = ?, worker_pid = NULL, worker_identity = NULL, "
+                "started_at = NULL, progress_done = 0 WHERE job_id = ? AND status = ?",
+                (JobStatus.QUEUED.value, job_id, JobStatus.RUNNING.value),
+            )
+
+    def recover(self) -> int:
+        """종료된 프로세스가 실행하던 작업을 대기 상태로 되돌리고 그 수를 반환 (취소 요청된 작업은 취소 처리)
+
+        pid가 살아 있어도 프로세스 시작 시각이 기록과 다르면 (재시작 후 pid 재사용) 종료된 것으로 본다.
+        작업자를 시작하기 전에 호출하므로 이 프로세스의 pid로 기록된 작업도 이전 실행이 남긴 것으로 본다.
+        """
+        with self._lock:
+            conn = self._get_conn()
+            rows = conn.execute(
+                "SELECT job_id, worker_pid, worker_identity, cancel_requested FROM jobs "
+                "WHERE status = ?",
+                (JobStatus.RUNNING.value,),
+            ).fetchall()
+        recovered = 0
+        for job_id, worker_pid, worker_identity, cancel_requested in rows:
+            if worker_pid != os.getpid() and _worker_alive(worker_pid, worker_identity):
+                continue
+            if cancel_requested:
+                self.finish(job_id, JobStatus.CANCELLED)
+            else:
+                self.requeue(job_id)
+                recovered += 1
+        return recovered
+
+    def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """대기 작업은 바로 취소하고, 실행 중인 작업은 취소를 요청 (작업이 없으면 None)"""
+        with self._lock:
+            conn = self._get_conn()
+            conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ? WHERE job_id = ? AND status = ?",
+                (JobStatus.CANCELLED.value, time.time(), job_id, JobStatus.QUEUED.value),
+            )
+            conn.execute(
+                "UPDATE jobs SET cancel_requested = 1 WHERE job_id = ? AND status = ?",
+                (job_id, JobStatus.RUNNING.value),
+            )
+            return self._fetch(conn, job_id)
+
+    def is_cancel_requested(self, job_id: str) -> bool:
+        with self._lock:
+            row = (
+                self._get_conn()
+                .execute("SELECT cancel_requested FROM jobs WHERE job_id = ?", (job_id,))
+                .fetchone()
+            )
+        return bool(row and row[0])
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._fetch(self._get_conn(), job_id)
+
+    def get_result(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 정보와 결과 (작업이 없으면 None, 완료 전이면 result는 None)"""
+        with self._lock:
+            conn = self._get_conn()
+            job = self._fetch(conn, job_id)
+            if job is None:
+                return None
+            row = conn.execute(
+                "SELECT result FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        job["result"] = json.loads(row[0]) if row and row[0] else None
+        return job
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            rows = (
+                self._get_conn()
+                .execute(
+                    "SELECT status, priority, COUNT(*) FROM jobs GROUP BY status, priority"
+                )
+                .fetchall()
+            )
+        counts: Dict[str, int] = {}
+        queued: Dict[str, int] = {}
+        for status, priority, count in rows:
+            counts[status] = counts.get(status, 0) + count
+            if status == JobStatus.QUEUED.value:
+                queued[priority] = count
+        return {
+            "backend": "sqlite",
+            "jobs": counts,
+            "queued_by_priority": queued,
+            "finished": sum(counts.get(status, 0) for status in FINISHED_JOB_STATUSES),
+        }
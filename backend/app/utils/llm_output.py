@@ -0,0 +1,24 @@
+import json
+import re
+from typing import Any
+
+_CODE_FENCE_PATTERN = re.compile(r"^```[a-zA-Z]*\s*|\s*```$")
+_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z][A-Za-z0-9]*$")
+
+# 식별자로 허용하는 최대 길이 (설명문이 섞인 응답 차단)
+MAX_IDENTIFIER_LENGTH = 80
+
+
+def parse_json_response(content: str) -> Any:
+    """LLM 응답에서 JSON 파싱 (마크다운 코드 펜스 허용, 실패 시 ValueError)"""
+    stripped = _CODE_FENCE_PATTERN.sub("", content.strip())
+    return json.loads(stripped)
+
+
+def is_identifier(value: Any) -> bool:
+    """영문자로 시작하는 영숫자 식별자인지 여부"""
+    return (
+        isinstance(value, str)
+        and len(value) <= MAX_IDENTIFIER_LENGTH
+        and _IDENTIFIER_PATTERN.match(value) is not None
+    )
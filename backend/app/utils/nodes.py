@@ -1,62 +1,58 @@
-from typing import List
-from langchain_core.messages import HumanMessage, AIMessage
-from ..schemas.variable import State, is_korean, CaseStyle, InputType
-from .tools import classify_input_type, smart_case_convert
-from ..services.translation_service import TranslationService
+from langchain_core.messages import AIMessage
+from langgraph.config import get_stream_writer
+from ..schemas.state import State
+from ..schemas.variable import is_korean, CaseStyle
+from .formatting import MessageFormatter, convert_abbreviations, convert_concept
+from .tracing import traced
+from ..services.dictionary_service import DictionaryService
+from ..services.translation_service import TRANSLATION_ERROR
+from ..services.word_analysis_service import WordAnalysisService
 from ..services.text_processing_service import (
     AbbreviationService,
     TextProcessingService,
 )
 
 
-class MessageFormatter:
-    """메시지 포맷팅 유틸리티"""
-
-    @staticmethod
-    def format_word_result(
-        original_word: str,
-        translated_word: str,
-        abbreviations: List[str],
-        is_korean: bool,
-        case_style: CaseStyle,
-    ) -> str:
-        """단어 결과 메시지 포맷팅"""
-        abbrev_text = ", ".join(abbreviations) if abbreviations else "없음"
-        case_style_text = f" ({case_style.value})"
-
-        if is_korean:
-            return f"'{original_word}' → '{translated_word}' 약어{case_style_text}: {abbrev_text}"
-        else:
-            return f"'{original_word}' 약어{case_style_text}: {abbrev_text}"
-
-    @staticmethod
-    def format_text_result(original_text: str, processed_result: str) -> str:
-        """텍스트 결과 메시지 포맷팅"""
-        return f"텍스트 분석 결과:\n{processed_result}"
-
-
-def word_node(state: State) -> State:
+@traced("node.word")
+async def word_node(state: State) -> State:
     """단어 처리 노드"""
     original_input = state["current_input"]
     state["is_korean"] = is_korean(original_input)
     case_style = state.get("selected_case_style", CaseStyle.CAMEL_CASE)
 
-    # 번역 처리
+    # 번역 처리 (사전 우선, 모드에 따라 LLM 사용)
+    camel_abbreviations = None
     if state["is_korean"]:
-        state["translated_word"] = TranslationService.translate_to_english(
-            original_input
-        )
+        translated_word = None
+        if DictionaryService.use_dictionary():
+            translated_word = DictionaryService.lookup_translation(original_input)
+        if translated_word is None:
+            if DictionaryService.use_llm():
+                # 통합/추측 모드에서는 약어까지 함께 받아올 수 있음
+                analysis = await WordAnalysisService.aanalyze_korean_word(original_input)
+                translated_word, camel_abbreviations = analysis
+            else:
+                translated_word = TRANSLATION_ERROR
+        state["translated_word"] = translated_word
     else:
         state["translated_word"] = original_input
 
     # 약어 생성 (camelCase로 받고 케이스 스타일 적용)
-    camel_abbreviations = AbbreviationService.generate_abbreviations(
-        state["translated_word"]
+    if camel_abbreviations is None and DictionaryService.use_dictionary():
+        camel_abbreviations = DictionaryService.lookup_abbreviations(
+            state["translated_word"]
+        )
+    if camel_abbreviations is None:
+        if DictionaryService.use_llm() and state["translated_word"] != TRANSLATION_ERROR:
+            camel_abbreviations = await AbbreviationService.agenerate_abbreviations(
+                state["translated_word"]
+            )
+        else:
+            camel_abbreviations = []
+    state["camel_abbreviations"] = camel_abbreviations
+    state["abbreviations"] = convert_abbreviations(
+        state["camel_abbreviations"], case_style
     )
-    state["abbreviations"] = [
-        smart_case_convert.invoke({"text": abbr, "case_style": case_style.value})
-        for abbr in camel_abbreviations
-    ]
 
     # 결과 메시지 생성
     result_msg = MessageFormatter.format_word_result(
@@ -71,50 +67,25 @@ def word_node(state: State) -> State:
     return state
 
 
-def text_node(state: State) -> State:
+@traced("node.text")
+async def text_node(state: State) -> State:
     """텍스트 처리 노드"""
     original_input = state["current_input"]
     case_style = state.get("selected_case_style", CaseStyle.CAMEL_CASE)
 
-    # camelCase로 받고 케이스 스타일 적용
-    camel_result = TextProcessingService.process_text(original_input)
+    # camelCase로 받고 케이스 스타일 적용, 검증된 개념은 즉시 스트림으로 내보냄
+    write = get_stream_writer()
+    camel_concepts = []
+    concepts = []
+    async for camel_concept in TextProcessingService.astream_concepts(original_input):
+        concept = convert_concept(camel_concept, case_style)
+        camel_concepts.append(camel_concept)
+        concepts.append(concept)
+        write({"concept": concept})
 
-    lines = camel_result.split("\n")
-    converted_lines = []
+    state["camel_concepts"] = camel_concepts
+    state["concepts"] = concepts
 
-    for line in lines:
-        if ":" in line:
-            concept, variants = line.split(":", 1)
-            variant_list = [v.strip() for v in variants.split(",")]
-            converted_variants = [
-                smart_case_convert.invoke({"text": v, "case_style": case_style.value})
-                for v in variant_list
-            ]
-            converted_lines.append(
-                f"{concept.strip()}: {', '.join(converted_variants)}"
-            )
-        else:
-            converted_lines.append(line)
-
-    processed_result = "\n".join(converted_lines)
-    state["processed_text"] = processed_result
-
-    result_msg = MessageFormatter.format_text_result(original_input, processed_result)
+    result_msg = MessageFormatter.format_text_result(original_input, concepts)
     state["messages"].append(AIMessage(content=result_msg))
     return state
-
-
-def chatbot_node(state: State) -> State:
-    """메인 챗봇 노드 - 입력 분류 및 상태 설정"""
-    last_message = state["messages"][-1]
-
-    if not isinstance(last_message, HumanMessage):
-        return state
-
-    original_input = last_message.content.strip()
-    state["current_input"] = original_input
-    input_type_result = classify_input_type.invoke({"text": original_input})
-
-    state["input_type"] = InputType(input_type_result)
-
-    return state
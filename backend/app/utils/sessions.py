@@ -0,0 +1,349 @@
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config.settings import (
+    HISTORY_TTL_SECONDS,
+    SESSION_BACKEND,
+    SESSION_DB_PATH,
+    SESSION_MAX_PER_OWNER,
+    SESSION_MEMORY_MAX_OWNERS,
+)
+
+# 만료 세션 정리를 수행하는 생성 주기와 한 번에 정리하는 최대 세션 수
+_PRUNE_INTERVAL = 256
+_PRUNE_BATCH = 1000
+
+_COLUMNS = ("session_id", "owner_id", "title", "thread_id", "created_at", "updated_at")
+
+
+def _new_session(owner_id: str, title: str, now: float) -> Dict[str, Any]:
+    session_id = uuid.uuid4().hex
+    return {
+        "session_id": session_id,
+        "owner_id": owner_id,
+        "title": title,
+        "thread_id": f"thread_{session_id}",
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+class SessionStore:
+    """사용자별 채팅 세션 목록 저장소 인터페이스
+
+    세션은 제목과 thread_id만 가지며, 메시지는 thread_id로 히스토리 저장소에 저장된다.
+    list는 최근에 사용한 세션부터 돌려주고, touch는 thread_id로 세션의 사용 시각을 갱신한다.
+    """
+
+    name = "base"
+
+    def create(self, owner_id: str, title: str) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def list(
+        self, owner_id: str, limit: int, offset: int = 0
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """(세션 목록, 다음 페이지가 있는지 여부)"""
+        raise NotImplementedError
+
+    def update_title(self, session_id: str, title: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def touch(self, thread_id: str) -> None:
+        raise NotImplementedError
+
+    def delete(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """세션 삭제 (삭제한 세션, 없으면 None)"""
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+
+class SQLiteSessionStore(SessionStore):
+    """SQLite 세션 저장소
+
+    (owner_id, updated_at) 인덱스로 사용자별 목록을 조회하고, 사용자당 세션 수를 제한한다.
+    일정 생성마다 TTL이 지난 세션을 삭제한다.
+    """
+
+    name = "sqlite"
+
+    def __init__(
+        self,
+        db_path: str = SESSION_DB_PATH,
+        max_per_owner: int = SESSION_MAX_PER_OWNER,
+        ttl_seconds: int = HISTORY_TTL_SECONDS,
+    ) -> None:
+        self.db_path = db_path
+        self.max_per_owner = max_per_owner
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        self._creates_since_prune = 0
+
+    def _get_conn(self) -> sqlite3.Connection:
+        # fork로 물려받은 연결은 부모와 공유하면 안 되므로 프로세스마다 새로 연다
+        if self._conn is not None and self._conn_pid != os.getpid():
+            self._conn = None
+        if self._conn is None:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS chat_sessions ("
+                "session_id TEXT PRIMARY KEY, owner_id TEXT NOT NULL, "
+                "title TEXT NOT NULL, thread_id TEXT NOT NULL UNIQUE, "
+                "created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_chat_sessions_owner "
+                "ON chat_sessions (owner_id, updated_at)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_chat_sessions_updated "
+                "ON chat_sessions (updated_at)"
+            )
+            conn.commit()
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    @staticmethod
+    def _row(row: Optional[tuple]) -> Optional[Dict[str, Any]]:
+        return dict(zip(_COLUMNS, row)) if row is not None else None
+
+    def _fetch(self, conn: sqlite3.Connection, session_id: str) -> Optional[Dict[str, Any]]:
+        return self._row(
+            conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM chat_sessions WHERE session_id = ?",
+                (session_id,),
+            ).fetchone()
+        )
+
+    def create(self, owner_id: str, title: str) -> Dict[str, Any]:
+        """세션 생성 (사용자당 세션 수 제한을 넘으면 가장 오래 사용하지 않은 세션부터 삭제)"""
+        now = time.time()
+        session = _new_session(owner_id, title, now)
+        with self._lock:
+            conn = self._get_conn()
+            conn.execute(
+                f"INSERT INTO chat_sessions ({', '.join(_COLUMNS)}) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                tuple(session[column] for column in _COLUMNS),
+            )
+            conn.execute(
+                "DELETE FROM chat_sessions WHERE session_id IN ("
+                "SELECT session_id FROM chat_sessions WHERE owner_id = ? "
+                "ORDER BY updated_at DESC LIMIT -1 OFFSET ?)",
+                (owner_id, self.max_per_owner),
+            )
+            conn.commit()
+
+            self._creates_since_prune += 1
+            if self._creates_since_prune >= _PRUNE_INTERVAL:
+                self._creates_since_prune = 0
+                conn.execute(
+                    "DELETE FROM chat_sessions WHERE session_id IN ("
+                    "SELECT session_id FROM chat_sessions WHERE updated_at <= ? LIMIT ?)",
+                    (now - self.ttl_seconds, _PRUNE_BATCH),
+                )
+                conn.commit()
+        return session
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            session = self._fetch(self._get_conn(), session_id)
+        if session is None or session["updated_at"] <= time.time() - self.ttl_seconds:
+            return None
+        return session
+
+    def list(
+        self, owner_id: str, limit: int, offset: int = 0
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        with self._lock:
+            rows = (
+                self._get_conn()
+                .execute(
+                    f"SELECT {', '.join(_COLUMNS)} FROM chat_sessions "
+                    "WHERE owner_id = ? AND updated_at > ? "
+                    "ORDER BY updated_at DESC LIMIT ? OFFSET ?",
+                    (owner_id, time.time() - self.ttl_seconds, limit + 1, offset),
+                )
+                .fetchall()
+            )
+        return [self._row(row) for row in rows[:limit]], len(rows) > limit
+
+    def update_title(self, session_id: str, title: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            conn = self._get_conn()
+            conn.execute(
+                "UPDATE chat_sessions SET title = ?, updated_at = ? WHERE session_id = ?",
+                (title, time.time(), session_id),
+            )
+            conn.commit()
+            return self._fetch(conn, session_id)
+
+    def touch(self, thread_id: str) -> None:
+        with self._lock:
+            conn = self._get_conn()
+            conn.execute(
+                "UPDATE chat_sessions SET updated_at = ? WHERE thread_id = ?",
+                (time.time(), thread_id),
+            )
+            conn.commit()
+
+    def delete(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            conn = self._get_conn()
+            session = self._fetch(conn, session_id)
+            if session is not None:
+                conn.execute("DELETE FROM chat_sessions WHERE session_id = ?", (session_id,))
+                conn.commit()
+        return session
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            owners, sessions = (
+                self._get_conn()
+                .execute("SELECT COUNT(DISTINCT owner_id), COUNT(*) FROM chat_sessions")
+                .fetchone()
+            )
+        return {"backend": self.name, "owners": owners, "sessions": sessions}
+
+
+class MemorySessionStore(SessionStore):
+    """프로세스 메모리 세션 저장소 (개발/테스트용)
+
+    사용자 수와 사용자당 세션 수를 모두 제한하며, 사용자 수를 넘으면 가장 오래 활동하지 않은 사용자를 버린다.
+    """
+
+    name = "memory"
+
+    def __init__(
+        self,
+        max_per_owner: int = SESSION_MAX_PER_OWNER,
+        ttl_seconds: int = HISTORY_TTL_SECONDS,
+        max_owners: int = SESSION_MEMORY_MAX_OWNERS,
+    ) -> None:
+        self.max_per_owner = max_per_owner
+        self.ttl_seconds = ttl_seconds
+        self.max_owners = max_owners
+        # 사용자별 세션은 최근 사용 순서(마지막이 최신)로 유지
+        self._owners: "OrderedDict[str, OrderedDict[str, Dict[str, Any]]]" = OrderedDict()
+        self._sessions: Dict[str, Dict[str, Any]] = {}
+        self._threads: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _remove(self, session: Dict[str, Any]) -> None:
+        self._sessions.pop(session["session_id"], None)
+        self._threads.pop(session["thread_id"], None)
+        owned = self._owners.get(session["owner_id"])
+        if owned is not None:
+            owned.pop(session["session_id"], None)
+            if not owned:
+                del self._owners[session["owner_id"]]
+
+    def _bump(self, session: Dict[str, Any]) -> None:
+        session["updated_at"] = time.time()
+        self._owners.move_to_end(session["owner_id"])
+        self._owners[session["owner_id"]].move_to_end(session["session_id"])
+
+    def create(self, owner_id: str, title: str) -> Dict[str, Any]:
+        session = _new_session(owner_id, title, time.time())
+        with self._lock:
+            owned = self._owners.setdefault(owner_id, OrderedDict())
+            owned[session["session_id"]] = session
+            self._owners.move_to_end(owner_id)
+            self._sessions[session["session_id"]] = session
+            self._threads[session["thread_id"]] = session["session_id"]
+            while len(owned) > self.max_per_owner:
+                self._remove(next(iter(owned.values())))
+            while len(self._owners) > self.max_owners:
+                _, evicted = self._owners.popitem(last=False)
+                for stale in list(evicted.values()):
+                    self._remove(stale)
+        return dict(session)
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None or session["updated_at"] <= time.time() - self.ttl_seconds:
+                return None
+            return dict(session)
+
+    def list(
+        self, owner_id: str, limit: int, offset: int = 0
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        expires_before = time.time() - self.ttl_seconds
+        with self._lock:
+            owned = self._owners.get(owner_id)
+            if owned is None:
+                return [], False
+            sessions = []
+            for session in reversed(owned.values()):
+                if session["updated_at"] <= expires_before:
+                    break
+                sessions.append(session)
+                if len(sessions) > offset + limit:
+                    break
+            page = [dict(session) for session in sessions[offset : offset + limit]]
+            return page, len(sessions) > offset + limit
+
+    def update_title(self, session_id: str, title: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                return None
+            session["title"] = title
+            self._bump(session)
+            return dict(session)
+
+    def touch(self, thread_id: str) -> None:
+        with self._lock:
+            session_id = self._threads.get(thread_id)
+            if session_id is not None:
+                self._bump(self._sessions[session_id])
+
+    def delete(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._remove(session)
+            return session
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "backend": self.name,
+                "owners": len(self._owners),
+                "sessions": len(self._sessions),
+            }
+
+
+_BACKENDS = {
+    SQLiteSessionStore.name: SQLiteSessionStore,
+    MemorySessionStore.name: MemorySessionStore,
+}
+
+
+def create_session_store(name: str = SESSION_BACKEND) -> SessionStore:
+    """설정된 이름의 세션 저장소 생성"""
+    try:
+        return _BACKENDS[name]()
+    except KeyError:
+        raise ValueError(
+            f"알 수 없는 SESSION_BACKEND: {name} (사용 가능: {', '.join(_BACKENDS)})"
+        )
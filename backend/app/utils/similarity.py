@@ -0,0 +1,173 @@
+import re
+import threading
+from collections import Counter, OrderedDict
+from typing import Any, Dict, FrozenSet, Optional, Set, Tuple
+
+from ..config.settings import (
+    CACHE_ENABLED,
+    SIMILARITY_CACHE_ENABLED,
+    SIMILARITY_CACHE_MAX_ENTRIES,
+    SIMILARITY_CACHE_NGRAM,
+    SIMILARITY_CACHE_THRESHOLD,
+)
+from .cache import normalize_cache_input
+from .tracing import record_cache_lookup
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# 요청 문구 앞의 목적어에 붙는 조사 (남는 어간이 두 글자 이상일 때만 제거)
+_OBJECT_PARTICLES = ("을", "를")
+
+# 프롬프트에서 LLM에게 무시하라고 하는 요청 문구 (용어의 일부일 수 있는 명사는 넣지 않음)
+_FILLER_WORDS = frozenset(
+    {
+        "변수", "변수로", "변수를", "변수들", "좀", "부탁해", "부탁해요", "부탁합니다",
+        "만들어", "만들기", "생성", "해줘", "해줘요", "해주세요", "주세요",
+        "please", "make", "create", "variable", "variables",
+    }
+)
+_REQUEST_ENDING = re.compile(r"[어아해](주세요|줘요?|주십시오|줄래요?|주실래요?)$")
+
+
+def _strip_object_particle(token: str) -> str:
+    for particle in _OBJECT_PARTICLES:
+        if token.endswith(particle) and len(token) - len(particle) >= 2:
+            return token[: -len(particle)]
+    return token
+
+
+def similarity_key(text: str) -> str:
+    """유사도 비교용 정규화 (요청 문구를 지우고, 요청 문구 바로 앞 단어의 목적격 조사만 제거)"""
+    words = []
+    for token in _TOKEN_PATTERN.findall(normalize_cache_input(text)):
+        if token in _FILLER_WORDS or _REQUEST_ENDING.search(token):
+            # "감면을 변수로 만들어주세요"의 "감면을"처럼 요청 대상 단어에만 조사가 붙음
+            if words:
+                words[-1] = _strip_object_particle(words[-1])
+            continue
+        words.append(token)
+    return " ".join(words)
+
+
+def char_ngrams(key: str, n: int = SIMILARITY_CACHE_NGRAM) -> FrozenSet[str]:
+    """띄어쓰기를 무시한 문자 n-gram 집합"""
+    compact = key.replace(" ", "")
+    if len(compact) <= n:
+        return frozenset([compact]) if compact else frozenset()
+    return frozenset(compact[i : i + n] for i in range(len(compact) - n + 1))
+
+
+class SimilarTextIndex:
+    """정규화한 텍스트의 문자 n-gram 역색인
+
+    조회 시 n-gram을 공유하는 항목만 후보로 세어 자카드 유사도를 계산하므로 비용은 전체 항목 수가 아니라
+    겹치는 후보 수에 비례한다. 항목 수를 넘으면 가장 오래 사용하지 않은 항목부터 버린다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        threshold: float = SIMILARITY_CACHE_THRESHOLD,
+        max_entries: int = SIMILARITY_CACHE_MAX_ENTRIES,
+        enabled: bool = SIMILARITY_CACHE_ENABLED and CACHE_ENABLED,
+    ) -> None:
+        self.name = name
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.enabled = enabled
+
+        self._entries: "OrderedDict[str, Tuple[FrozenSet[str], Any]]" = OrderedDict()
+        self._postings: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        self._stats = {"exact_hits": 0, "similar_hits": 0, "misses": 0, "evictions": 0}
+
+    def _best_match(self, grams: FrozenSet[str]) -> Tuple[Optional[str], float]:
+        overlaps: Counter = Counter()
+        for gram in grams:
+            overlaps.update(self._postings.get(gram, ()))
+
+        best_key, best_score = None, 0.0
+        for key, overlap in overlaps.items():
+            other = self._entries[key][0]
+            score = overlap / (len(grams) + len(other) - overlap)
+            if score > best_score:
+                best_key, best_score = key, score
+        return best_key, best_score
+
+    def lookup(self, text: str) -> Optional[Any]:
+        """같거나 임계값 이상으로 비슷한 텍스트의 값 조회 (없으면 None)"""
+        if not self.enabled:
+            return None
+
+        key = similarity_key(text)
+        if not key:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._stats["exact_hits"] += 1
+            else:
+                match, score = self._best_match(char_ngrams(key))
+                if match is not None and score >= self.threshold:
+                    key, entry = match, self._entries[match]
+                    self._stats["similar_hits"] += 1
+                else:
+                    self._stats["misses"] += 1
+
+            record_cache_lookup(self.name, entry is not None)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def add(self, text: str, value: Any) -> None:
+        """텍스트와 값 저장"""
+        if not self.enabled:
+            return
+
+        key = similarity_key(text)
+        if not key:
+            return
+
+        with self._lock:
+            self._remove(key)
+            grams = char_ngrams(key)
+            self._entries[key] = (grams, value)
+            for gram in grams:
+                self._postings.setdefault(gram, set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self._stats["evictions"] += 1
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for gram in entry[0]:
+            keys = self._postings.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[gram]
+
+    def clear(self) -> None:
+        """모든 항목 삭제"""
+        with self._lock:
+            self._entries.clear()
+            self._postings.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """히트/미스 카운터 및 크기"""
+        with self._lock:
+            hits = self._stats["exact_hits"] + self._stats["similar_hits"]
+            lookups = hits + self._stats["misses"]
+            return {
+                "name": self.name,
+                **self._stats,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "grams": len(self._postings),
+                "threshold": self.threshold,
+            }
@@ -0,0 +1,300 @@
+import asyncio
+import functools
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from ..config.settings import TRACING_ENABLED
+
+# 구간 시간 히스토그램 버킷 (초)
+_DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_METRIC_PREFIX = "variable_maker_"
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _escape_label(value: str) -> str:
+    """Prometheus 레이블 값 이스케이프"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsRegistry:
+    """Prometheus 텍스트 형식으로 내보내는 프로세스 단위 카운터/히스토그램 저장소"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._help: Dict[str, Tuple[str, str]] = {}
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, List[float]]] = {}
+        self._callbacks: Dict[str, Callable[[], float]] = {}
+
+    def describe(self, name: str, metric_type: str, help_text: str) -> None:
+        """지표 타입과 설명 등록"""
+        self._help[name] = (metric_type, help_text)
+
+    def inc(self, name: str, labels: Dict[str, str], value: float = 1) -> None:
+        """카운터 증가"""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, labels: Dict[str, str], value: float) -> None:
+        """히스토그램에 값 기록 (버킷별 개수, 합계, 개수)"""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            buckets = series.get(key)
+            if buckets is None:
+                buckets = series[key] = [0.0] * (len(_DURATION_BUCKETS) + 2)
+            for index, bound in enumerate(_DURATION_BUCKETS):
+                if value <= bound:
+                    buckets[index] += 1
+            buckets[-2] += value
+            buckets[-1] += 1
+
+    def register_gauge(self, name: str, help_text: str, fn: Callable[[], float]) -> None:
+        """내보낼 때마다 fn으로 값을 읽는 게이지 등록"""
+        self.describe(name, "gauge", help_text)
+        self._callbacks[name] = fn
+
+    def register_counter(self, name: str, help_text: str, fn: Callable[[], float]) -> None:
+        """내보낼 때마다 fn으로 누적 값을 읽는 카운터 등록 (fn은 줄어들지 않는 값을 반환해야 함)"""
+        self.describe(name, "counter", help_text)
+        self._callbacks[name] = fn
+
+    def reset(self) -> None:
+        """기록된 값 초기화 (등록된 설명과 게이지/콜백 카운터는 유지)"""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    @staticmethod
+    def _format_labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+        items = list(labels) + ([extra] if extra else [])
+        if not items:
+            return ""
+        return "{" + ",".join(f'{key}="{_escape_label(value)}"' for key, value in items) + "}"
+
+    def _header(self, lines: List[str], name: str, default_type: str) -> None:
+        metric_type, help_text = self._help.get(name, (default_type, ""))
+        full_name = _METRIC_PREFIX + name
+        lines.append(f"# HELP {full_name} {help_text}")
+        lines.append(f"# TYPE {full_name} {metric_type}")
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식 (0.0.4)"""
+        lines: List[str] = []
+        with self._lock:
+            counters = {name: dict(series) for name, series in self._counters.items()}
+            histograms = {
+                name: {key: list(values) for key, values in series.items()}
+                for name, series in self._histograms.items()
+            }
+
+        for name, series in sorted(counters.items()):
+            self._header(lines, name, "counter")
+            for labels, value in sorted(series.items()):
+                lines.append(f"{_METRIC_PREFIX}{name}{self._format_labels(labels)} {value:g}")
+
+        for name, series in sorted(histograms.items()):
+            self._header(lines, name, "histogram")
+            full_name = _METRIC_PREFIX + name
+            for labels, values in sorted(series.items()):
+                for bound, count in zip(_DURATION_BUCKETS, values):
+                    le = self._format_labels(labels, ("le", f"{bound:g}"))
+                    lines.append(f"{full_name}_bucket{le} {count:g}")
+                inf = self._format_labels(labels, ("le", "+Inf"))
+                lines.append(f"{full_name}_bucket{inf} {values[-1]:g}")
+                lines.append(f"{full_name}_sum{self._format_labels(labels)} {values[-2]:.6f}")
+                lines.append(f"{full_name}_count{self._format_labels(labels)} {values[-1]:g}")
+
+        for name, fn in sorted(self._callbacks.items()):
+            self._header(lines, name, "gauge")
+            lines.append(f"{_METRIC_PREFIX}{name} {fn():g}")
+
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+metrics.describe("http_requests_total", "counter", "HTTP 요청 수")
+metrics.describe("http_request_duration_seconds", "histogram", "HTTP 요청 처리 시간")
+metrics.describe("span_duration_seconds", "histogram", "그래프 노드/LLM 호출 구간 시간")
+metrics.describe("llm_calls_total", "counter", "LLM 호출 수 (재시도 포함 호출 단위)")
+metrics.describe("llm_retries_total", "counter", "LLM 호출 재시도 수")
+metrics.describe("llm_tokens_total", "counter", "LLM 입력/출력 토큰 수")
+metrics.describe("cache_requests_total", "counter", "캐시 조회 수 (hit/miss)")
+
+
+class RequestTrace:
+    """요청 하나의 구간 시간과 LLM/캐시 카운터"""
+
+    def __init__(self) -> None:
+        self.started_at = time.perf_counter()
+        self.spans: List[Tuple[str, float]] = []
+        self.counters: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def add_span(self, name: str, duration: float) -> None:
+        with self._lock:
+            self.spans.append((name, duration))
+
+    def add(self, counter: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[counter] += value
+
+    def elapsed(self) -> float:
+        """요청 시작 후 경과 시간 (초)"""
+        return time.perf_counter() - self.started_at
+
+    def span_totals(self) -> Dict[str, Tuple[float, int]]:
+        """구간 이름별 (합계 시간, 횟수), 시작 순서 유지"""
+        totals: Dict[str, Tuple[float, int]] = {}
+        with self._lock:
+            for name, duration in self.spans:
+                total, count = totals.get(name, (0.0, 0))
+                totals[name] = (total + duration, count + 1)
+        return totals
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 값 (같은 이름의 구간은 합산)"""
+        entries = [
+            f'{name};dur={total * 1000:.1f};desc="x{count}"'
+            for name, (total, count) in self.span_totals().items()
+        ]
+        entries.append(f"total;dur={self.elapsed() * 1000:.1f}")
+        return ", ".join(entries)
+
+    def summary(self) -> Dict[str, Any]:
+        """로그 출력용 요약"""
+        return {
+            "total_ms": round(self.elapsed() * 1000, 1),
+            "spans": {
+                name: {"ms": round(total * 1000, 1), "count": count}
+                for name, (total, count) in self.span_totals().items()
+            },
+            "counters": dict(self.counters),
+        }
+
+
+_current_trace: ContextVar[Optional[RequestTrace]] = ContextVar(
+    "request_trace", default=None
+)
+
+
+def start_trace() -> Tuple[RequestTrace, Any]:
+    """현재 컨텍스트에 새 요청 추적 시작 (종료 시 end_trace에 토큰 전달)"""
+    trace = RequestTrace()
+    return trace, _current_trace.set(trace)
+
+
+def end_trace(token: Any) -> None:
+    """요청 추적 종료"""
+    _current_trace.reset(token)
+
+
+def current_trace() -> Optional[RequestTrace]:
+    """현재 요청의 추적 (추적 중이 아니면 None)"""
+    return _current_trace.get()
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """구간 시간을 현재 요청 추적과 span_duration_seconds 히스토그램에 기록"""
+    if not TRACING_ENABLED:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - started
+        metrics.observe("span_duration_seconds", {"span": name}, duration)
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.add_span(name, duration)
+
+
+def traced(name: str) -> Callable:
+    """함수 실행 시간을 구간으로 기록하는 데코레이터 (동기/비동기 함수 모두 지원)"""
+
+    def decorator(fn: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with span(name):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def record_llm_call(task: str, outcome: str) -> None:
+    """LLM 호출 결과 기록 (outcome: success, error)"""
+    if not TRACING_ENABLED:
+        return
+    metrics.inc("llm_calls_total", {"task": task, "outcome": outcome})
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add("llm_calls")
+        if outcome != "success":
+            trace.add("llm_errors")
+
+
+def record_llm_retry(task: str) -> None:
+    """LLM 재시도 기록"""
+    if not TRACING_ENABLED:
+        return
+    metrics.inc("llm_retries_total", {"task": task})
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add("llm_retries")
+
+
+def record_llm_usage(task: str, usage: Optional[Dict[str, Any]]) -> None:
+    """응답의 usage_metadata에서 토큰 수 기록"""
+    if not TRACING_ENABLED or not usage:
+        return
+    input_tokens = int(usage.get("input_tokens") or 0)
+    output_tokens = int(usage.get("output_tokens") or 0)
+    metrics.inc("llm_tokens_total", {"task": task, "direction": "input"}, input_tokens)
+    metrics.inc("llm_tokens_total", {"task": task, "direction": "output"}, output_tokens)
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add("llm_input_tokens", input_tokens)
+        trace.add("llm_output_tokens", output_tokens)
+
+
+def record_cache_lookup(namespace: str, hit: bool) -> None:
+    """캐시 조회 결과 기록"""
+    if not TRACING_ENABLED:
+        return
+    result = "hit" if hit else "miss"
+    metrics.inc("cache_requests_total", {"namespace": namespace, "result": result})
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add(f"cache_{result}")
+
+
+def record_http_request(method: str, path: str, status_code: int, duration: float) -> None:
+    """HTTP 요청 수와 처리 시간 기록"""
+    if not TRACING_ENABLED:
+        return
+    metrics.inc(
+        "http_requests_total",
+        {"method": method, "path": path, "status": str(status_code)},
+    )
+    metrics.observe("http_request_duration_seconds", {"path": path}, duration)
@@ -0,0 +1,29 @@
+import io
+
+import pytest
+
+from app.services.bulk_service import BulkFormat, RowReader, read_rows
+
+
+def _read(text: str, fmt: BulkFormat = BulkFormat.CSV, column=None):
+    return list(read_rows(io.StringIO(text, newline=""), RowReader(fmt, column)))
+
+
+def test_csv_stray_quote_does_not_swallow_later_rows():
+    text = 'term,note\n12" pipe,a\n사용자 이름,b\n주문 번호,c\n"db",d\n'
+    assert _read(text) == ['12" pipe', "사용자 이름", "주문 번호", "db"]
+
+
+def test_csv_quoted_newline_and_column():
+    text = 'id,용어\n1,"사용자\n이름"\n\n2,"주문 ""번호"""\n'
+    assert _read(text, column="용어") == ["사용자\n이름", '주문 "번호"']
+
+
+def test_csv_missing_column_is_rejected():
+    with pytest.raises(ValueError):
+        _read("a,b\n1,2\n", column="용어")
+
+
+def test_jsonl_unreadable_rows_keep_their_position():
+    text = '{"input_text": "사용자 이름"}\nnot json\n"주문 번호"\n'
+    assert _read(text, BulkFormat.JSONL) == ["사용자 이름", None, "주문 번호"]
@@ -0,0 +1,52 @@
+import pytest
+
+from app.utils.casing import convert_all_styles, convert_case, split_words
+
+
+@pytest.mark.parametrize(
+    "text, words",
+    [
+        ("HTTPResponse", ("HTTP", "Response")),
+        ("userID", ("user", "ID")),
+        ("user_name", ("user", "name")),
+        ("utf8Encoder", ("utf8", "Encoder")),
+        ("i18n", ("i18n",)),
+        ("l10n", ("l10n",)),
+        ("k8s", ("k8s",)),
+        ("iOS", ("iOS",)),
+        ("iOSVersion", ("iOS", "Version")),
+        ("xAxis", ("x", "Axis")),
+        ("사용자ID", ("사용자", "ID")),
+        ("2fa code", ("2fa", "code")),
+    ],
+)
+def test_split_words(text, words):
+    assert split_words(text) == words
+
+
+@pytest.mark.parametrize("text", ["i18n", "l10n", "k8s"])
+def test_numeronyms_stay_whole(text):
+    assert convert_all_styles([text]) == {
+        "camelCase": [text],
+        "snake_case": [text],
+        "PascalCase": [text.capitalize()],
+        "kebab-case": [text],
+        "CONSTANT_CASE": [text.upper()],
+    }
+
+
+def test_mixed_case_acronym():
+    assert convert_all_styles(["iOS"]) == {
+        "camelCase": ["iOS"],
+        "snake_case": ["ios"],
+        "PascalCase": ["Ios"],
+        "kebab-case": ["ios"],
+        "CONSTANT_CASE": ["IOS"],
+    }
+
+
+def test_acronyms_and_mixed_script():
+    assert convert_case("HTTPResponse", "snake_case") == "http_response"
+    assert convert_case("getURLForIOS", "kebab-case") == "get-url-for-ios"
+    assert convert_case("사용자ID", "CONSTANT_CASE") == "사용자_ID"
+    assert convert_case("사용자 정보", "snake_case") == "사용자_정보"
@@ -0,0 +1,28 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.job_service import job_queue
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    # 작업자를 띄우지 않고 (lifespan 미실행) 임시 작업 큐에 제출만 확인
+    monkeypatch.setattr(job_queue, "db_path", str(tmp_path / "jobs.sqlite3"))
+    monkeypatch.setattr(job_queue, "_conn", None)
+    yield TestClient(app)
+    if job_queue._conn is not None:
+        job_queue._conn.close()
+
+
+def test_submit_process_job_without_case_style(client):
+    response = client.post("/jobs/process", json={"input_text": "사용자 이름"})
+
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] == "queued"
+    assert job["priority"] == "interactive"
+
+    claimed = job_queue.claim()
+    assert claimed["job_id"] == job["job_id"]
+    assert claimed["payload"]["case_style"] == "camelCase"
@@ -0,0 +1,21 @@
+from app.utils.similarity import SimilarTextIndex, similarity_key
+
+
+def test_request_phrasing_is_ignored():
+    assert similarity_key("중소기업 취업자 감면을 변수로 만들어주세요") == similarity_key(
+        "중소기업 취업자 감면 변수 만들어줘"
+    )
+
+
+def test_domain_nouns_are_kept():
+    assert similarity_key("사용자 이름") == "사용자 이름"
+    assert similarity_key("주문 변수명") == "주문 변수명"
+    assert similarity_key("재시도 횟수") == "재시도 횟수"
+
+
+def test_different_nouns_do_not_collide():
+    index = SimilarTextIndex("test", threshold=0.9, max_entries=100, enabled=True)
+    index.add("사용자 변수 만들어줘", {"concepts": ["user"]})
+
+    assert index.lookup("사용자 이름") is None
+    assert index.lookup("사용자를 변수로 만들어주세요") == {"concepts": ["user"]}
@@ -0,0 +1,92 @@
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 벤치마크 입력 (사전에 있는 단어와 없는 단어, 텍스트를 섞어서 구성)
+KOREAN_WORDS = [
+    "사용자", "주문", "결제", "매출", "재고", "세금감면", "소상공인",
+    "배송지", "환불요청", "회원등급", "적립금", "정산내역",
+]
+ENGLISH_WORDS = [
+    "user", "database", "configuration", "error message", "customer account",
+    "payment status", "inventory", "shipping address", "refund request",
+]
+TEXTS = [
+    "고객 주문 금액과 결제 상태를 변수로 만들어주세요",
+    "소상공인 세금 감면 대상 여부와 감면율",
+    "회원 등급별 적립금 지급 내역",
+    "배송지 주소 변경 요청 처리 상태",
+]
+
+WORKLOADS = {
+    "korean_word": KOREAN_WORDS,
+    "english_word": ENGLISH_WORDS,
+    "text": TEXTS,
+    "mixed": KOREAN_WORDS + ENGLISH_WORDS + TEXTS,
+}
+
+
+def setup_environment(cache_enabled: bool = False) -> None:
+    """앱을 임포트하기 전에 벤치마크용 환경 변수와 경로 설정
+
+    설정 값은 임포트 시점에 읽히므로 반드시 app 패키지보다 먼저 호출해야 한다.
+    """
+    os.environ.setdefault("LLM_PROVIDER", "fake")
+    os.environ.setdefault("LLM_RATE_LIMIT_RPM", "0")
+    os.environ["CACHE_ENABLED"] = "true" if cache_enabled else "false"
+    sys.path.insert(0, os.path.join(project_root, "backend"))
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """정렬된 값의 백분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(q / 100 * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize_latencies(latencies: List[float]) -> Dict[str, float]:
+    """지연 시간(초) 목록을 밀리초 단위 요약 통계로 변환"""
+    values = sorted(latencies)
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "mean_ms": statistics.fmean(values) * 1000,
+        "min_ms": values[0] * 1000,
+        "p50_ms": percentile(values, 50) * 1000,
+        "p95_ms": percentile(values, 95) * 1000,
+        "p99_ms": percentile(values, 99) * 1000,
+        "max_ms": values[-1] * 1000,
+    }
+
+
+def git_revision() -> str:
+    """현재 커밋 해시 (git 저장소가 아니면 unknown)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def environment_info() -> Dict[str, Any]:
+    """결과 비교에 필요한 실행 환경 정보"""
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
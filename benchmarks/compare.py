@@ -0,0 +1,100 @@
+"""두 벤치마크 결과 비교
+
+사용 예 (프로젝트 루트에서):
+    python -m benchmarks.compare benchmarks/results/old.json benchmarks/results/new.json
+
+threshold(%)보다 나빠진 지표가 있으면 종료 코드 1을 반환한다.
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Tuple
+
+# (지표 이름, 값이 클수록 좋은지 여부)
+_ENDPOINT_METRICS = [
+    ("throughput_rps", True),
+    ("p50_ms", False),
+    ("p95_ms", False),
+    ("p99_ms", False),
+]
+
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _change(old: float, new: float, higher_is_better: bool) -> float:
+    """개선이면 음수, 악화면 양수인 변화율(%)"""
+    if not old:
+        return 0.0
+    delta = (new - old) / old * 100
+    return -delta if higher_is_better else delta
+
+
+def compare(
+    old: Dict[str, Any], new: Dict[str, Any], threshold: float
+) -> Tuple[List[str], List[str]]:
+    """비교 결과 줄 목록과 악화된 지표 목록 반환"""
+    lines: List[str] = []
+    regressions: List[str] = []
+
+    old_endpoint = {r["concurrency"]: r for r in old.get("endpoint", [])}
+    for result in new.get("endpoint", []):
+        previous = old_endpoint.get(result["concurrency"])
+        if previous is None:
+            continue
+        for metric, higher_is_better in _ENDPOINT_METRICS:
+            source_old = previous if metric == "throughput_rps" else previous["latency"]
+            source_new = result if metric == "throughput_rps" else result["latency"]
+            change = _change(source_old[metric], source_new[metric], higher_is_better)
+            name = f"endpoint c={result['concurrency']} {metric}"
+            lines.append(
+                f"{name:<32} {source_old[metric]:12.2f} -> {source_new[metric]:12.2f} "
+                f"({change:+.1f}%)"
+            )
+            if change > threshold:
+                regressions.append(name)
+
+    old_micro = {r["name"]: r for r in old.get("micro", [])}
+    for result in new.get("micro", []):
+        previous = old_micro.get(result["name"])
+        if previous is None:
+            continue
+        change = _change(previous["best_us"], result["best_us"], False)
+        name = f"micro {result['name']} best_us"
+        lines.append(
+            f"{name:<32} {previous['best_us']:12.2f} -> {result['best_us']:12.2f} "
+            f"({change:+.1f}%)"
+        )
+        if change > threshold:
+            regressions.append(name)
+
+    return lines, regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="벤치마크 결과 비교")
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument(
+        "--threshold", type=float, default=10.0, help="악화로 판단할 변화율(%%)"
+    )
+    args = parser.parse_args()
+
+    old, new = _load(args.old), _load(args.new)
+    print(
+        f"{old['environment']['git_revision']} -> {new['environment']['git_revision']}"
+    )
+    lines, regressions = compare(old, new, args.threshold)
+    for line in lines:
+        print(line)
+
+    if regressions:
+        print(f"\n{args.threshold:.0f}% 이상 악화된 지표: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import asyncio
+import itertools
+import time
+from collections import Counter
+from typing import Any, Dict, List
+
+import httpx
+
+from .common import summarize_latencies
+
+
+async def run_endpoint_benchmark(
+    app: Any,
+    inputs: List[str],
+    concurrency: int,
+    total_requests: int,
+    case_style: str = "camelCase",
+    warmup_requests: int = 10,
+) -> Dict[str, Any]:
+    """/variable/process 처리량과 지연 시간 측정
+
+    앱은 ASGI 전송으로 프로세스 안에서 호출하므로 네트워크 비용 없이 FastAPI, 그래프, 직렬화 비용만 측정된다.
+    concurrency개의 작업자가 공유 카운터에서 요청을 가져가 total_requests개를 처리한다.
+    """
+    from app.services.langgraph_service import request_coalescer
+
+    payloads = itertools.cycle(inputs)
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://benchmark", timeout=None
+    ) as client:
+
+        async def send(input_text: str) -> int:
+            response = await client.post(
+                "/variable/process",
+                json={"input_text": input_text, "case_style": case_style},
+            )
+            return response.status_code
+
+        for input_text in itertools.islice(payloads, warmup_requests):
+            await send(input_text)
+
+        coalescing_before = request_coalescer.stats()
+        remaining = iter(range(total_requests))
+
+        async def worker() -> None:
+            for _ in remaining:
+                input_text = next(payloads)
+                started = time.perf_counter()
+                status = await send(input_text)
+                latencies.append(time.perf_counter() - started)
+                statuses[status] += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        coalescing_after = request_coalescer.stats()
+
+    return {
+        "concurrency": concurrency,
+        "requests": total_requests,
+        "elapsed_s": elapsed,
+        "throughput_rps": total_requests / elapsed if elapsed else 0.0,
+        "latency": summarize_latencies(latencies),
+        "status_codes": {str(code): count for code, count in sorted(statuses.items())},
+        "errors": sum(count for code, count in statuses.items() if code >= 400),
+        "coalesced": coalescing_after["coalesced"] - coalescing_before["coalesced"],
+    }
@@ -0,0 +1,150 @@
+import statistics
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List
+
+
+def _summarize(name: str, samples: List[float], iterations: int) -> Dict[str, Any]:
+    """반복 묶음별 호출당 시간(초) 목록을 마이크로초 단위 통계로 변환"""
+    return {
+        "name": name,
+        "iterations": iterations,
+        "repeat": len(samples),
+        "best_us": min(samples) * 1e6,
+        "median_us": statistics.median(samples) * 1e6,
+        "ops_per_s": 1 / min(samples) if min(samples) else 0.0,
+    }
+
+
+def bench_sync(
+    name: str, fn: Callable[[], Any], iterations: int, repeat: int
+) -> Dict[str, Any]:
+    """동기 함수 호출당 시간 측정 (repeat번 중 최솟값과 중앙값)"""
+    fn()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        samples.append((time.perf_counter() - started) / iterations)
+    return _summarize(name, samples, iterations)
+
+
+async def bench_async(
+    name: str, fn: Callable[[], Awaitable[Any]], iterations: int, repeat: int
+) -> Dict[str, Any]:
+    """비동기 함수 호출당 시간 측정 (repeat번 중 최솟값과 중앙값)"""
+    await fn()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            await fn()
+        samples.append((time.perf_counter() - started) / iterations)
+    return _summarize(name, samples, iterations)
+
+
+async def run_micro_benchmarks(iterations: int = 1000, repeat: int = 5) -> List[Dict[str, Any]]:
+    """핵심 함수별 마이크로벤치마크
+
+    graph.ainvoke는 지연 시간 0인 가짜 공급자로 실행해 LLM 대기를 뺀 그래프 자체 오버헤드만 측정한다.
+    """
+    from app.schemas.variable import CaseStyle, InputType, classify_input
+    from app.services.langgraph_service import LangGraphFactory, LangGraphService
+    from app.services.llm_client import LLMClient
+    from app.services.llm_providers import FakeLLMProvider
+    from app.utils.casing import convert_all_styles
+    from app.utils.tools import classify_input_type, smart_case_convert
+
+    LLMClient.set_provider(FakeLLMProvider(latency_ms=0, distribution="fixed"))
+
+    # 그래프 컴파일/실행은 호출당 비용이 크므로 반복 횟수를 줄임
+    graph_iterations = max(1, iterations // 20)
+    graphs = {
+        input_type: LangGraphFactory.create_graph(input_type)
+        for input_type in LangGraphFactory.GRAPH_INPUT_TYPES
+    }
+
+    def graph_call(input_text: str) -> Callable[[], Awaitable[Any]]:
+        input_type = classify_input(input_text)
+
+        async def call() -> Any:
+            state = LangGraphService._build_initial_state(
+                input_text, input_type, CaseStyle.SNAKE_CASE
+            )
+            config = {"configurable": {"thread_id": f"bench_{uuid.uuid4().hex}"}}
+            return await graphs[input_type].ainvoke(state, config=config)
+
+        return call
+
+    word_state = await graph_call("소상공인")()
+    text_state = await graph_call("고객 주문 금액과 결제 상태")()
+
+    results = [
+        bench_sync(
+            "smart_case_convert",
+            lambda: smart_case_convert.invoke(
+                {"text": "custAcctNo", "case_style": "snake_case"}
+            ),
+            iterations,
+            repeat,
+        ),
+        bench_sync(
+            "convert_all_styles_x5",
+            lambda: convert_all_styles(
+                ["custAcctNo", "parseHTTPResponse", "utf8Encoder", "taxRdct", "db"]
+            ),
+            iterations,
+            repeat,
+        ),
+        bench_sync(
+            "classify_input_type",
+            lambda: classify_input_type.invoke({"text": "고객 주문 금액과 결제 상태"}),
+            iterations,
+            repeat,
+        ),
+        bench_sync(
+            "classify_input",
+            lambda: classify_input("고객 주문 금액과 결제 상태"),
+            iterations,
+            repeat,
+        ),
+        bench_sync(
+            "create_graph",
+            lambda: LangGraphFactory.create_graph(InputType.TEXT),
+            graph_iterations,
+            repeat,
+        ),
+        await bench_async(
+            "graph_ainvoke_word", graph_call("소상공인"), graph_iterations, repeat
+        ),
+        await bench_async(
+            "graph_ainvoke_text",
+            graph_call("고객 주문 금액과 결제 상태"),
+            graph_iterations,
+            repeat,
+        ),
+        bench_sync(
+            "identifier_fast_path",
+            lambda: LangGraphService._local_state(
+                "customerAccountNo", InputType.IDENTIFIER, CaseStyle.SNAKE_CASE
+            ),
+            iterations,
+            repeat,
+        ),
+        bench_sync(
+            "format_result_word",
+            lambda: LangGraphService._format_result(word_state),
+            iterations,
+            repeat,
+        ),
+        bench_sync(
+            "format_result_text",
+            lambda: LangGraphService._format_result(text_state),
+            iterations,
+            repeat,
+        ),
+    ]
+
+    LLMClient.set_provider(None)
+    return results
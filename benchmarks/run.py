@@ -0,0 +1,140 @@
+"""요청 경로 벤치마크 실행기
+
+사용 예 (프로젝트 루트에서):
+    python -m benchmarks.run --concurrency 1,8,32 --requests 300 --latency-ms 50
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from typing import Any, Dict
+
+from .common import WORKLOADS, environment_info, project_root, setup_environment
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Variable Maker 벤치마크")
+    parser.add_argument(
+        "--concurrency", default="1,8,32", help="쉼표로 구분한 동시 요청 수 목록"
+    )
+    parser.add_argument("--requests", type=int, default=200, help="동시성 단계별 요청 수")
+    parser.add_argument("--workload", choices=sorted(WORKLOADS), default="mixed")
+    parser.add_argument("--case-style", default="camelCase")
+    parser.add_argument(
+        "--latency-ms", type=float, default=50, help="가짜 LLM 평균(중앙값) 지연 시간"
+    )
+    parser.add_argument(
+        "--latency-distribution",
+        choices=["fixed", "uniform", "exponential", "lognormal"],
+        default="lognormal",
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--with-cache", action="store_true", help="번역/약어/정규 결과 캐시를 켠 채로 측정"
+    )
+    parser.add_argument("--iterations", type=int, default=1000, help="마이크로벤치마크 반복 횟수")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--skip-endpoint", action="store_true")
+    parser.add_argument("--skip-micro", action="store_true")
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="결과 JSON 경로 (기본: benchmarks/results/bench_<시각>.json)",
+    )
+    return parser.parse_args()
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    from app.config import settings
+    from app.main import app
+    from app.services.langgraph_service import GraphRegistry
+    from app.services.llm_client import LLMClient
+    from app.services.llm_providers import FakeLLMProvider
+
+    from .endpoint import run_endpoint_benchmark
+    from .micro import run_micro_benchmarks
+
+    GraphRegistry.warm_up()
+
+    report: Dict[str, Any] = {
+        "environment": environment_info(),
+        "config": {
+            "workload": args.workload,
+            "case_style": args.case_style,
+            "latency_ms": args.latency_ms,
+            "latency_distribution": args.latency_distribution,
+            "error_rate": args.error_rate,
+            "seed": args.seed,
+            "cache_enabled": settings.CACHE_ENABLED,
+            "lookup_mode": settings.LOOKUP_MODE,
+            "word_pipeline_mode": settings.WORD_PIPELINE_MODE,
+            "request_coalescing_enabled": settings.REQUEST_COALESCING_ENABLED,
+            "llm_max_concurrency": settings.LLM_MAX_CONCURRENCY,
+        },
+        "endpoint": [],
+        "micro": [],
+    }
+
+    if not args.skip_endpoint:
+        for concurrency in (int(c) for c in args.concurrency.split(",")):
+            # 단계마다 같은 시드로 공급자를 새로 만들어 지연/오류 순서를 재현
+            LLMClient.set_provider(
+                FakeLLMProvider(
+                    latency_ms=args.latency_ms,
+                    distribution=args.latency_distribution,
+                    error_rate=args.error_rate,
+                    seed=args.seed,
+                )
+            )
+            result = await run_endpoint_benchmark(
+                app,
+                WORKLOADS[args.workload],
+                concurrency,
+                args.requests,
+                case_style=args.case_style,
+            )
+            report["endpoint"].append(result)
+            latency = result["latency"]
+            print(
+                f"[endpoint] c={concurrency:<4} {result['throughput_rps']:8.1f} req/s  "
+                f"p50={latency['p50_ms']:.1f}ms p95={latency['p95_ms']:.1f}ms "
+                f"p99={latency['p99_ms']:.1f}ms errors={result['errors']}"
+            )
+        LLMClient.set_provider(None)
+
+    if not args.skip_micro:
+        for result in await run_micro_benchmarks(args.iterations, args.repeat):
+            report["micro"].append(result)
+            print(
+                f"[micro] {result['name']:<22} best={result['best_us']:10.1f}us "
+                f"median={result['median_us']:10.1f}us"
+            )
+
+    return report
+
+
+def main() -> None:
+    args = parse_args()
+    setup_environment(cache_enabled=args.with_cache)
+
+    report = asyncio.run(run(args))
+
+    output = args.output or os.path.join(
+        project_root,
+        "benchmarks",
+        "results",
+        f"bench_{time.strftime('%Y%m%d_%H%M%S')}.json",
+    )
+    directory = os.path.dirname(output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
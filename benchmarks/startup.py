@@ -0,0 +1,165 @@
+"""콜드 스타트 프로파일러
+
+앱 모듈의 임포트 시간을 패키지별로 나눠 보여주고, 새 프로세스로 서버를 띄워
+/health와 /ready가 처음 200을 돌려주기까지의 시간을 측정한다.
+
+사용 예 (프로젝트 루트에서):
+    python -m benchmarks.startup --top 15 --runs 3
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from .common import project_root
+
+backend_dir = os.path.join(project_root, "backend")
+
+
+def _env(**overrides: str) -> Dict[str, str]:
+    env = dict(os.environ)
+    env.setdefault("LLM_PROVIDER", "fake")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [backend_dir, env.get("PYTHONPATH")]))
+    env.update(overrides)
+    return env
+
+
+def profile_imports(module: str = "app.main", top: int = 20) -> Dict[str, Any]:
+    """python -X importtime 결과를 최상위 패키지별 자체 시간과 누적 시간이 큰 모듈로 요약"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=backend_dir,
+        env=_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    by_package: Dict[str, int] = defaultdict(int)
+    modules: List[Dict[str, Any]] = []
+    total_us = 0
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue
+        depth = (len(name) - len(name.lstrip())) // 2
+        name = name.strip()
+        by_package[name.split(".")[0]] += int(self_us)
+        modules.append({"module": name, "depth": depth, "cumulative_ms": int(cumulative_us) / 1000})
+        if name == module:
+            total_us = int(cumulative_us)
+
+    packages = sorted(by_package.items(), key=lambda item: item[1], reverse=True)
+    return {
+        "module": module,
+        "total_ms": total_us / 1000,
+        "packages": [{"package": name, "self_ms": us / 1000} for name, us in packages[:top]],
+        "modules": sorted(modules, key=lambda m: m["cumulative_ms"], reverse=True)[:top],
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for(url: str, deadline: float) -> Optional[float]:
+    """url이 200을 돌려줄 때까지 폴링하고 그 시각을 반환 (시간 초과 시 None)"""
+    with httpx.Client(timeout=1.0) as client:
+        while time.perf_counter() < deadline:
+            try:
+                if client.get(url).status_code == 200:
+                    return time.perf_counter()
+            except httpx.TransportError:
+                pass
+            time.sleep(0.01)
+    return None
+
+
+def measure_startup(warmup: str = "background", timeout: float = 60.0) -> Dict[str, Any]:
+    """새 uvicorn 프로세스가 /health, /ready에 처음 200을 돌려주기까지의 시간 (초)"""
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port)],
+        cwd=backend_dir,
+        env=_env(STARTUP_WARMUP=warmup),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = started + timeout
+        health_at = _wait_for(f"{base_url}/health", deadline)
+        ready_at = _wait_for(f"{base_url}/ready", deadline)
+    finally:
+        process.terminate()
+        process.wait()
+
+    return {
+        "warmup": warmup,
+        "health_s": health_at - started if health_at else None,
+        "ready_s": ready_at - started if ready_at else None,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Variable Maker 콜드 스타트 프로파일")
+    parser.add_argument("--module", default="app.main", help="임포트 시간을 측정할 모듈")
+    parser.add_argument("--top", type=int, default=15, help="표시할 패키지/모듈 수")
+    parser.add_argument("--runs", type=int, default=3, help="서버 기동 측정 횟수 (중앙값 표시)")
+    parser.add_argument(
+        "--warmup",
+        default="background,blocking",
+        help="측정할 STARTUP_WARMUP 모드 목록 (쉼표로 구분)",
+    )
+    parser.add_argument("--output", default=None, help="결과 JSON 경로")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    imports = profile_imports(args.module, args.top)
+    print(f"[import] {imports['module']} {imports['total_ms']:.1f}ms")
+    for entry in imports["packages"]:
+        print(f"  {entry['package']:<32} self={entry['self_ms']:8.1f}ms")
+    print("[import] 누적 시간이 큰 모듈")
+    for entry in imports["modules"]:
+        indent = "  " * entry["depth"]
+        print(f"  {entry['cumulative_ms']:8.1f}ms {indent}{entry['module']}")
+
+    startup = []
+    for warmup in args.warmup.split(","):
+        runs = [measure_startup(warmup) for _ in range(args.runs)]
+        summary = {"warmup": warmup, "runs": runs}
+        for key in ("health_s", "ready_s"):
+            values = [run[key] for run in runs if run[key] is not None]
+            summary[key] = statistics.median(values) if values else None
+        startup.append(summary)
+        print(
+            f"[startup] warmup={warmup:<10} "
+            f"health={summary['health_s'] or float('nan'):.2f}s "
+            f"ready={summary['ready_s'] or float('nan'):.2f}s"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"imports": imports, "startup": startup}, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,8 +11,6 @@ st.set_page_config(page_title="Variable Maker", layout="wide")
 
 init_session_state()
 
-render_sidebar()
-
 st.title("Variable Maker")
 
 render_usage_guide()
@@ -21,3 +19,6 @@ user_input = render_input_container()
 
 if user_input:
     handle_user_input(user_input=user_input)
+
+# 입력 처리 뒤에 그려야 새 채팅과 바뀐 제목이 다시 실행하지 않아도 바로 보임
+render_sidebar()
@@ -1,18 +1,29 @@
 import streamlit as st
+
+from handlers.session_handler import can_load_older_messages, load_older_messages
 from models.chat_models import ChatSession
 
 
+@st.fragment
 def render_chat_messages():
-    """현재 세션의 채팅 메시지들을 렌더링합니다."""
+    """현재 세션의 채팅 메시지들을 렌더링합니다.
+
+    활성 세션은 최근 CHAT_MESSAGE_WINDOW개 메시지만 불러와 그리므로 렌더링 비용이 대화 길이에 비례해 늘지 않습니다.
+    "이전 메시지 더 보기"는 fragment 안에서만 다시 실행되므로 사이드바와 입력창은 다시 그리지 않습니다.
+    """
     chat_container = st.container()
     with chat_container:
-        if (
-            st.session_state.current_session_id
-            and st.session_state.current_session_id in st.session_state.chat_sessions
-        ):
-            current_session: ChatSession = st.session_state.chat_sessions[
-                st.session_state.current_session_id
-            ]
-            for message in current_session.messages:
-                with st.chat_message(message.role):
-                    st.write(message.content)
+        current_session: ChatSession = st.session_state.active_session
+        if current_session is None:
+            return
+
+        if can_load_older_messages(current_session):
+            st.button(
+                "이전 메시지 더 보기",
+                key="load_older_messages",
+                on_click=load_older_messages,
+            )
+
+        for message in current_session.messages:
+            with st.chat_message(message.role):
+                st.write(message.content)
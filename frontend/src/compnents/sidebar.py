@@ -1,39 +1,57 @@
 import streamlit as st
 
-from models.chat_models import ChatSession
-from utils.helpers import generate_chat_session_id
+from handlers.session_handler import (
+    get_session_list,
+    open_session,
+    show_more_sessions,
+    start_new_session,
+)
 
 
 def render_sidebar():
-    """사이드바 채팅 목록을 렌더링합니다."""
+    """사이드바 채팅 목록을 렌더링합니다 (최근 사용한 채팅부터 SIDEBAR_SESSION_PAGE_SIZE개씩)."""
     with st.sidebar:
         st.markdown("### 채팅 목록")
 
-        if st.button("새로운 채팅 시작하기", use_container_width=True):
-            new_session_id = generate_chat_session_id()
-            st.session_state.current_session_id = new_session_id
-            st.session_state.chat_sessions[new_session_id] = ChatSession(
-                title="새로운 채팅",
-                messages=[],
-                thread_id=f"thread_{new_session_id}",
-            )
-            st.rerun()
+        # 버튼 동작은 콜백에서 처리해 클릭 한 번에 스크립트가 한 번만 다시 실행되게 함
+        st.button(
+            "새로운 채팅 시작하기",
+            use_container_width=True,
+            on_click=start_new_session,
+        )
 
         st.divider()
 
-        if st.session_state.chat_sessions:
-            for session_id, session_data in st.session_state.chat_sessions.items():
+        try:
+            sessions = get_session_list()
+        except Exception as e:
+            st.warning(f"채팅 목록을 불러오지 못했습니다: {e}")
+            return
+
+        if sessions:
+            active = st.session_state.active_session
+            for session_data in sessions:
                 # 현재 활성 세션 표시
-                if_current = session_id == st.session_state.current_session_id
+                if_current = active is not None and (
+                    session_data.session_id == active.session_id
+                )
                 button_style = "➡ " if if_current else ""
 
-                if st.button(
+                st.button(
                     f"{button_style}{session_data.title}",
-                    key=f"chat_{session_id}",
+                    key=f"chat_{session_data.session_id}",
+                    use_container_width=True,
+                    on_click=open_session,
+                    args=(session_data,),
+                )
+
+            if st.session_state.session_list_has_more:
+                st.button(
+                    "더 보기",
+                    key="load_more_sessions",
                     use_container_width=True,
-                ):
-                    st.session_state.current_session_id = session_id
-                    st.rerun()
+                    on_click=show_more_sessions,
+                )
 
         else:
             st.markdown("_아직 채팅이 없습니다._")
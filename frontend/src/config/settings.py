@@ -3,3 +3,28 @@ import os
 BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
 
 DEFAULT_TIMEOUT = 30
+
+# 백엔드 연결/응답 대기 시간 (초). 연결은 짧게 끊어 백엔드 장애 시 화면이 오래 멈추지 않게 함
+BACKEND_CONNECT_TIMEOUT = float(os.getenv("BACKEND_CONNECT_TIMEOUT", "3"))
+BACKEND_READ_TIMEOUT = float(os.getenv("BACKEND_READ_TIMEOUT", str(DEFAULT_TIMEOUT)))
+
+# 스트리밍 응답에서 다음 이벤트를 기다리는 최대 시간 (초)
+BACKEND_STREAM_READ_TIMEOUT = float(
+    os.getenv("BACKEND_STREAM_READ_TIMEOUT", str(DEFAULT_TIMEOUT))
+)
+
+# Streamlit 서버 프로세스가 공유하는 연결 풀 크기와 백그라운드 요청 작업자 수
+BACKEND_POOL_SIZE = int(os.getenv("BACKEND_POOL_SIZE", "16"))
+BACKEND_CLIENT_WORKERS = int(os.getenv("BACKEND_CLIENT_WORKERS", "8"))
+
+# 연결 실패 시 재시도 횟수 (요청이 전송된 뒤의 실패는 재시도하지 않음)
+BACKEND_CONNECT_RETRIES = int(os.getenv("BACKEND_CONNECT_RETRIES", "2"))
+
+# 세션을 열 때 불러오는 최근 메시지 수 ("이전 메시지 더 보기"를 누를 때마다 이만큼 더 불러옴)
+CHAT_MESSAGE_WINDOW = int(os.getenv("CHAT_MESSAGE_WINDOW", "40"))
+
+# 활성 세션에서 메모리에 보관하는 최대 메시지 수 (나머지는 백엔드에만 보관)
+CHAT_MAX_LOADED_MESSAGES = int(os.getenv("CHAT_MAX_LOADED_MESSAGES", "200"))
+
+# 사이드바에 한 번에 보여주는 채팅 수 ("더 보기"를 누를 때마다 이만큼 늘어남)
+SIDEBAR_SESSION_PAGE_SIZE = int(os.getenv("SIDEBAR_SESSION_PAGE_SIZE", "20"))
@@ -1,59 +1,66 @@
 import streamlit as st
 
-from utils.helpers import generate_chat_session_id, get_chat_title
+from config.settings import CHAT_MAX_LOADED_MESSAGES
+from handlers.session_handler import ensure_active_session, mark_session_used
 from models.chat_models import ChatSession
-from utils.api_client import VariableMakerAPIClient
+from utils.api_client import get_api_client
 
 
 def handle_user_input(user_input: str):
     """사용자 입력을 처리하고 AI 응답을 생성합니다."""
-    if not st.session_state.current_session_id:
-        new_session_id = generate_chat_session_id()
-        st.session_state.current_session_id = new_session_id
-        st.session_state.chat_sessions[new_session_id] = ChatSession(
-            title=get_chat_title(user_input),
-            messages=[],
-            thread_id=f"thread_{new_session_id}",
-        )
-
-    current_session: ChatSession = st.session_state.chat_sessions[
-        st.session_state.current_session_id
-    ]
+    try:
+        current_session: ChatSession = ensure_active_session(user_input)
+    except Exception as e:
+        st.error(f"채팅 세션을 만들지 못했습니다: {e}")
+        return
 
-    if not current_session.messages:
-        current_session.title = get_chat_title(user_input)
+    current_session.add_message(
+        role="user", content=user_input, max_messages=CHAT_MAX_LOADED_MESSAGES
+    )
 
-    current_session.add_message(role="user", content=user_input)
+    with st.chat_message("user"):
+        st.write(user_input)
 
     try:
-        api_client = VariableMakerAPIClient()
-        result = api_client.process_variable_request(
-            user_input=user_input,
-            case_style=st.session_state.case_style,
-            thread_id=current_session.thread_id,
-        )
+        api_client = get_api_client()
+        response_text = None
 
-        if result:
-            if "response" in result:
-                current_session.add_message(
-                    role="assistant", content=result["response"]
-                )
-            else:
-                current_session.add_message(role="assistant", content=str(result))
+        with st.chat_message("assistant"):
+            placeholder = st.empty()
+            streamed_lines = []
+            for event in api_client.stream_variable_request(
+                user_input=user_input,
+                case_style=st.session_state.case_style,
+                thread_id=current_session.thread_id,
+            ):
+                if event["type"] == "concept":
+                    streamed_lines.append(event["line"])
+                    placeholder.write("  \n".join(streamed_lines))
+                elif event["type"] == "result":
+                    result = event.get("result", {})
+                    response_text = result.get("formatted_response", str(result))
+                    placeholder.write(response_text)
+                elif event["type"] == "error":
+                    raise Exception(event.get("error"))
 
-            if "case_style" in result:
-                st.session_state.case_style = result["case_style"]
+        if response_text:
+            current_session.add_message(
+                role="assistant",
+                content=response_text,
+                max_messages=CHAT_MAX_LOADED_MESSAGES,
+            )
         else:
             current_session.add_message(
-                role="assistant", content="응답을 받지 못했습니다."
+                role="assistant",
+                content="응답을 받지 못했습니다.",
+                max_messages=CHAT_MAX_LOADED_MESSAGES,
             )
 
     except Exception as e:
         current_session.add_message(
-            role="assistant", content=f"오류가 발생했습니다: {e}"
+            role="assistant",
+            content=f"오류가 발생했습니다: {e}",
+            max_messages=CHAT_MAX_LOADED_MESSAGES,
         )
 
-    st.session_state.chat_sessions[st.session_state.current_session_id] = (
-        current_session
-    )
-    st.rerun()
+    mark_session_used(current_session)
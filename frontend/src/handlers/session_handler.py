@@ -0,0 +1,126 @@
+from typing import Any, Dict, List
+
+import streamlit as st
+
+from config.settings import (
+    CHAT_MAX_LOADED_MESSAGES,
+    CHAT_MESSAGE_WINDOW,
+    SIDEBAR_SESSION_PAGE_SIZE,
+)
+from models.chat_models import ChatMessage, ChatSession
+from utils.api_client import get_api_client
+from utils.helpers import get_chat_title, get_user_id
+
+
+def _to_session(info: Dict[str, Any]) -> ChatSession:
+    return ChatSession(
+        session_id=info["session_id"],
+        title=info["title"],
+        thread_id=info["thread_id"],
+    )
+
+
+def _to_messages(history: Dict[str, Any]) -> List[ChatMessage]:
+    return [
+        ChatMessage(role=message["role"], content=message["content"], id=message["id"])
+        for message in history["messages"]
+    ]
+
+
+def invalidate_session_list():
+    """다음 렌더링에서 사이드바 목록을 다시 조회하게 합니다."""
+    st.session_state.session_list = None
+
+
+def get_session_list() -> List[ChatSession]:
+    """사이드바에 표시할 세션 목록을 반환합니다 (바뀌었을 때만 백엔드에서 조회)."""
+    if st.session_state.session_list is None:
+        page = get_api_client().list_sessions(
+            get_user_id(), limit=st.session_state.sidebar_session_limit
+        )
+        st.session_state.session_list = [_to_session(info) for info in page["sessions"]]
+        st.session_state.session_list_has_more = page["has_more"]
+    return st.session_state.session_list
+
+
+def show_more_sessions():
+    """사이드바 목록을 한 페이지 더 불러옵니다."""
+    st.session_state.sidebar_session_limit += SIDEBAR_SESSION_PAGE_SIZE
+    invalidate_session_list()
+
+
+def start_new_session():
+    """새 채팅을 시작합니다 (백엔드 세션은 첫 메시지를 보낼 때 생성)."""
+    st.session_state.active_session = None
+
+
+def open_session(session: ChatSession):
+    """세션을 활성화하고 최근 메시지만 불러옵니다."""
+    try:
+        history = get_api_client().get_session_messages(
+            session.session_id, limit=CHAT_MESSAGE_WINDOW
+        )
+    except Exception as e:
+        st.toast(f"채팅을 불러오지 못했습니다: {e}")
+        invalidate_session_list()
+        return
+    st.session_state.active_session = ChatSession(
+        session_id=session.session_id,
+        title=session.title,
+        thread_id=session.thread_id,
+        messages=_to_messages(history),
+        has_older=history["has_more"],
+    )
+
+
+def load_older_messages():
+    """활성 세션의 이전 메시지를 한 페이지 더 불러옵니다."""
+    session: ChatSession = st.session_state.active_session
+    if session is None or session.oldest_message_id() is None:
+        return
+    try:
+        history = get_api_client().get_session_messages(
+            session.session_id,
+            limit=CHAT_MESSAGE_WINDOW,
+            before=session.oldest_message_id(),
+        )
+    except Exception as e:
+        st.toast(f"이전 메시지를 불러오지 못했습니다: {e}")
+        return
+    session.messages[:0] = _to_messages(history)
+    session.has_older = history["has_more"]
+
+
+def can_load_older_messages(session: ChatSession) -> bool:
+    """이전 메시지를 더 불러올 수 있는지 여부 (메모리 보관 한도 안에서만)"""
+    return (
+        session.has_older
+        and session.oldest_message_id() is not None
+        and len(session.messages) < CHAT_MAX_LOADED_MESSAGES
+    )
+
+
+def ensure_active_session(user_input: str) -> ChatSession:
+    """활성 세션을 반환합니다 (없으면 첫 메시지로 제목을 정해 백엔드에 생성)."""
+    session: ChatSession = st.session_state.active_session
+    if session is None:
+        info = get_api_client().create_session(get_user_id(), get_chat_title(user_input))
+        session = _to_session(info)
+        st.session_state.active_session = session
+        invalidate_session_list()
+    return session
+
+
+def mark_session_used(session: ChatSession):
+    """방금 사용한 세션을 사이드바 목록 맨 앞으로 옮깁니다 (백엔드도 최근 사용 순으로 정렬)."""
+    sessions = st.session_state.session_list
+    if sessions is None:
+        return
+    # 목록에는 메시지 없는 사본을 넣어 활성 세션을 바꾸면 메시지가 메모리에서 해제되게 함
+    summary = ChatSession(
+        session_id=session.session_id, title=session.title, thread_id=session.thread_id
+    )
+    sessions[:] = [
+        summary,
+        *(item for item in sessions if item.session_id != session.session_id),
+    ]
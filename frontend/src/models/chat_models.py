@@ -3,21 +3,33 @@ from typing import List, Optional
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessage:
     role: str  # "user" or "assistant"
     content: str
+    id: Optional[int] = None  # 백엔드 히스토리 메시지 ID (로컬에서 추가한 메시지는 None)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatSession:
+    """백엔드 채팅 세션의 로컬 사본 (메시지는 최근 일부만 보관)"""
+
+    session_id: str
     title: str
     messages: List[ChatMessage] = field(default_factory=list)
     thread_id: Optional[str] = None
+    has_older: bool = False  # 백엔드에 더 오래된 메시지가 남아 있는지 여부
 
-    def add_message(self, role: str, content: str):
-        """메시지를 추가합니다."""
+    def add_message(self, role: str, content: str, max_messages: Optional[int] = None):
+        """메시지를 추가합니다 (max_messages를 넘으면 오래된 메시지부터 메모리에서 버립니다)."""
         self.messages.append(ChatMessage(role=role, content=content))
+        if max_messages is not None and len(self.messages) > max_messages:
+            del self.messages[: len(self.messages) - max_messages]
+            self.has_older = True
+
+    def oldest_message_id(self) -> Optional[int]:
+        """이전 페이지 조회에 쓸 가장 오래된 메시지 ID를 반환합니다."""
+        return self.messages[0].id if self.messages else None
 
 
 class CaseStyle(Enum):
@@ -1,31 +1,231 @@
+import json
 import requests
-from typing import Dict, Any, Optional
+import streamlit as st
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Iterator, List, Optional
+from urllib3.util.retry import Retry
 
-from config.settings import BACKEND_URL, DEFAULT_TIMEOUT
+from config.settings import (
+    BACKEND_CLIENT_WORKERS,
+    BACKEND_CONNECT_RETRIES,
+    BACKEND_CONNECT_TIMEOUT,
+    BACKEND_POOL_SIZE,
+    BACKEND_READ_TIMEOUT,
+    BACKEND_STREAM_READ_TIMEOUT,
+    BACKEND_URL,
+)
 
 
 class VariableMakerAPIClient:
-    """백엔드와 통신하는 클라이언트"""
+    """백엔드와 통신하는 클라이언트
 
-    def __init__(self) -> None:
-        self.base_url = BACKEND_URL
+    keep-alive 연결 풀을 가진 requests.Session을 재사용하므로 요청마다 TCP 연결을 새로 맺지 않는다.
+    Session은 스레드 간 공유해도 안전하므로 get_api_client()로 프로세스당 하나만 만들어 모든 사용자 세션이 공유한다.
+    """
+
+    def __init__(self, base_url: str = BACKEND_URL) -> None:
+        self.base_url = base_url
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=BACKEND_POOL_SIZE,
+            pool_maxsize=BACKEND_POOL_SIZE,
+            max_retries=Retry(
+                total=None,
+                connect=BACKEND_CONNECT_RETRIES,
+                read=0,
+                status=0,
+                other=0,
+                backoff_factor=0.2,
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._executor = ThreadPoolExecutor(
+            max_workers=BACKEND_CLIENT_WORKERS, thread_name_prefix="backend-client"
+        )
+
+    @staticmethod
+    def _payload(
+        user_input: str, case_style: str, thread_id: str, **extra: Any
+    ) -> Dict[str, Any]:
+        return {
+            "input_text": user_input,
+            "case_style": (
+                case_style.value if hasattr(case_style, "value") else case_style
+            ),
+            "thread_id": thread_id,
+            **extra,
+        }
 
     def process_variable_request(
-        self, user_input: str, case_style: str, thread_id: str
+        self,
+        user_input: str,
+        case_style: str,
+        thread_id: str,
+        include_all_styles: bool = False,
     ) -> Optional[Dict[str, Any]]:
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/variable/process",
-                json={
-                    "input_text": user_input,
-                    "case_style": (
-                        case_style.value if hasattr(case_style, "value") else case_style
-                    ),
-                    "thread_id": thread_id,
-                },
-                timeout=DEFAULT_TIMEOUT,
+                json=self._payload(
+                    user_input,
+                    case_style,
+                    thread_id,
+                    include_all_styles=include_all_styles,
+                ),
+                timeout=(BACKEND_CONNECT_TIMEOUT, BACKEND_READ_TIMEOUT),
+            )
+            response.raise_for_status()
+            return response.json()
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"백엔드 통신 오류: {e}")
+
+    def submit_variable_request(
+        self,
+        user_input: str,
+        case_style: str,
+        thread_id: str,
+        include_all_styles: bool = False,
+    ) -> "Future[Optional[Dict[str, Any]]]":
+        """요청을 백그라운드 스레드에서 보내고 Future를 반환합니다 (스크립트 스레드를 막지 않음)."""
+        return self._executor.submit(
+            self.process_variable_request,
+            user_input,
+            case_style,
+            thread_id,
+            include_all_styles,
+        )
+
+    def stream_variable_request(
+        self, user_input: str, case_style: str, thread_id: str
+    ) -> Iterator[Dict[str, Any]]:
+        """스트리밍 엔드포인트의 NDJSON 이벤트를 도착하는 대로 반환합니다."""
+        try:
+            with self.session.post(
+                f"{self.base_url}/variable/process/stream",
+                json=self._payload(user_input, case_style, thread_id),
+                timeout=(BACKEND_CONNECT_TIMEOUT, BACKEND_STREAM_READ_TIMEOUT),
+                stream=True,
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines(decode_unicode=True):
+                    if line:
+                        yield json.loads(line)
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"백엔드 통신 오류: {e}")
+
+    def _request(self, method: str, path: str, **kwargs: Any) -> Dict[str, Any]:
+        try:
+            response = self.session.request(
+                method,
+                f"{self.base_url}{path}",
+                timeout=(BACKEND_CONNECT_TIMEOUT, BACKEND_READ_TIMEOUT),
+                **kwargs,
             )
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             raise Exception(f"백엔드 통신 오류: {e}")
+
+    def create_session(self, owner_id: str, title: str) -> Dict[str, Any]:
+        """채팅 세션을 생성합니다."""
+        return self._request(
+            "POST", "/sessions", json={"owner_id": owner_id, "title": title}
+        )
+
+    def list_sessions(
+        self, owner_id: str, limit: int, offset: int = 0
+    ) -> Dict[str, Any]:
+        """최근 사용한 채팅 세션부터 목록을 조회합니다."""
+        return self._request(
+            "GET",
+            "/sessions",
+            params={"owner_id": owner_id, "limit": limit, "offset": offset},
+        )
+
+    def get_session_messages(
+        self, session_id: str, limit: int, before: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """채팅 세션의 최근 메시지를 조회합니다 (before보다 오래된 메시지)."""
+        params = {"limit": limit}
+        if before is not None:
+            params["before"] = before
+        return self._request(
+            "GET", f"/sessions/{session_id}/messages", params=params
+        )["history"]
+
+    def submit_process_job(
+        self,
+        user_input: str,
+        case_style: str,
+        thread_id: Optional[str] = None,
+        priority: str = "interactive",
+    ) -> Dict[str, Any]:
+        """변수명 생성 작업을 제출하고 작업 정보를 바로 반환합니다 (처리는 백엔드 작업자가 수행)."""
+        return self._request(
+            "POST",
+            "/jobs/process",
+            json=self._payload(user_input, case_style, thread_id, priority=priority),
+        )
+
+    def submit_batch_job(
+        self,
+        inputs: List[str],
+        case_style: str,
+        include_all_styles: bool = False,
+        priority: str = "bulk",
+    ) -> Dict[str, Any]:
+        """일괄 변수명 생성 작업을 제출하고 작업 정보를 바로 반환합니다."""
+        return self._request(
+            "POST",
+            "/jobs/batch",
+            json={
+                "inputs": inputs,
+                "case_style": (
+                    case_style.value if hasattr(case_style, "value") else case_style
+                ),
+                "include_all_styles": include_all_styles,
+                "priority": priority,
+            },
+        )
+
+    def get_job(self, job_id: str) -> Dict[str, Any]:
+        """작업 상태와 진행 상황을 조회합니다."""
+        return self._request("GET", f"/jobs/{job_id}")
+
+    def get_job_result(self, job_id: str) -> Dict[str, Any]:
+        """완료된 작업의 결과를 조회합니다."""
+        return self._request("GET", f"/jobs/{job_id}/result")
+
+    def cancel_job(self, job_id: str) -> Dict[str, Any]:
+        """작업을 취소합니다."""
+        return self._request("POST", f"/jobs/{job_id}/cancel")
+
+    def stream_job_events(self, job_id: str) -> Iterator[Dict[str, Any]]:
+        """작업 진행 이벤트를 받아 반환합니다 (마지막 이벤트는 result).
+
+        이벤트 사이 간격은 진행 상황이 바뀔 때까지이므로 스트리밍 읽기 타임아웃을 적용합니다.
+        """
+        try:
+            with self.session.get(
+                f"{self.base_url}/jobs/{job_id}/events",
+                timeout=(BACKEND_CONNECT_TIMEOUT, BACKEND_STREAM_READ_TIMEOUT),
+                stream=True,
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines(decode_unicode=True):
+                    if line:
+                        yield json.loads(line)
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"백엔드 통신 오류: {e}")
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+        self.session.close()
+
+
+@st.cache_resource
+def get_api_client() -> VariableMakerAPIClient:
+    """Streamlit 서버 프로세스당 하나의 백엔드 클라이언트를 반환합니다."""
+    return VariableMakerAPIClient()
@@ -1,7 +1,7 @@
-import time
 import uuid
 import streamlit as st
 
+from config.settings import SIDEBAR_SESSION_PAGE_SIZE
 from models.chat_models import CaseStyle
 
 
@@ -12,25 +12,24 @@ def get_chat_title(first_message: str, max_length: int = 30) -> str:
     return first_message[:max_length] + "..."
 
 
-def _get_user_session_id() -> str:
-    """사용자별 고유 세션 ID를 반환합니다."""
-    if "user_session_id" not in st.session_state:
-        st.session_state.user_session_id = str(uuid.uuid4())
-    return st.session_state.user_session_id
-
-
-def generate_chat_session_id() -> str:
-    """채팅 세션을 위한 고유 ID를 생성합니다."""
-    user_id = _get_user_session_id()
-    timestamp = int(time.time())
-    chat_uuid = str(uuid.uuid4())[:8]  # 짧은 UUID 사용
-    return f"{user_id[:8]}_{timestamp}_{chat_uuid}"
+def get_user_id() -> str:
+    """사용자별 고유 ID를 반환합니다 (새로고침해도 유지되도록 URL 쿼리에 보관)."""
+    if "user_id" not in st.session_state:
+        user_id = st.query_params.get("user") or uuid.uuid4().hex
+        st.query_params["user"] = user_id
+        st.session_state.user_id = user_id
+    return st.session_state.user_id
 
 
 def init_session_state():
-    """Streamlit 세션 상태를 초기화합니다."""
+    """Streamlit 세션 상태를 초기화합니다.
+
+    채팅 세션과 메시지는 백엔드에 저장하고, 여기에는 사이드바 목록 한 페이지와 활성 세션의 최근 메시지만 둡니다.
+    """
     if "app" not in st.session_state:
         st.session_state.app = True
-        st.session_state.chat_sessions = {}  # {session_id: ChatSession}
-        st.session_state.current_session_id = None
+        st.session_state.session_list = None  # 사이드바 목록 (None이면 다시 조회)
+        st.session_state.session_list_has_more = False
+        st.session_state.active_session = None  # ChatSession
         st.session_state.case_style = CaseStyle.CAMEL_CASE
+        st.session_state.sidebar_session_limit = SIDEBAR_SESSION_PAGE_SIZE
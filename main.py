@@ -1,3 +1,4 @@
+import argparse
 import sys
 import os
 import threading
@@ -27,8 +28,50 @@ def start_frontend():
     stcli.main()
 
 
+def serve_backend(args: argparse.Namespace):
+    """운영 모드 Backend 서버 시작 (다중 작업자, 자동 재시작 없음, Frontend는 별도 실행)"""
+    from app.server import serve
+
+    serve(host=args.host, port=args.port, workers=args.workers)
+
+
+def bulk_process(args: argparse.Namespace) -> int:
+    """CSV/JSONL 용어 목록 일괄 변수명 생성 (서버 없이 실행)"""
+    from app.cli import run_bulk
+
+    return run_bulk(args)
+
+
+def parse_args() -> argparse.Namespace:
+    from app.cli import add_bulk_arguments
+    from app.config.settings import SERVER_HOST, SERVER_PORT, SERVER_WORKERS
+
+    parser = argparse.ArgumentParser(description="Variable Maker")
+    subparsers = parser.add_subparsers(dest="command")
+
+    serve_parser = subparsers.add_parser("serve", help="운영 모드로 Backend 서버 실행")
+    serve_parser.add_argument("--host", default=SERVER_HOST)
+    serve_parser.add_argument("--port", type=int, default=SERVER_PORT)
+    serve_parser.add_argument("--workers", type=int, default=SERVER_WORKERS)
+
+    bulk_parser = subparsers.add_parser(
+        "bulk", help="CSV/JSONL 용어 목록의 모든 케이스 스타일 변수명 생성"
+    )
+    add_bulk_arguments(bulk_parser)
+
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    # Backend를 별도 스레드에서 시작
+    args = parse_args()
+
+    if args.command == "serve":
+        serve_backend(args)
+        sys.exit(0)
+    if args.command == "bulk":
+        sys.exit(bulk_process(args))
+
+    # 개발 모드: Backend를 별도 스레드에서 시작
     backend_thread = threading.Thread(target=start_backend, daemon=True)
     backend_thread.start()
 